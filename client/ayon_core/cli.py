@@ -152,6 +152,61 @@ def contextselection(
     )
 
 
+@main_cli.command()
+@click.argument("project_name")
+@click.option("--template", "template_name", required=True,
+              help="Name of delivery template from project anatomy")
+@click.option("--version-id", "version_ids", multiple=True,
+              help="Deliver representations of version")
+@click.option("--representation-id", "representation_ids", multiple=True,
+              help="Deliver representation")
+@click.option("--representation-name", "representation_names",
+              multiple=True, help="Deliver only representations with name")
+@click.option("--root", "location_path", default=None,
+              help="Root path replacing roots of delivery template")
+@click.option("--renumber-frame-start", "new_frame_start", type=int,
+              default=None, help="Renumber frames to start with frame")
+@click.option("--workers", "max_workers", type=int, default=None,
+              help="Number of parallel file transfers")
+@click.option("--manifest", "manifest_path", default=None,
+              help="Path to json or csv manifest of delivered files")
+@click.option("--checksum", "checksum_algorithm", default="sha256",
+              help="Checksum algorithm of delivered files ('none' to skip)")
+def deliver(
+    project_name,
+    template_name,
+    version_ids,
+    representation_ids,
+    representation_names,
+    location_path,
+    new_frame_start,
+    max_workers,
+    manifest_path,
+    checksum_algorithm
+):
+    """Deliver published representations without UI.
+
+    Files are delivered using delivery template of project anatomy. Result
+    of each file can be stored to manifest which allows to safely rerun
+    the delivery.
+    """
+    if checksum_algorithm.lower() == "none":
+        checksum_algorithm = None
+
+    Commands.deliver(
+        project_name,
+        template_name,
+        version_ids=list(version_ids),
+        representation_ids=list(representation_ids),
+        representation_names=list(representation_names),
+        location_path=location_path,
+        new_frame_start=new_frame_start,
+        max_workers=max_workers,
+        manifest_path=manifest_path,
+        checksum_algorithm=checksum_algorithm
+    )
+
+
 @main_cli.command(
     context_settings=dict(
         ignore_unknown_options=True,
@@ -66,6 +66,7 @@ class Commands:
             install_ayon_plugins,
             get_global_context,
         )
+        from ayon_core.pipeline.publish import publish_plugins_discover
         from ayon_core.tools.utils.host_tools import show_publish
         from ayon_core.tools.utils.lib import qt_app_context
 
@@ -113,7 +114,7 @@ class Commands:
 
         log.info("Running publish ...")
 
-        plugins = pyblish.api.discover()
+        plugins = publish_plugins_discover().plugins
         print("Using plugins:")
         for plugin in plugins:
             print(plugin)
@@ -126,7 +127,7 @@ class Commands:
             error_format = ("Failed {plugin.__name__}: "
                             "{error} -- {error.traceback}")
 
-            for result in pyblish.util.publish_iter():
+            for result in pyblish.util.publish_iter(plugins=plugins):
                 if result["error"]:
                     log.error(error_format.format(**result))
                     # uninstall()
@@ -171,3 +172,69 @@ class Commands:
         from ayon_core.tools.context_dialog import main
 
         main(output_path, project_name, asset_name, strict)
+
+    @staticmethod
+    def deliver(
+        project_name,
+        template_name,
+        version_ids=None,
+        representation_ids=None,
+        representation_names=None,
+        location_path=None,
+        new_frame_start=None,
+        max_workers=None,
+        manifest_path=None,
+        checksum_algorithm=None
+    ):
+        """Deliver published representations using delivery template.
+
+        Representations are filtered by version ids, representation ids and
+        representation names. Process exits with code 1 if any file
+        failed to be delivered.
+        """
+
+        from ayon_core.lib import Logger
+        from ayon_core.client import get_representations
+        from ayon_core.pipeline import Anatomy
+        from ayon_core.pipeline.delivery import RepresentationsDelivery
+
+        log = Logger.get_logger("CLI-deliver")
+
+        if not version_ids and not representation_ids:
+            log.error(
+                "Version ids or representation ids must be specified."
+            )
+            sys.exit(1)
+
+        repre_docs = list(get_representations(
+            project_name,
+            representation_ids=representation_ids or None,
+            representation_names=representation_names or None,
+            version_ids=version_ids or None,
+        ))
+        if not repre_docs:
+            log.error("No representations found to deliver.")
+            sys.exit(1)
+
+        delivery = RepresentationsDelivery(
+            Anatomy(project_name),
+            template_name,
+            location_path=location_path,
+            renumber_frame=new_frame_start is not None,
+            new_frame_start=new_frame_start or 0,
+            max_workers=max_workers,
+            checksum_algorithm=checksum_algorithm,
+            manifest_path=manifest_path,
+            log=log
+        )
+        delivery.add_representations(repre_docs)
+        report_items = delivery.process()
+        if not report_items:
+            log.info("Delivery finished successfully.")
+            return
+
+        for title, messages in report_items.items():
+            log.error(title)
+            for message in messages:
+                log.error("- {}".format(message.replace("<br>", " ")))
+        sys.exit(1)
@@ -956,6 +956,29 @@ def convert_create_hero_version_to_v4(hero_version, project_name, con):
     return converted_version
 
 
+def _get_file_checksums(file_items):
+    """Content checksums of representation files mapped by file path.
+
+    Checksums are not part of server file model, which has only one hash
+    used to find files, so they're stored in representation data.
+
+    Args:
+        file_items (list[dict[str, Any]]): Representation files.
+
+    Returns:
+        dict[str, dict[str, str]]: Checksum and its algorithm by file path.
+    """
+
+    return {
+        file_item["path"]: {
+            "checksum": file_item["checksum"],
+            "algorithm": file_item["checksum_algorithm"],
+        }
+        for file_item in file_items
+        if file_item.get("checksum")
+    }
+
+
 def convert_create_representation_to_v4(representation, con):
     representation_attributes = con.get_attributes_for_type("representation")
 
@@ -985,6 +1008,7 @@ def convert_create_representation_to_v4(representation, con):
         new_files.append(new_file_item)
 
     converted_representation["files"] = new_files
+    file_checksums = _get_file_checksums(representation["files"])
 
     context = representation["context"]
     if "folder" not in context:
@@ -1001,6 +1025,8 @@ def convert_create_representation_to_v4(representation, con):
     data = {
         "context": context,
     }
+    if file_checksums:
+        data["fileChecksums"] = file_checksums
 
     representation_data = representation["data"]
     representation_data["template"] = (
@@ -1330,6 +1356,10 @@ def convert_update_representation_to_v4(
         if isinstance(new_files, dict):
             new_files = list(new_files.values())
 
+        file_checksums = _get_file_checksums(new_files)
+        if file_checksums:
+            new_data["fileChecksums"] = file_checksums
+
         for item in new_files:
             for key in tuple(item.keys()):
                 if key not in ("hash", "path", "size"):
@@ -404,7 +404,22 @@ def prepare_workfile_info_update_data(old_doc, new_doc, replace=True):
 
 
 class FailedOperations(Exception):
-    pass
+    """Operations commit failed on server.
+
+    Args:
+        message (str): Error message.
+        operation_ids (Optional[List[str]]): Ids of operations which
+            were not committed because of the failure.
+        committed_operation_ids (Optional[List[str]]): Ids of operations
+            which were committed before the failure happened.
+    """
+
+    def __init__(
+        self, message, operation_ids=None, committed_operation_ids=None
+    ):
+        super(FailedOperations, self).__init__(message)
+        self.operation_ids = list(operation_ids or [])
+        self.committed_operation_ids = list(committed_operation_ids or [])
 
 
 def entity_data_json_default(value):
@@ -495,6 +510,9 @@ class ServerCreateOperation(CreateOperation):
         super(ServerCreateOperation, self).__init__(
             project_name, entity_type, new_data
         )
+        # Data were validated above, validation on commit is needed only
+        #   if data are changed
+        self._body_validated = True
 
         if "id" not in self._data:
             self._data["id"] = create_entity_id()
@@ -520,6 +538,14 @@ class ServerCreateOperation(CreateOperation):
     def entity_id(self):
         return self._data["id"]
 
+    @property
+    def body_validated(self):
+        return self._body_validated
+
+    def set_value(self, key, value):
+        self._body_validated = False
+        super(ServerCreateOperation, self).set_value(key, value)
+
     def to_server_operation(self):
         return {
             "id": self.id,
@@ -613,6 +639,10 @@ class ServerUpdateOperation(UpdateOperation):
     def session(self):
         return self._session
 
+    @property
+    def body_validated(self):
+        return True
+
     def to_server_operation(self):
         if not self._update_data:
             return None
@@ -666,6 +696,10 @@ class ServerDeleteOperation(DeleteOperation):
     def session(self):
         return self._session
 
+    @property
+    def body_validated(self):
+        return True
+
     def to_server_operation(self):
         return {
             "id": self.id,
@@ -695,7 +729,14 @@ class OperationsSession(BaseOperationsSession):
         return copy.deepcopy(self._project_cache[project_name])
 
     def commit(self):
-        """Commit session operations."""
+        """Commit session operations.
+
+        Operations are sent in one request per project.
+
+        Raises:
+            FailedOperations: When server failed to process operations. The
+                exception contains ids of operations that were not committed.
+        """
 
         operations, self._operations = self._operations, []
         if not operations:
@@ -705,13 +746,19 @@ class OperationsSession(BaseOperationsSession):
         for operation in operations:
             operations_by_project[operation.project_name].append(operation)
 
-        body_by_id = {}
-        results = []
-        for project_name, operations in operations_by_project.items():
+        bodies_by_project = []
+        for project_name, project_operations in (
+            operations_by_project.items()
+        ):
             operations_body = []
-            for operation in operations:
+            for operation in project_operations:
                 body = operation.to_server_operation()
-                if body is not None:
+                if body is None:
+                    continue
+
+                # Bodies are validated on operation creation, validate
+                #   only bodies that were changed since then
+                if not getattr(operation, "body_validated", False):
                     try:
                         json.dumps(body)
                     except:
@@ -720,37 +767,42 @@ class OperationsSession(BaseOperationsSession):
                                 body, indent=4, default=failed_json_default
                             )
                         ))
-
-                    body_by_id[operation.id] = body
-                    operations_body.append(body)
+                operations_body.append(body)
 
             if operations_body:
-                result = self._con.post(
-                    "projects/{}/operations".format(project_name),
-                    operations=operations_body,
-                    canFail=False
-                )
-                results.append(result.data)
-
-        for result in results:
+                bodies_by_project.append((project_name, operations_body))
+
+        committed_ids = []
+        for idx, item in enumerate(bodies_by_project):
+            project_name, operations_body = item
+            result = self._con.post(
+                "projects/{}/operations".format(project_name),
+                operations=operations_body,
+                canFail=False
+            ).data
             if result.get("success"):
+                committed_ids.extend(body["id"] for body in operations_body)
                 continue
 
-            if "operations" not in result:
-                raise FailedOperations(
-                    "Operation failed. Content: {}".format(str(result))
-                )
-
-            for op_result in result["operations"]:
+            not_committed_ids = [
+                body["id"]
+                for _, project_bodies in bodies_by_project[idx:]
+                for body in project_bodies
+            ]
+            message = "Operation failed. Content: {}".format(str(result))
+            body_by_id = {body["id"]: body for body in operations_body}
+            for op_result in result.get("operations") or []:
                 if not op_result["success"]:
                     operation_id = op_result["id"]
-                    raise FailedOperations((
+                    message = (
                         "Operation \"{}\" failed with data:\n{}\nError: {}."
                     ).format(
                         operation_id,
                         json.dumps(body_by_id[operation_id], indent=4),
                         op_result.get("error", "unknown"),
-                    ))
+                    )
+                    break
+            raise FailedOperations(message, not_committed_ids, committed_ids)
 
     def create_entity(self, project_name, entity_type, data, nested_id=None):
         """Fast access to 'ServerCreateOperation'.
@@ -0,0 +1,418 @@
+# -*- coding: utf-8 -*-
+"""Cache of converted textures shared between publishes.
+
+Converted textures (e.g. '.tx' or '.rstexbin') are stored under a key
+created from normalized source path, checksum of source file content and
+texture hash which contains all conversion arguments. Next publish of
+unchanged texture with the same conversion arguments can reuse the converted
+file instead of running the conversion again.
+
+Cache root contains 'index.json' with information about cached files and
+directory with cached files. Least recently used files are removed when
+size of cache is bigger than maximum size.
+"""
+import os
+import json
+import time
+import errno
+import shutil
+import hashlib
+import logging
+import platform
+import contextlib
+
+from ayon_core.lib import create_hard_link
+from ayon_core.lib.local_settings import get_ayon_appdirs
+from ayon_core.lib.file_transaction import get_file_checksum
+
+
+class _IndexLock(object):
+    """Simple lock file based lock of cache index.
+
+    Lock can be used by multiple processes and machines when cache is
+    in shared location.
+    """
+
+    timeout = 30
+    stale_time = 120
+
+    def __init__(self, path):
+        self._path = path
+
+    def __enter__(self):
+        start = time.time()
+        while True:
+            try:
+                fd = os.open(
+                    self._path, os.O_CREAT | os.O_EXCL | os.O_WRONLY
+                )
+                os.close(fd)
+                return self
+
+            except OSError as exc:
+                if exc.errno != errno.EEXIST:
+                    raise
+
+            # Remove lock left by crashed process
+            try:
+                if time.time() - os.path.getmtime(self._path) > (
+                    self.stale_time
+                ):
+                    os.remove(self._path)
+                    continue
+            except OSError:
+                continue
+
+            if time.time() - start > self.timeout:
+                raise RuntimeError(
+                    "Timed out waiting for texture cache lock: {}".format(
+                        self._path
+                    )
+                )
+            time.sleep(0.1)
+
+    def __exit__(self, exc_type, exc_value, tb):
+        try:
+            os.remove(self._path)
+        except OSError:
+            pass
+
+
+class TextureCacheKey(object):
+    """Identifier of converted texture in cache.
+
+    Texture hash contains only file name, modification time and size of
+    the source file so it is not enough to identify the source. Different
+    files with the same name can have the same size and modification time
+    e.g. after sync from other machine.
+
+    Args:
+        source (str): Path to source texture.
+        texture_hash (str): Texture hash from 'source_hash' which does
+            contain conversion arguments.
+    """
+
+    checksum_algorithm = "sha256"
+
+    def __init__(self, source, texture_hash):
+        self.source = os.path.normcase(
+            os.path.normpath(os.path.abspath(source))
+        ).replace("\\", "/")
+        self.texture_hash = texture_hash
+        self.source_checksum = get_file_checksum(
+            source, self.checksum_algorithm
+        )
+        self.key = hashlib.sha1("|".join((
+            self.source, self.source_checksum, self.texture_hash
+        )).encode("utf-8")).hexdigest()
+
+    def get_entry_data(self):
+        """Data stored to cache index to validate the key on restore.
+
+        Returns:
+            dict[str, str]: Source path, checksum and texture hash.
+        """
+        return {
+            "source": self.source,
+            "source_checksum": self.source_checksum,
+            "texture_hash": self.texture_hash,
+        }
+
+    def matches(self, entry):
+        """Cache index entry was created for this key.
+
+        Args:
+            entry (dict[str, Any]): Cache index entry.
+
+        Returns:
+            bool: Entry belongs to the same source file and arguments.
+        """
+        return all(
+            entry.get(key) == value
+            for key, value in self.get_entry_data().items()
+        )
+
+
+class TextureCache(object):
+    """Content addressed cache of converted textures in a directory.
+
+    Args:
+        root (str): Cache root directory.
+        max_size (Optional[int]): Maximum size of cache in bytes. Cache
+            size is not limited if not passed.
+        log (Optional[logging.Logger]): Logger.
+    """
+
+    index_filename = "index.json"
+    lock_filename = "index.lock"
+    files_dirname = "files"
+
+    def __init__(self, root, max_size=None, log=None):
+        if log is None:
+            log = logging.getLogger(self.__class__.__name__)
+        self.root = root
+        self.max_size = max_size
+        self.log = log
+        self._index_path = os.path.join(root, self.index_filename)
+        self._lock_path = os.path.join(root, self.lock_filename)
+
+    def _lock(self):
+        if not os.path.exists(self.root):
+            os.makedirs(self.root)
+        return _IndexLock(self._lock_path)
+
+    def _read_index(self):
+        if not os.path.exists(self._index_path):
+            return {}
+        try:
+            with open(self._index_path, "r") as stream:
+                return json.load(stream)
+        except ValueError:
+            self.log.warning(
+                "Texture cache index is corrupted: {}".format(
+                    self._index_path
+                )
+            )
+        return {}
+
+    def _write_index(self, index):
+        tmp_path = "{}.{}.tmp".format(self._index_path, os.getpid())
+        with open(tmp_path, "w") as stream:
+            json.dump(index, stream)
+        os.replace(tmp_path, self._index_path)
+
+    def _get_entry_path(self, key, entry):
+        return os.path.join(
+            self.root, self.files_dirname, key[:2], key, entry["filename"]
+        )
+
+    def restore(self, cache_key, destination):
+        """Create file from cache at destination if it is cached.
+
+        Args:
+            cache_key (TextureCacheKey): Key of converted texture.
+            destination (str): Path where cached file should be created.
+
+        Returns:
+            bool: File was created from cache.
+        """
+        key = cache_key.key
+        if not os.path.exists(self._index_path):
+            return False
+
+        with self._lock():
+            index = self._read_index()
+            entry = index.get(key)
+            if entry is None:
+                return False
+
+            src_path = self._get_entry_path(key, entry)
+            if (
+                not cache_key.matches(entry)
+                or not os.path.exists(src_path)
+                or os.path.getsize(src_path) != entry["size"]
+            ):
+                index.pop(key)
+                self._write_index(index)
+                return False
+
+        # Transfer the file out of lock as copy of big file can take time
+        try:
+            _transfer_file(src_path, destination)
+        except (IOError, OSError):
+            # File was probably removed by other process in the meantime
+            if os.path.exists(src_path):
+                raise
+            return False
+
+        with self._lock():
+            index = self._read_index()
+            entry = index.get(key)
+            if entry is not None:
+                entry["last_used"] = time.time()
+                self._write_index(index)
+        return True
+
+    def store(self, cache_key, filepath):
+        """Store converted file to cache.
+
+        Args:
+            cache_key (TextureCacheKey): Key of converted texture.
+            filepath (str): Path to converted file.
+        """
+        key = cache_key.key
+        entry = cache_key.get_entry_data()
+        entry.update({
+            "filename": os.path.basename(filepath),
+            "size": os.path.getsize(filepath),
+            "last_used": time.time(),
+        })
+        dst_path = self._get_entry_path(key, entry)
+        dst_dir = os.path.dirname(dst_path)
+        # Copy file out of lock to a temporary path, the file is moved to
+        #   final path when index is locked
+        tmp_path = "{}.{}.tmp".format(dst_path, os.getpid())
+        if not os.path.exists(dst_dir):
+            os.makedirs(dst_dir)
+        _transfer_file(filepath, tmp_path)
+
+        with self._lock():
+            index = self._read_index()
+            os.replace(tmp_path, dst_path)
+            index[key] = entry
+            self._evict(index, key)
+            self._write_index(index)
+
+    def _evict(self, index, keep_key):
+        """Remove least recently used files to fit maximum size."""
+        if not self.max_size:
+            return
+
+        size = sum(entry["size"] for entry in index.values())
+        if size <= self.max_size:
+            return
+
+        for key, entry in sorted(
+            index.items(), key=lambda item: item[1]["last_used"]
+        ):
+            if size <= self.max_size:
+                break
+            if key == keep_key:
+                continue
+            index.pop(key)
+            size -= entry["size"]
+            entry_dir = os.path.dirname(self._get_entry_path(key, entry))
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            self.log.debug("Removed texture from cache: {}".format(key))
+
+
+class TextureCaches(object):
+    """Local texture cache with optional shared cache.
+
+    Cached file is looked up in local cache first, then in shared cache.
+    Files restored from shared cache and newly converted files are stored
+    to both caches.
+
+    Args:
+        caches (list[TextureCache]): Caches in order of lookup.
+        log (Optional[logging.Logger]): Logger.
+    """
+
+    def __init__(self, caches, log=None):
+        if log is None:
+            log = logging.getLogger(self.__class__.__name__)
+        self.caches = caches
+        self.log = log
+
+    def get_key(self, source, texture_hash):
+        """Cache key of source texture converted with texture hash arguments.
+
+        Args:
+            source (str): Path to source texture.
+            texture_hash (str): Texture hash with conversion arguments.
+
+        Returns:
+            Union[TextureCacheKey, None]: Cache key or None if source file
+                could not be read.
+        """
+        try:
+            return TextureCacheKey(source, texture_hash)
+        except (IOError, OSError):
+            self.log.warning(
+                "Failed to calculate checksum of texture: {}".format(source),
+                exc_info=True
+            )
+        return None
+
+    def restore(self, cache_key, destination):
+        """Create file from cache at destination if it is cached.
+
+        Args:
+            cache_key (TextureCacheKey): Key of converted texture.
+            destination (str): Path where cached file should be created.
+
+        Returns:
+            bool: File was created from cache.
+        """
+        for idx, cache in enumerate(self.caches):
+            with self._handle_errors(cache):
+                if not cache.restore(cache_key, destination):
+                    continue
+
+                for other_cache in self.caches[:idx]:
+                    with self._handle_errors(other_cache):
+                        other_cache.store(cache_key, destination)
+                return True
+        return False
+
+    def store(self, cache_key, filepath):
+        """Store converted file to all caches.
+
+        Args:
+            cache_key (TextureCacheKey): Key of converted texture.
+            filepath (str): Path to converted file.
+        """
+        for cache in self.caches:
+            with self._handle_errors(cache):
+                cache.store(cache_key, filepath)
+
+    @contextlib.contextmanager
+    def _handle_errors(self, cache):
+        # Cache must not break the publishing, conversion is used instead
+        try:
+            yield
+        except Exception:
+            self.log.warning(
+                "Texture cache '{}' failed.".format(cache.root),
+                exc_info=True
+            )
+
+
+def _transfer_file(src_path, dst_path):
+    """Hardlink file or copy it if hardlink can't be created."""
+    if os.path.exists(dst_path):
+        os.remove(dst_path)
+    try:
+        create_hard_link(src_path, dst_path)
+    except (OSError, AttributeError):
+        shutil.copyfile(src_path, dst_path)
+
+
+def get_texture_caches(project_settings, log=None):
+    """Texture caches based on project settings.
+
+    Args:
+        project_settings (dict[str, Any]): Project settings.
+        log (Optional[logging.Logger]): Logger.
+
+    Returns:
+        Union[TextureCaches, None]: Texture caches or None if cache is
+            disabled.
+    """
+    cache_settings = (
+        project_settings["maya"]["publish"]
+        .get("ExtractLook", {})
+        .get("texture_cache")
+    ) or {}
+    if not cache_settings.get("enabled"):
+        return None
+
+    max_size = None
+    max_size_gb = cache_settings.get("max_size_gb")
+    if max_size_gb:
+        max_size = int(max_size_gb * (1024 ** 3))
+
+    local_root = cache_settings.get("local_root")
+    if local_root:
+        local_root = local_root.get(platform.system().lower())
+    if not local_root:
+        local_root = get_ayon_appdirs("texture_cache")
+
+    caches = [TextureCache(local_root, max_size, log)]
+    shared_root = cache_settings.get("shared_root")
+    if shared_root:
+        shared_root = shared_root.get(platform.system().lower())
+    if shared_root:
+        # Shared cache is not limited by size from one machine
+        caches.append(TextureCache(shared_root, None, log))
+    return TextureCaches(caches, log)
@@ -8,6 +8,7 @@ import json
 import logging
 import os
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 import six
 import attr
 
@@ -25,6 +26,7 @@ from ayon_core.lib import (
 
 from ayon_core.pipeline import publish, KnownPublishError
 from ayon_core.hosts.maya.api import lib
+from ayon_core.hosts.maya.api.texture_cache import get_texture_caches
 
 # Modes for transfer
 COPY = 1
@@ -103,6 +105,57 @@ class TextureProcessor:
         if log is None:
             log = logging.getLogger(self.__class__.__name__)
         self.log = log
+        # Cache of converted textures ('TextureCaches') set by extractor
+        self.texture_cache = None
+
+    def get_cache_key(self, source, texture_hash):
+        """Key of converted texture in cache.
+
+        Args:
+            source (str): Path to source file.
+            texture_hash (str): Texture hash with conversion arguments.
+
+        Returns:
+            Union[TextureCacheKey, None]: Cache key or None if cache is
+                not used.
+        """
+        if self.texture_cache is None:
+            return None
+        return self.texture_cache.get_key(source, texture_hash)
+
+    def restore_from_cache(self, cache_key, destination):
+        """Create converted texture from cache if is available.
+
+        Args:
+            cache_key (Union[TextureCacheKey, None]): Key of converted
+                texture from 'get_cache_key'.
+            destination (str): Path where converted texture should be.
+
+        Returns:
+            bool: Converted texture was created from cache.
+        """
+        if cache_key is None:
+            return False
+        dirpath = os.path.dirname(destination)
+        if not os.path.exists(dirpath):
+            os.makedirs(dirpath)
+        if not self.texture_cache.restore(cache_key, destination):
+            return False
+        self.log.debug("Converted texture restored from cache: {}".format(
+            destination
+        ))
+        return True
+
+    def store_to_cache(self, cache_key, filepath):
+        """Store converted texture to cache.
+
+        Args:
+            cache_key (Union[TextureCacheKey, None]): Key of converted
+                texture from 'get_cache_key'.
+            filepath (str): Path to converted texture.
+        """
+        if cache_key is not None:
+            self.texture_cache.store(cache_key, filepath)
 
     def apply_settings(self, system_settings, project_settings):
         """Apply OpenPype system/project settings to the TextureProcessor
@@ -189,9 +242,31 @@ class MakeRSTexBin(TextureProcessor):
                            "colorspace".format(colorspace))
             subprocess_args.extend(["-cs", colorspace])
 
-        hash_args = ["rstex"]
+        # Note: Colorspace argument is part of the hash so cached textures
+        #   are not reused for different colorspace
+        hash_args = ["rstex"] + subprocess_args[2:]
         texture_hash = source_hash(source, *hash_args)
 
+        cache_key = self.get_cache_key(source, texture_hash)
+        if cache_key is not None:
+            # Texture from cache is created in staging directory, subfolder
+            #   per cache key is used because textures with the same name
+            #   can come from different directories
+            fname, ext = os.path.splitext(os.path.basename(source))
+            cached_destination = os.path.join(
+                staging_dir,
+                "resources",
+                cache_key.key,
+                fname + self.extension
+            )
+            if self.restore_from_cache(cache_key, cached_destination):
+                return TextureResult(
+                    path=cached_destination,
+                    file_hash=texture_hash,
+                    colorspace=colorspace,
+                    transfer_mode=COPY
+                )
+
         # Redshift stores the output texture next to the input but with
         # the extension replaced to `.rstexbin`
         basename, ext = os.path.splitext(source)
@@ -205,6 +280,8 @@ class MakeRSTexBin(TextureProcessor):
                            exc_info=True)
             six.reraise(*sys.exc_info())
 
+        self.store_to_cache(cache_key, destination)
+
         return TextureResult(
             path=destination,
             file_hash=texture_hash,
@@ -350,6 +427,16 @@ class MakeTX(TextureProcessor):
         if not os.path.exists(resources_dir):
             os.makedirs(resources_dir)
 
+        destination = os.path.join(resources_dir, fname + ".tx")
+        cache_key = self.get_cache_key(source, texture_hash)
+        if self.restore_from_cache(cache_key, destination):
+            return TextureResult(
+                path=destination,
+                file_hash=texture_hash,
+                colorspace=render_colorspace,
+                transfer_mode=COPY
+            )
+
         self.log.debug("Generating .tx file for %s .." % source)
 
         subprocess_args = maketx_args + [
@@ -373,7 +460,6 @@ class MakeTX(TextureProcessor):
             texture_hash
         ])
 
-        destination = os.path.join(resources_dir, fname + ".tx")
         subprocess_args.extend(["-o", destination])
 
         # We want to make sure we are explicit about what OCIO config gets
@@ -390,6 +476,8 @@ class MakeTX(TextureProcessor):
                            exc_info=True)
             raise
 
+        self.store_to_cache(cache_key, destination)
+
         return TextureResult(
             path=destination,
             file_hash=texture_hash,
@@ -422,6 +510,8 @@ class ExtractLook(publish.Extractor):
     order = pyblish.api.ExtractorOrder + 0.2
     scene_type = "ma"
     look_data_type = "json"
+    # Number of textures processed at once, CPU count is used if set to 0
+    max_workers = 0
 
     def get_maya_scene_type(self, instance):
         """Get Maya scene type from settings.
@@ -481,6 +571,9 @@ class ExtractLook(publish.Extractor):
         # TODO: Load these more dynamically once we support more processors
         processors = []
         context = instance.context
+        texture_cache = get_texture_caches(
+            context.data["project_settings"], log=self.log
+        )
         for key, Processor in {
             # Instance data key to texture processor mapping
             "maketx": MakeTX,
@@ -490,6 +583,7 @@ class ExtractLook(publish.Extractor):
                 processor = Processor(log=self.log)
                 processor.apply_settings(context.data["system_settings"],
                                          context.data["project_settings"])
+                processor.texture_cache = texture_cache
                 processors.append(processor)
 
         if processors:
@@ -634,6 +728,14 @@ class ExtractLook(publish.Extractor):
                 destinations_cache[path] = destination
             return destinations_cache[path]
 
+        texture_results = self._process_textures(
+            resources,
+            processors=processors,
+            staging_dir=staging_dir,
+            force_copy=force_copy,
+            color_management=color_management
+        )
+
         # Process all resource's individual files
         processed_files = {}
         transfers = []
@@ -674,14 +776,7 @@ class ExtractLook(publish.Extractor):
                     )
                     continue
 
-                texture_result = self._process_texture(
-                    filepath,
-                    processors=processors,
-                    staging_dir=staging_dir,
-                    force_copy=force_copy,
-                    color_management=color_management,
-                    colorspace=colorspace
-                )
+                texture_result = texture_results[filepath]
 
                 # Set the resulting color space on the resource
                 self._set_resource_result_colorspace(
@@ -742,6 +837,69 @@ class ExtractLook(publish.Extractor):
             "attrRemap": remap,
         }
 
+    def _process_textures(self,
+                          resources,
+                          processors,
+                          staging_dir,
+                          force_copy,
+                          color_management):
+        """Process all unique texture files of resources.
+
+        Textures are processed in parallel. Textures with the same file name
+        are processed one after another because the processors create
+        output files based on the file name.
+
+        Returns:
+            dict[str, TextureResult]: Texture results by normalized filepath.
+        """
+
+        # Colorspace of the first resource using the file is used
+        colorspace_by_filepath = OrderedDict()
+        for resource in resources:
+            for filepath in resource["files"]:
+                colorspace_by_filepath.setdefault(
+                    os.path.normpath(filepath), resource["color_space"]
+                )
+
+        filepaths_by_name = OrderedDict()
+        for filepath in colorspace_by_filepath:
+            name = os.path.splitext(os.path.basename(filepath))[0].lower()
+            filepaths_by_name.setdefault(name, []).append(filepath)
+
+        def process_textures(filepaths):
+            return [
+                (
+                    filepath,
+                    self._process_texture(
+                        filepath,
+                        processors=processors,
+                        staging_dir=staging_dir,
+                        force_copy=force_copy,
+                        color_management=color_management,
+                        colorspace=colorspace_by_filepath[filepath]
+                    )
+                )
+                for filepath in filepaths
+            ]
+
+        max_workers = self.max_workers or os.cpu_count() or 1
+        if not processors:
+            # Only hashes are calculated
+            max_workers = 1
+
+        texture_results = {}
+        if max_workers == 1 or len(filepaths_by_name) < 2:
+            for filepaths in filepaths_by_name.values():
+                texture_results.update(process_textures(filepaths))
+            return texture_results
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for result in executor.map(
+                process_textures, filepaths_by_name.values()
+            ):
+                texture_results.update(result)
+        return texture_results
+
     def get_resource_destination(self, filepath, resources_dir, processors):
         """Get resource destination path.
 
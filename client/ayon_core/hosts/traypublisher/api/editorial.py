@@ -1,6 +1,8 @@
 import re
 from copy import deepcopy
 
+import opentimelineio as otio
+
 from ayon_core.client import get_asset_by_id
 from ayon_core.pipeline.create import CreatorError
 
@@ -340,3 +342,79 @@ class ShotMetadataSolver:
             "parents": parents,
             "tasks": tasks
         }
+
+
+class OTIOClipsIndex:
+    """ Index of clips in otio timeline
+
+    Timeline is parsed once per publishing and shared between instances.
+    Clips are indexed by key created from clip name, kind of parent track
+    and clip range, so instances can reference their clip by the key
+    instead of serialized clip.
+
+    Args:
+        otio_timeline (otio.schema.Timeline): otio timeline object
+    """
+
+    def __init__(self, otio_timeline):
+        self.otio_timeline = otio_timeline
+        self._clips_by_key = {}
+        self._clips_by_name = {}
+        # Later clips with the same key or name replace earlier ones
+        for otio_clip in otio_timeline.each_child(
+            descended_from_type=otio.schema.Clip
+        ):
+            track_kind = getattr(otio_clip.parent(), "kind", None)
+            self._clips_by_name[(otio_clip.name, track_kind)] = otio_clip
+            try:
+                clip_key = self.get_clip_key(otio_clip)
+            except otio.exceptions.CannotComputeAvailableRangeError:
+                # Clip without range can be found only by name
+                continue
+            self._clips_by_key[clip_key] = otio_clip
+
+    @staticmethod
+    def get_clip_key(otio_clip):
+        """ Key of clip in index
+
+        Key is JSON serializable so it can be stored to instance data.
+
+        Args:
+            otio_clip (otio.schema.Clip): otio clip object
+
+        Returns:
+            tuple: clip name, track kind, start, duration and rate of clip
+                range
+        """
+        track_kind = getattr(otio_clip.parent(), "kind", None)
+        clip_range = otio_clip.source_range or otio_clip.trimmed_range()
+        return (
+            otio_clip.name,
+            track_kind,
+            clip_range.start_time.value,
+            clip_range.duration.value,
+            clip_range.start_time.rate,
+        )
+
+    def get_clip(self, clip_key):
+        """ Get clip by key
+
+        Args:
+            clip_key (Iterable): key created by `get_clip_key`
+
+        Returns:
+            Union[otio.schema.Clip, None]: otio clip object
+        """
+        return self._clips_by_key.get(tuple(clip_key))
+
+    def get_clip_by_name(self, clip_name, track_kind="Video"):
+        """ Get last clip with name in tracks of kind
+
+        Args:
+            clip_name (str): clip name
+            track_kind (Optional[str]): kind of clip parent track
+
+        Returns:
+            Union[otio.schema.Clip, None]: otio clip object
+        """
+        return self._clips_by_name.get((clip_name, track_kind))
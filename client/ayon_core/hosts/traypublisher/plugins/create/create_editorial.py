@@ -11,7 +11,8 @@ from ayon_core.hosts.traypublisher.api.plugin import (
     HiddenTrayPublishCreator
 )
 from ayon_core.hosts.traypublisher.api.editorial import (
-    ShotMetadataSolver
+    ShotMetadataSolver,
+    OTIOClipsIndex
 )
 from ayon_core.pipeline import CreatedInstance
 from ayon_core.lib import (
@@ -553,8 +554,9 @@ or updating already created. Publishing will create OTIO file.
 
         # add file extension filter only if it is not shot family
         if family == "shot":
-            instance_data["otioClip"] = (
-                otio.adapters.write_to_string(otio_clip))
+            # reference clip in otio timeline instead of serialized clip
+            instance_data["otioClipKey"] = list(
+                OTIOClipsIndex.get_clip_key(otio_clip))
             c_instance = self.create_context.creators[
                 "editorial_shot"].create(
                     instance_data)
@@ -3,6 +3,8 @@ from pprint import pformat
 import pyblish.api
 import opentimelineio as otio
 
+from ayon_core.hosts.traypublisher.api.editorial import OTIOClipsIndex
+
 
 class CollectEditorialInstance(pyblish.api.InstancePlugin):
     """Collect data for instances created by settings creators."""
@@ -27,6 +29,9 @@ class CollectEditorialInstance(pyblish.api.InstancePlugin):
             otio_timeline_string)
 
         instance.context.data["otioTimeline"] = otio_timeline
+        # Shared index used by shot instances to find their clips
+        instance.context.data["otioClipsIndex"] = OTIOClipsIndex(
+            otio_timeline)
         instance.context.data["editorialSourcePath"] = (
             instance.data["editorialSourcePath"])
 
@@ -2,6 +2,9 @@ from pprint import pformat
 import pyblish.api
 import opentimelineio as otio
 
+from ayon_core.pipeline.publish import KnownPublishError
+from ayon_core.hosts.traypublisher.api.editorial import OTIOClipsIndex
+
 
 class CollectShotInstance(pyblish.api.InstancePlugin):
     """ Collect shot instances
@@ -52,12 +55,11 @@ class CollectShotInstance(pyblish.api.InstancePlugin):
         self.log.debug(pformat(instance.data))
 
     def _get_otio_clip(self, instance):
-        """ Converts otio string data.
+        """ Find otio clip of instance in otio timeline.
 
-        Convert them to proper otio object
-        and finds its equivalent at otio timeline.
-        This process is a hack to support also
-        resolving parent range.
+        Instance is referencing its clip with key from shared
+        clips index of the timeline. Clip name from serialized
+        otio clip is used for instances created without the key.
 
         Args:
             instance (obj): publishing instance
@@ -65,24 +67,46 @@ class CollectShotInstance(pyblish.api.InstancePlugin):
         Returns:
             otio.Clip: otio clip object
         """
-        context = instance.context
-        # convert otio clip from string to object
-        otio_clip_string = instance.data.pop("otioClip")
-        otio_clip = otio.adapters.read_from_string(
-            otio_clip_string)
-
-        otio_timeline = context.data["otioTimeline"]
+        clips_index = self._get_clips_index(instance.context)
+
+        otio_clip = None
+        clip_key = instance.data.pop("otioClipKey", None)
+        if clip_key:
+            otio_clip = clips_index.get_clip(clip_key)
+            clip_name = clip_key[0]
+        else:
+            # convert otio clip from string to object
+            otio_clip_string = instance.data.pop("otioClip")
+            clip_name = otio.adapters.read_from_string(
+                otio_clip_string).name
+
+        if otio_clip is None:
+            otio_clip = clips_index.get_clip_by_name(clip_name)
+
+        if otio_clip is None:
+            raise KnownPublishError(
+                f"Clip \"{clip_name}\" was not found in editorial timeline."
+            )
+        return otio_clip
 
-        clips = [
-            clip for clip in otio_timeline.each_child(
-                descended_from_type=otio.schema.Clip)
-            if clip.name == otio_clip.name
-            if clip.parent().kind == "Video"
-        ]
+    def _get_clips_index(self, context):
+        """ Get clips index shared for otio timeline in context.
 
-        otio_clip = clips.pop()
+        Args:
+            context (pyblish.api.Context): publishing context
 
-        return otio_clip
+        Returns:
+            OTIOClipsIndex: index of clips in otio timeline
+        """
+        otio_timeline = context.data["otioTimeline"]
+        clips_index = context.data.get("otioClipsIndex")
+        if (
+            clips_index is None
+            or clips_index.otio_timeline is not otio_timeline
+        ):
+            clips_index = OTIOClipsIndex(otio_timeline)
+            context.data["otioClipsIndex"] = clips_index
+        return clips_index
 
     def _distribute_shared_data(self, instance):
         """ Distribute all defined keys.
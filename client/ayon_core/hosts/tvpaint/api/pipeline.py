@@ -1,7 +1,9 @@
 import os
 import json
+import time
 import tempfile
 import logging
+import contextlib
 
 import requests
 
@@ -128,7 +130,9 @@ class TVPaintHost(HostBase, IWorkfileHost, ILoadHost, IPublishHost):
         return get_workfile_metadata(SECTION_NAME_CREATE_CONTEXT, {})
 
     def update_context_data(self, data, changes):
-        return write_workfile_metadata(SECTION_NAME_CREATE_CONTEXT, data)
+        return write_workfile_metadata(
+            SECTION_NAME_CREATE_CONTEXT, data, flush=True
+        )
 
     def list_instances(self):
         """List all created instances from current workfile."""
@@ -137,22 +141,47 @@ class TVPaintHost(HostBase, IWorkfileHost, ILoadHost, IPublishHost):
     def write_instances(self, data):
         return write_instances(data)
 
+    # --- Workfile metadata ---
+    def get_workfile_metadata_cache(self):
+        return get_workfile_metadata_cache()
+
+    def flush_workfile_metadata(self):
+        return flush_workfile_metadata()
+
+    def workfile_metadata_batch(self):
+        """Write workfile metadata changed in the context at once.
+
+        Example:
+            >>> with host.workfile_metadata_batch():
+            ...     host.update_context_data(context_data, changes)
+            ...     host.write_instances(instances)
+        """
+        return workfile_metadata_batch()
+
     # --- Workfile ---
     def open_workfile(self, filepath):
+        metadata_cache = get_workfile_metadata_cache()
+        metadata_cache.flush()
         george_script = "tv_LoadProject '\"'\"{}\"'\"'".format(
             filepath.replace("\\", "/")
         )
-        return execute_george_through_file(george_script)
+        result = execute_george_through_file(george_script)
+        metadata_cache.reset()
+        return result
 
     def save_workfile(self, filepath=None):
         if not filepath:
             filepath = self.get_current_workfile()
+        metadata_cache = get_workfile_metadata_cache()
         context = get_global_context()
         save_current_workfile_context(context)
+        metadata_cache.flush()
 
         # Execute george script to save workfile.
         george_script = "tv_SaveProject {}".format(filepath.replace("\\", "/"))
-        return execute_george(george_script)
+        result = execute_george(george_script)
+        metadata_cache.reset()
+        return result
 
     def work_root(self, session):
         return session["AVALON_WORKDIR"]
@@ -330,8 +359,352 @@ def get_workfile_metadata_string_for_keys(metadata_keys):
     return output_string
 
 
-def get_workfile_metadata_string(metadata_key):
-    """Read metadata for specific key from current project workfile."""
+class WorkfileMetadataCache(object):
+    """Cache of workfile metadata to avoid George scripts on each access.
+
+    All known metadata keys are loaded with single George script. Cache is
+    validated using current project name of TVPaint (at most once per
+    'validation_interval' seconds) and is reset when workfile is opened or
+    saved.
+
+    Written values are stored to cache and are written to workfile all at
+    once in single George script. Writing is deferred until Qt event loop
+    is processed, or until end of 'batch' context, so multiple writes
+    during one operation are written together. Only changed chunks are
+    written. Error of deferred writing is raised on next access to the
+    cache and the changes are kept to be written by next flush.
+    """
+
+    known_keys = (
+        SECTION_NAME_CONTEXT,
+        SECTION_NAME_CREATE_CONTEXT,
+        SECTION_NAME_INSTANCES,
+        SECTION_NAME_CONTAINERS,
+    )
+    validation_interval = 1.0
+
+    def __init__(self):
+        self._values_by_key = {}
+        self._stored_chunks_by_key = {}
+        self._pending_chunks_by_key = {}
+        self._project_name = None
+        self._validation_time = None
+        self._batch_level = 0
+        self._flush_scheduled = False
+        self._flush_error = None
+
+    def reset(self):
+        """Reset cached values, pending changes are not written."""
+        self._values_by_key = {}
+        self._stored_chunks_by_key = {}
+        self._pending_chunks_by_key = {}
+        self._project_name = None
+        self._validation_time = None
+        self._flush_error = None
+
+    def get_value(self, metadata_key):
+        """Metadata string of a key.
+
+        Args:
+            metadata_key (str): Metadata key.
+
+        Returns:
+            Union[str, None]: Metadata string or None if is not set.
+        """
+        self._raise_flush_error()
+        self._validate()
+        if metadata_key not in self._values_by_key:
+            keys = [metadata_key]
+            if not self._values_by_key:
+                keys.extend(
+                    key for key in self.known_keys if key != metadata_key
+                )
+            self._load_keys(keys)
+        return self._values_by_key.get(metadata_key)
+
+    def set_value(self, metadata_key, value, flush=False):
+        """Set metadata string of a key.
+
+        Args:
+            metadata_key (str): Metadata key.
+            value (str): Metadata string.
+            flush (Optional[bool]): Write pending changes immediately if
+                not inside 'batch' context.
+
+        Returns:
+            Union[str, None]: Result of George script if changes were
+                written.
+        """
+        self._raise_flush_error()
+        self._validate()
+        self._values_by_key[metadata_key] = value or None
+        # Handle quotes in dumped json string
+        # - replace single and double quotes with placeholders
+        value = (
+            value
+            .replace("'", "{__sq__}")
+            .replace("\"", "{__dq__}")
+        )
+        self._pending_chunks_by_key[metadata_key] = (
+            split_metadata_string(value)
+        )
+        if flush and self._batch_level == 0:
+            return self.flush()
+        return self._schedule_flush()
+
+    @contextlib.contextmanager
+    def batch(self):
+        """Write changes made during the context at once on exit."""
+        self._batch_level += 1
+        try:
+            yield
+        finally:
+            self._batch_level -= 1
+            if self._batch_level == 0:
+                self.flush()
+
+    def flush(self):
+        """Write pending changes to workfile with single George script.
+
+        Returns:
+            Union[str, None]: Result of George script or None if there was
+                nothing to write.
+        """
+        self._flush_scheduled = False
+        # Changes of failed deferred flush are written again
+        self._flush_error = None
+        if not self._pending_chunks_by_key:
+            return None
+
+        pending_chunks_by_key = self._pending_chunks_by_key
+        self._pending_chunks_by_key = {}
+        write_template = "tv_writeprojectstring \"{}\" \"{}\" \"{}\""
+        george_script_parts = []
+        for metadata_key, chunks in pending_chunks_by_key.items():
+            stored_chunks = self._stored_chunks_by_key.get(metadata_key)
+            if stored_chunks is None:
+                stored_chunks = []
+                # Add information about chunks length to metadata key
+                george_script_parts.append(write_template.format(
+                    METADATA_SECTION, metadata_key, len(chunks)
+                ))
+            elif len(stored_chunks) != len(chunks):
+                george_script_parts.append(write_template.format(
+                    METADATA_SECTION, metadata_key, len(chunks)
+                ))
+
+            # Add changed chunk values to indexed metadata keys
+            for idx, chunk_value in enumerate(chunks):
+                if idx < len(stored_chunks) and stored_chunks[idx] == (
+                    chunk_value
+                ):
+                    continue
+                sub_key = "{}{}".format(metadata_key, idx)
+                george_script_parts.append(write_template.format(
+                    METADATA_SECTION, sub_key, chunk_value
+                ))
+
+        result = None
+        if george_script_parts:
+            try:
+                result = execute_george_through_file(
+                    "\n".join(george_script_parts)
+                )
+            except Exception:
+                # Keep changes that were not written
+                for metadata_key, chunks in pending_chunks_by_key.items():
+                    self._pending_chunks_by_key.setdefault(
+                        metadata_key, chunks
+                    )
+                raise
+
+        self._stored_chunks_by_key.update(pending_chunks_by_key)
+        return result
+
+    def _schedule_flush(self):
+        if self._batch_level > 0 or self._flush_scheduled:
+            return None
+
+        # Write on next Qt event loop processing so all changes made in
+        #   one operation are written together
+        app = None
+        try:
+            from qtpy import QtWidgets, QtCore
+
+            app = QtWidgets.QApplication.instance()
+        except Exception:
+            pass
+
+        if app is None or QtCore.QThread.currentThread() != app.thread():
+            return self.flush()
+
+        self._flush_scheduled = True
+        QtCore.QTimer.singleShot(0, self._on_flush_timer)
+        return None
+
+    def _on_flush_timer(self):
+        if not self._flush_scheduled:
+            return
+        try:
+            self.flush()
+        except Exception as exc:
+            log.warning("Failed to write workfile metadata.", exc_info=True)
+            # Raise the error on next access to the cache
+            self._flush_error = exc
+
+    def _raise_flush_error(self):
+        if self._flush_error is None:
+            return
+        error = self._flush_error
+        self._flush_error = None
+        raise error
+
+    def _validate(self):
+        current_time = time.time()
+        if (
+            self._validation_time is not None
+            and current_time - self._validation_time < (
+                self.validation_interval
+            )
+        ):
+            return
+
+        project_name = execute_george("tv_GetProjectName")
+        self._validation_time = current_time
+        if project_name == self._project_name:
+            return
+
+        if self._pending_chunks_by_key:
+            log.warning(
+                "Workfile changed, pending metadata changes are discarded."
+            )
+        self.reset()
+        self._project_name = project_name
+        self._validation_time = current_time
+
+    def _load_keys(self, metadata_keys):
+        """Load metadata keys with all their chunks using one George script.
+
+        Each output line contains metadata key, chunk index (or 'count' for
+        value of the key itself) and value separated by '|'.
+        """
+        output_file = tempfile.NamedTemporaryFile(
+            mode="w", prefix="a_tvp_", suffix=".txt", delete=False
+        )
+        output_file.close()
+        output_filepath = output_file.name.replace("\\", "/")
+
+        george_script_parts = [
+            "output_path = \"{}\"".format(output_filepath)
+        ]
+        for metadata_key in metadata_keys:
+            george_script_parts.extend([
+                "key_name = \"{}\"".format(metadata_key),
+                "tv_readprojectstring \"{}\" \"{}\" \"\"".format(
+                    METADATA_SECTION, metadata_key
+                ),
+                "line = key_name'|count|'result",
+                "tv_writetextfile \"strict\" \"append\""
+                " '\"'output_path'\"' line",
+                # Read chunks until an empty one is found
+                "idx = 0",
+                "chunk = \"_\"",
+                "WHILE (CMP(chunk, \"\") == 0)",
+                "sub_key = key_name''idx",
+                "tv_readprojectstring \"{}\" '\"'sub_key'\"' \"\"".format(
+                    METADATA_SECTION
+                ),
+                "chunk = result",
+                "IF (CMP(chunk, \"\") == 0)",
+                "line = key_name'|'idx'|'chunk",
+                "tv_writetextfile \"strict\" \"append\""
+                " '\"'output_path'\"' line",
+                "END",
+                "idx = idx + 1",
+                "END",
+            ])
+
+        execute_george_through_file("\n".join(george_script_parts))
+
+        with open(output_filepath, "r") as stream:
+            file_content = stream.read()
+        os.remove(output_filepath)
+
+        counts_by_key = {}
+        chunks_by_key = {key: {} for key in metadata_keys}
+        for line in file_content.split("\n"):
+            parts = line.split("|", 2)
+            if len(parts) != 3 or parts[0] not in chunks_by_key:
+                continue
+            metadata_key, idx, value = parts
+            if idx == "count":
+                counts_by_key[metadata_key] = value
+            elif idx.isdecimal():
+                chunks_by_key[metadata_key][int(idx)] = value
+
+        for metadata_key in metadata_keys:
+            count = counts_by_key.get(metadata_key)
+            chunks = None
+            if count is None:
+                # Output of the key is missing, load it the old way
+                metadata_string = _read_workfile_metadata_string(metadata_key)
+
+            elif not count.strip():
+                metadata_string = None
+                chunks = []
+
+            # NOTE Backwards compatibility when metadata key did not store
+            #   range of key indexes but the value itself
+            elif not count.strip().isdecimal():
+                metadata_string = _replace_metadata_placeholders(count)
+
+            else:
+                chunks_by_idx = chunks_by_key[metadata_key]
+                chunks = []
+                for idx in range(int(count.strip())):
+                    chunk = chunks_by_idx.get(idx)
+                    if chunk is None:
+                        chunks = None
+                        break
+                    chunks.append(chunk)
+
+                if chunks is None:
+                    metadata_string = _read_workfile_metadata_string(
+                        metadata_key
+                    )
+                else:
+                    metadata_string = _replace_metadata_placeholders(
+                        "".join(chunks)
+                    )
+
+            self._values_by_key[metadata_key] = metadata_string or None
+            if chunks is not None:
+                self._stored_chunks_by_key[metadata_key] = chunks
+
+
+_metadata_cache = WorkfileMetadataCache()
+
+
+def get_workfile_metadata_cache():
+    """Workfile metadata cache of current TVPaint process.
+
+    Returns:
+        WorkfileMetadataCache: Metadata cache.
+    """
+    return _metadata_cache
+
+
+def _replace_metadata_placeholders(metadata_string):
+    # Replace quotes plaholders with their values
+    return (
+        metadata_string
+        .replace("{__sq__}", "'")
+        .replace("{__dq__}", "\"")
+    )
+
+
+def _read_workfile_metadata_string(metadata_key):
+    """Read metadata for specific key directly from workfile."""
     result = get_workfile_metadata_string_for_keys([metadata_key])
     if not result:
         return None
@@ -351,13 +724,12 @@ def get_workfile_metadata_string(metadata_key):
             keys.append("{}{}".format(metadata_key, idx))
         metadata_string = get_workfile_metadata_string_for_keys(keys)
 
-    # Replace quotes plaholders with their values
-    metadata_string = (
-        metadata_string
-        .replace("{__sq__}", "'")
-        .replace("{__dq__}", "\"")
-    )
-    return metadata_string
+    return _replace_metadata_placeholders(metadata_string)
+
+
+def get_workfile_metadata_string(metadata_key):
+    """Read metadata for specific key from current project workfile."""
+    return _metadata_cache.get_value(metadata_key)
 
 
 def get_workfile_metadata(metadata_key, default=None):
@@ -389,15 +761,25 @@ def get_workfile_metadata(metadata_key, default=None):
     return default
 
 
-def write_workfile_metadata(metadata_key, value):
+def write_workfile_metadata(metadata_key, value, flush=False):
     """Write metadata for specific key into current project workfile.
 
     George script has specific way how to work with quotes which should be
     solved automatically with this function.
 
+    Value is written to workfile with other changes once Qt event loop is
+    processed, or at the end of 'workfile_metadata_batch' context. Use
+    'flush' argument or 'flush_workfile_metadata' to write it immediately.
+
     Args:
         metadata_key (str): Key defying under which key value will be stored.
         value (dict,list,str): Data to store they must be json serializable.
+        flush (Optional[bool]): Write the value immediately if not inside
+            'workfile_metadata_batch' context.
+
+    Returns:
+        Union[str, None]: Result of George script if value was written
+            immediately.
     """
     if isinstance(value, (dict, list)):
         value = json.dumps(value)
@@ -405,32 +787,22 @@ def write_workfile_metadata(metadata_key, value):
     if not value:
         value = ""
 
-    # Handle quotes in dumped json string
-    # - replace single and double quotes with placeholders
-    value = (
-        value
-        .replace("'", "{__sq__}")
-        .replace("\"", "{__dq__}")
-    )
-    chunks = split_metadata_string(value)
-    chunks_len = len(chunks)
+    return _metadata_cache.set_value(metadata_key, value, flush)
 
-    write_template = "tv_writeprojectstring \"{}\" \"{}\" \"{}\""
-    george_script_parts = []
-    # Add information about chunks length to metadata key itself
-    george_script_parts.append(
-        write_template.format(METADATA_SECTION, metadata_key, chunks_len)
-    )
-    # Add chunk values to indexed metadata keys
-    for idx, chunk_value in enumerate(chunks):
-        sub_key = "{}{}".format(metadata_key, idx)
-        george_script_parts.append(
-            write_template.format(METADATA_SECTION, sub_key, chunk_value)
-        )
 
-    george_script = "\n".join(george_script_parts)
+def flush_workfile_metadata():
+    """Write pending metadata changes to workfile.
+
+    Returns:
+        Union[str, None]: Result of George script or None if there was
+            nothing to write.
+    """
+    return _metadata_cache.flush()
+
 
-    return execute_george_through_file(george_script)
+def workfile_metadata_batch():
+    """Context manager writing all metadata changes at once on exit."""
+    return _metadata_cache.batch()
 
 
 def get_current_workfile_context():
@@ -449,7 +821,7 @@ def list_instances():
 
 
 def write_instances(data):
-    return write_workfile_metadata(SECTION_NAME_INSTANCES, data)
+    return write_workfile_metadata(SECTION_NAME_INSTANCES, data, flush=True)
 
 
 def get_containers():
@@ -1,6 +1,8 @@
 import os
 import shutil
 import collections
+from concurrent.futures import ThreadPoolExecutor
+
 from PIL import Image, ImageDraw
 
 
@@ -545,7 +547,7 @@ def cleanup_rendered_layers(filepaths_by_layer_id):
 def composite_rendered_layers(
     layers_data, filepaths_by_layer_id,
     range_start, range_end,
-    dst_filepaths_by_frame, cleanup=True
+    dst_filepaths_by_frame, cleanup=True, max_workers=None
 ):
     """Composite multiple rendered layers by their position.
 
@@ -556,6 +558,10 @@ def composite_rendered_layers(
     Function can be used even if single layer was created to fill transparent
     filepaths.
 
+    Frames with identical source files of all layers, e.g. hold frames that
+    are hardlinked, are composited only once and the result is hardlinked to
+    other frames. Unique frames are composited in parallel threads.
+
     Args:
         layers_data(list): Layers data loaded from TVPaint.
         filepaths_by_layer_id(dict): Rendered filepaths stored by frame index
@@ -566,6 +572,7 @@ def composite_rendered_layers(
             image after compositing will be stored. Path must not clash with
             source filepaths.
         cleanup(bool): Remove all source filepaths when done with compositing.
+        max_workers(Optional[int]): Number of threads used for compositing.
     """
     # Prepare layers by their position
     #   - position tells in which order will compositing happen
@@ -581,6 +588,12 @@ def composite_rendered_layers(
     transparent_filepaths = set()
     # Store first final filepath
     first_dst_filepath = None
+    # Destination filepath of first frame with same source files
+    dst_filepath_by_identities = {}
+    # Destination filepaths which will be hardlinked from another frame
+    links = []
+    # Frames which will be composited
+    composite_items = []
     for frame_idx in range(range_start, range_end + 1):
         dst_filepath = dst_filepaths_by_frame[frame_idx]
         src_filepaths = []
@@ -599,6 +612,16 @@ def composite_rendered_layers(
         if first_dst_filepath is None:
             first_dst_filepath = dst_filepath
 
+        identities = tuple(
+            _get_file_identity(src_filepath)
+            for src_filepath in src_filepaths
+        )
+        src_dst_filepath = dst_filepath_by_identities.get(identities)
+        if src_dst_filepath is not None:
+            links.append((src_dst_filepath, dst_filepath))
+            continue
+
+        dst_filepath_by_identities[identities] = dst_filepath
         if len(src_filepaths) == 1:
             src_filepath = src_filepaths[0]
             if cleanup:
@@ -607,7 +630,12 @@ def composite_rendered_layers(
                 copy_render_file(src_filepath, dst_filepath)
 
         else:
-            composite_images(src_filepaths, dst_filepath)
+            composite_items.append((src_filepaths, identities, dst_filepath))
+
+    _composite_items_parallel(composite_items, max_workers)
+
+    for src_dst_filepath, dst_filepath in links:
+        copy_render_file(src_dst_filepath, dst_filepath)
 
     # Store first transparent filepath to be able copy it
     transparent_filepath = None
@@ -625,6 +653,87 @@ def composite_rendered_layers(
         cleanup_rendered_layers(filepaths_by_layer_id)
 
 
+def _get_file_identity(filepath):
+    """Identity of file which is same for hardlinks of the file."""
+    stat = os.stat(filepath)
+    if stat.st_ino:
+        return (stat.st_dev, stat.st_ino)
+    return os.path.normpath(filepath)
+
+
+def _composite_items_parallel(composite_items, max_workers=None):
+    """Composite frames in threads.
+
+    Frames are split to continuous chunks so source images which did not
+    change between following frames are loaded only once in a chunk.
+    """
+    if not composite_items:
+        return
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(composite_items)))
+    # Use more chunks than workers to balance work between workers
+    chunks_count = min(len(composite_items), max_workers * 4)
+    chunk_size = -(-len(composite_items) // chunks_count)
+    chunks = [
+        composite_items[idx:idx + chunk_size]
+        for idx in range(0, len(composite_items), chunk_size)
+    ]
+    if len(chunks) == 1:
+        _composite_items(chunks[0])
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(_composite_items, chunk)
+            for chunk in chunks
+        ]
+        for future in futures:
+            future.result()
+
+
+def _composite_items(composite_items):
+    """Composite frames in sequence.
+
+    Decoded source images are kept for next frame so images of layers which
+    did not change are not loaded again. Only visible area of each image is
+    composited.
+    """
+    images_by_identity = {}
+    for src_filepaths, identities, dst_filepath in composite_items:
+        # Keep only images used by previous frame
+        new_images_by_identity = {}
+        images = []
+        for src_filepath, identity in zip(src_filepaths, identities):
+            image = new_images_by_identity.get(identity)
+            if image is None:
+                image = images_by_identity.get(identity)
+            if image is None:
+                image = _load_composite_image(src_filepath)
+            new_images_by_identity[identity] = image
+            images.append(image)
+        images_by_identity = new_images_by_identity
+
+        img_obj = images[0][0].copy()
+        for _img_obj, bbox in images[1:]:
+            # Skip fully transparent images
+            if bbox is not None:
+                img_obj.alpha_composite(_img_obj, bbox[:2], bbox)
+        img_obj.save(dst_filepath)
+
+
+def _load_composite_image(filepath):
+    """Load image with bounding box of its visible pixels."""
+    img_obj = Image.open(filepath)
+    img_obj.load()
+    if img_obj.mode == "RGBA":
+        bbox = img_obj.getchannel("A").getbbox()
+    else:
+        bbox = (0, 0) + img_obj.size
+    return img_obj, bbox
+
+
 def composite_images(input_image_paths, output_filepath):
     """Composite images in order from passed list.
 
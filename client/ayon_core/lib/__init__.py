@@ -74,6 +74,7 @@ from .path_templates import (
     TemplateMissingKey,
     TemplateUnsolved,
     StringTemplate,
+    CompiledStringTemplate,
     TemplatesDict,
     FormatObject,
 )
@@ -89,13 +90,17 @@ from .python_module_tools import (
     modules_from_path,
     recursive_bases_from_class,
     classes_from_module,
+    get_class_attributes,
+    restore_class_attributes,
     import_module_from_dirpath,
     is_func_signature_supported,
 )
 
 from .profiles_filtering import (
     compile_list_of_regexes,
-    filter_profiles
+    filter_profiles,
+    ProfileMatcher,
+    get_profile_matcher,
 )
 
 from .transcoding import (
@@ -104,7 +109,9 @@ from .transcoding import (
     convert_for_ffmpeg,
     convert_input_paths_for_ffmpeg,
     get_ffprobe_data,
+    get_ffprobe_data_for_inputs,
     get_ffprobe_streams,
+    clear_probe_cache,
     get_ffmpeg_codec_args,
     get_ffmpeg_format_args,
     convert_ffprobe_fps_value,
@@ -143,6 +150,7 @@ from .applications import (
 from .plugin_tools import (
     prepare_template_data,
     source_hash,
+    source_hash_from_stat,
 )
 
 from .path_tools import (
@@ -213,6 +221,8 @@ __all__ = [
     "modules_from_path",
     "recursive_bases_from_class",
     "classes_from_module",
+    "get_class_attributes",
+    "restore_class_attributes",
     "import_module_from_dirpath",
     "is_func_signature_supported",
 
@@ -221,7 +231,9 @@ __all__ = [
     "convert_for_ffmpeg",
     "convert_input_paths_for_ffmpeg",
     "get_ffprobe_data",
+    "get_ffprobe_data_for_inputs",
     "get_ffprobe_streams",
+    "clear_probe_cache",
     "get_ffmpeg_codec_args",
     "get_ffmpeg_format_args",
     "convert_ffprobe_fps_value",
@@ -253,9 +265,12 @@ __all__ = [
     "compile_list_of_regexes",
 
     "filter_profiles",
+    "ProfileMatcher",
+    "get_profile_matcher",
 
     "prepare_template_data",
     "source_hash",
+    "source_hash_from_stat",
 
     "format_file_size",
     "collect_frames",
@@ -268,6 +283,7 @@ __all__ = [
     "TemplateMissingKey",
     "TemplateUnsolved",
     "StringTemplate",
+    "CompiledStringTemplate",
     "TemplatesDict",
     "FormatObject",
 
@@ -2,10 +2,19 @@ import os
 import logging
 import sys
 import errno
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import six
 
 from ayon_core.lib import create_hard_link
 
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
 # this is needed until speedcopy for linux is fixed
 if sys.platform == "win32":
     from speedcopy import copyfile
@@ -23,6 +32,85 @@ class DuplicateDestinationError(ValueError):
     """
 
 
+def create_hash_object(algorithm):
+    """Create hash object for checksum algorithm.
+
+    Algorithms of 'xxhash' module (e.g. 'xxh3_64') are available if the
+    module is installed, otherwise 'hashlib' algorithms are used.
+
+    Args:
+        algorithm (str): Name of algorithm e.g. 'sha256' or 'xxh3_64'.
+
+    Returns:
+        Any: Hash object with 'update' and 'hexdigest' methods.
+
+    Raises:
+        ValueError: Algorithm is not available.
+    """
+
+    if algorithm.startswith("xxh"):
+        hash_func = None
+        if xxhash is not None:
+            hash_func = getattr(xxhash, algorithm, None)
+        if hash_func is None:
+            raise ValueError(
+                "Checksum algorithm '{}' is not available.".format(algorithm)
+            )
+        return hash_func()
+    return hashlib.new(algorithm)
+
+
+def get_file_checksum(path, algorithm="sha256", chunk_size=1024 * 1024):
+    """Calculate checksum of file content.
+
+    Args:
+        path (str): Path to file.
+        algorithm (Optional[str]): Name of 'hashlib' or 'xxhash' algorithm.
+        chunk_size (Optional[int]): Size of chunks read from the file.
+
+    Returns:
+        str: Hex digest of the file content.
+    """
+
+    hash_obj = create_hash_object(algorithm)
+    with open(path, "rb") as stream:
+        for chunk in iter(lambda: stream.read(chunk_size), b""):
+            hash_obj.update(chunk)
+    return hash_obj.hexdigest()
+
+
+class TransferProgress(object):
+    """Progress of files transfer in 'FileTransaction'.
+
+    Object is passed to progress callback after each transferred file.
+
+    Args:
+        total_bytes (int): Size of all files that will be transferred.
+        total_files (int): Number of files that will be transferred.
+    """
+
+    def __init__(self, total_bytes, total_files):
+        self.total_bytes = total_bytes
+        self.total_files = total_files
+        self.transferred_bytes = 0
+        self.transferred_files = 0
+        self.last_path = None
+        self.last_file_size = 0
+
+    def add_file(self, path, size):
+        self.transferred_bytes += size
+        self.transferred_files += 1
+        self.last_path = path
+        self.last_file_size = size
+
+    @property
+    def progress(self):
+        """Transferred bytes ratio in range 0.0 - 1.0."""
+        if not self.total_bytes:
+            return 1.0
+        return float(self.transferred_bytes) / self.total_bytes
+
+
 class FileTransaction(object):
     """File transaction with rollback options.
 
@@ -47,17 +135,65 @@ class FileTransaction(object):
         permissions could be changed, other machines could be moving or writing
         files. A lot can happen.
 
+    Transfers can run in parallel using a thread pool (`max_workers`). Files
+    can be skipped when destination already matches the source
+    (`skip_existing`) which allows to resume interrupted transactions. The
+    match is based on size and modification time of the files, or on
+    checksum of their content if `checksum_algorithm` is set. Progress of
+    the transfer can be reported with `progress_callback`.
+
+    Size and modification time of each destination file are captured when
+    the file is transferred and are available using `get_file_info`.
+    Checksum of content is calculated while the file is copied if
+    `file_checksum_algorithm` is set.
+
     Warning:
         Any folders created during the transfer will not be removed.
+
+    Args:
+        log (Optional[logging.Logger]): Logger used for output.
+        allow_queue_replacements (Optional[bool]): Allow to replace source
+            of already queued destination.
+        max_workers (Optional[int]): Number of threads used to transfer
+            files. Transfers are processed one by one if is '1' or lower.
+        skip_existing (Optional[bool]): Skip transfer of files where the
+            destination already matches the source.
+        checksum_algorithm (Optional[str]): Name of 'hashlib' algorithm
+            used to compare existing files e.g. 'sha256'. Size and
+            modification time are compared if not set.
+        progress_callback (Optional[Callable[[TransferProgress], None]]):
+            Callback triggered after each processed file.
+        file_checksum_algorithm (Optional[str]): Name of 'hashlib' or
+            'xxhash' algorithm used to calculate checksum of transferred
+            files content e.g. 'sha256' or 'xxh3_64'.
     """
 
     MODE_COPY = 0
     MODE_HARDLINK = 1
-
-    def __init__(self, log=None, allow_queue_replacements=False):
+    # Try to create hardlink and copy the file if that is not possible
+    #   e.g. when paths are on different drives
+    MODE_HARDLINK_OR_COPY = 2
+
+    def __init__(
+        self,
+        log=None,
+        allow_queue_replacements=False,
+        max_workers=None,
+        skip_existing=False,
+        checksum_algorithm=None,
+        progress_callback=None,
+        file_checksum_algorithm=None,
+    ):
         if log is None:
             log = logging.getLogger("FileTransaction")
 
+        # Validate the algorithm names early
+        if checksum_algorithm:
+            create_hash_object(checksum_algorithm)
+
+        if file_checksum_algorithm:
+            create_hash_object(file_checksum_algorithm)
+
         self.log = log
 
         # The transfer queue
@@ -70,7 +206,19 @@ class FileTransaction(object):
         # Backup file location mapping to original locations
         self._backup_to_original = {}
 
+        # Destination file paths that already matched the source
+        self._skipped = []
+
+        # Information about destination files captured during transfer
+        self._file_infos = {}
+
         self._allow_queue_replacements = allow_queue_replacements
+        self._max_workers = max_workers or 1
+        self._skip_existing = skip_existing
+        self._checksum_algorithm = checksum_algorithm
+        self._progress_callback = progress_callback
+        self._file_checksum_algorithm = file_checksum_algorithm
+        self._lock = threading.Lock()
 
     def add(self, src, dst, mode=MODE_COPY):
         """Add a new file to transfer queue.
@@ -78,7 +226,8 @@ class FileTransaction(object):
         Args:
             src (str): Source path.
             dst (str): Destination path.
-            mode (MODE_COPY, MODE_HARDLINK): Transfer mode.
+            mode (MODE_COPY, MODE_HARDLINK, MODE_HARDLINK_OR_COPY): Transfer
+                mode.
         """
 
         opts = {"mode": mode}
@@ -111,10 +260,26 @@ class FileTransaction(object):
 
     def process(self):
         # Backup any existing files
-        for dst, (src, _) in self._transfers.items():
+        to_transfer = []
+        for dst, (src, opts) in self._transfers.items():
             self.log.debug("Checking file ... {} -> {}".format(src, dst))
             path_same = self._same_paths(src, dst)
-            if path_same or not os.path.exists(dst):
+            if path_same:
+                self.log.debug(
+                    "Source and destination are same files {} -> {}".format(
+                        src, dst))
+                continue
+
+            if not os.path.exists(dst):
+                to_transfer.append((src, dst, opts))
+                continue
+
+            if self._skip_existing and self._same_content(src, dst):
+                self.log.debug(
+                    "Destination already matches source {} -> {}".format(
+                        src, dst))
+                self._skipped.append(dst)
+                self._file_infos[dst] = self._create_file_info(dst)
                 continue
 
             # Backup original file
@@ -124,27 +289,133 @@ class FileTransaction(object):
             self.log.debug(
                 "Backup existing file: {} -> {}".format(dst, backup))
             os.rename(dst, backup)
+            to_transfer.append((src, dst, opts))
+
+        progress = TransferProgress(
+            sum(os.path.getsize(src) for src, _, _ in to_transfer),
+            len(to_transfer)
+        )
 
         # Copy the files to transfer
-        for dst, (src, opts) in self._transfers.items():
-            path_same = self._same_paths(src, dst)
-            if path_same:
-                self.log.debug(
-                    "Source and destination are same files {} -> {}".format(
-                        src, dst))
-                continue
+        if self._max_workers < 2 or len(to_transfer) < 2:
+            for src, dst, opts in to_transfer:
+                self._transfer_file(src, dst, opts, progress)
+            return
+
+        self.log.debug("Transferring {} files using {} threads".format(
+            len(to_transfer), self._max_workers))
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            futures = [
+                executor.submit(self._transfer_file, src, dst, opts, progress)
+                for src, dst, opts in to_transfer
+            ]
+            # Make sure all running transfers are finished before
+            #   an error is raised so rollback knows about all of them
+            errors = []
+            for future in futures:
+                if future.cancelled():
+                    continue
+                exc = future.exception()
+                if exc is not None:
+                    errors.append(exc)
+                    # Don't start transfers that are still waiting
+                    for _future in futures:
+                        _future.cancel()
 
-            self._create_folder_for_file(dst)
+        if errors:
+            raise errors[0]
 
-            if opts["mode"] == self.MODE_COPY:
-                self.log.debug("Copying file ... {} -> {}".format(src, dst))
-                copyfile(src, dst)
-            elif opts["mode"] == self.MODE_HARDLINK:
+    def _transfer_file(self, src, dst, opts, progress):
+        self._create_folder_for_file(dst)
+
+        mode = opts["mode"]
+        if mode == self.MODE_HARDLINK_OR_COPY:
+            try:
                 self.log.debug("Hardlinking file ... {} -> {}".format(
                     src, dst))
                 create_hard_link(src, dst)
-
+            except OSError as exc:
+                # re-raise exception if different than
+                # EXDEV - cross drive path
+                # EINVAL - wrong format, must be NTFS
+                if exc.errno not in (errno.EXDEV, errno.EINVAL):
+                    raise
+                mode = self.MODE_COPY
+
+        checksum = None
+        if mode == self.MODE_COPY:
+            self.log.debug("Copying file ... {} -> {}".format(src, dst))
+            if self._file_checksum_algorithm:
+                checksum = self._copy_file_with_checksum(src, dst)
+            else:
+                copyfile(src, dst)
+            if self._skip_existing:
+                # Keep source modification time so the file is recognized
+                #   as unchanged by next transaction
+                src_stat = os.stat(src)
+                os.utime(dst, (src_stat.st_atime, src_stat.st_mtime))
+
+        elif mode == self.MODE_HARDLINK:
+            self.log.debug("Hardlinking file ... {} -> {}".format(
+                src, dst))
+            create_hard_link(src, dst)
+
+        file_info = self._create_file_info(dst, checksum)
+        with self._lock:
             self._transferred.append(dst)
+            self._file_infos[dst] = file_info
+            progress.add_file(dst, file_info["size"])
+            if self._progress_callback is not None:
+                self._progress_callback(progress)
+
+    def _copy_file_with_checksum(self, src, dst, chunk_size=1024 * 1024):
+        """Copy file content and calculate checksum of copied data.
+
+        Returns:
+            str: Hex digest of the file content.
+        """
+
+        hash_obj = create_hash_object(self._file_checksum_algorithm)
+        with open(src, "rb") as src_stream:
+            with open(dst, "wb") as dst_stream:
+                for chunk in iter(lambda: src_stream.read(chunk_size), b""):
+                    hash_obj.update(chunk)
+                    dst_stream.write(chunk)
+        return hash_obj.hexdigest()
+
+    def _create_file_info(self, path, checksum=None):
+        stat = os.stat(path)
+        if checksum is None and self._file_checksum_algorithm:
+            checksum = get_file_checksum(path, self._file_checksum_algorithm)
+        return {
+            "size": stat.st_size,
+            "mtime": stat.st_mtime,
+            "checksum": checksum,
+            "checksum_algorithm": (
+                self._file_checksum_algorithm if checksum else None
+            ),
+        }
+
+    def get_file_info(self, path):
+        """Information about destination file captured during transfer.
+
+        Information is available for transferred and skipped files.
+
+        Args:
+            path (str): Destination path.
+
+        Returns:
+            Union[dict[str, Any], None]: File information with keys 'size',
+                'mtime', 'checksum' and 'checksum_algorithm'. Checksum is
+                None if 'file_checksum_algorithm' is not set.
+        """
+
+        dst = os.path.normpath(os.path.abspath(path))
+        with self._lock:
+            file_info = self._file_infos.get(dst)
+        if file_info is not None:
+            file_info = dict(file_info)
+        return file_info
 
     def finalize(self):
         # Delete any backed up files
@@ -190,6 +461,11 @@ class FileTransaction(object):
         """Return the processed transfers destination paths"""
         return list(self._transferred)
 
+    @property
+    def skipped(self):
+        """Return destination paths skipped because they already matched"""
+        return list(self._skipped)
+
     @property
     def backups(self):
         """Return the backup file paths"""
@@ -206,6 +482,29 @@ class FileTransaction(object):
                 self.log.critical("An unexpected error occurred.")
                 six.reraise(*sys.exc_info())
 
+    def _same_content(self, src, dst):
+        """Check if destination file already matches source file.
+
+        Args:
+            src (str): Source path.
+            dst (str): Existing destination path.
+
+        Returns:
+            bool: Files match.
+        """
+
+        src_stat = os.stat(src)
+        dst_stat = os.stat(dst)
+        if src_stat.st_size != dst_stat.st_size:
+            return False
+
+        if self._checksum_algorithm:
+            return (
+                get_file_checksum(src, self._checksum_algorithm)
+                == get_file_checksum(dst, self._checksum_algorithm)
+            )
+        return int(src_stat.st_mtime) == int(dst_stat.st_mtime)
+
     def _same_paths(self, src, dst):
         # handles same paths but with C:/project vs c:/project
         if os.path.exists(src) and os.path.exists(dst):
@@ -10,6 +10,7 @@ KEY_PATTERN = re.compile(r"(\{.*?[^{0]*\})")
 KEY_PADDING_PATTERN = re.compile(r"([^:]+)\S+[><]\S+")
 SUB_DICT_PATTERN = re.compile(r"([^\[\]]+)")
 OPTIONAL_PATTERN = re.compile(r"(<.*?[^{0]*>)[^0-9]*?")
+INDEX_MARKER_PATTERN = re.compile(r"\x00([0-9]+)\x00")
 
 
 def merge_dict(main_dict, enhance_dict):
@@ -182,6 +183,36 @@ class StringTemplate(object):
         result.validate()
         return result
 
+    def compile(self, data, index_key):
+        """Fill all keys except index key and prepare per index formatting.
+
+        Useful for sequences where only frame or udim is different for each
+        filled path. All other keys are resolved only once.
+
+        Args:
+            data (dict): Containing keys to be filled into template. Value
+                of index key is ignored.
+            index_key (str): Key which is filled with index, e.g. 'frame'
+                or 'udim'.
+
+        Returns:
+            CompiledStringTemplate: Object which can fill template with
+                index.
+        """
+        marker = _IndexMarker()
+        data = dict(data)
+        data[index_key] = marker
+        result = self.format(data)
+        return self._create_compiled(result, index_key, marker)
+
+    def _create_compiled(self, result, index_key, marker):
+        return CompiledStringTemplate(result, index_key, marker)
+
+    def compile_strict(self, *args, **kwargs):
+        compiled = self.compile(*args, **kwargs)
+        compiled.validate()
+        return compiled
+
     @classmethod
     def format_template(cls, template, data):
         objected_template = cls(template)
@@ -241,6 +272,93 @@ class StringTemplate(object):
         return new_parts
 
 
+class CompiledStringTemplate(object):
+    """Template with all keys filled except index key.
+
+    Output of template filled with index marker is converted to format
+    string which has index as the only argument. Filling of an index does
+    not have to process template parts again. Created using
+    'StringTemplate.compile'.
+
+    Args:
+        result (TemplateResult): Result of formatting with index marker.
+        index_key (str): Key which is filled with index.
+        marker (_IndexMarker): Marker used as value of index key.
+    """
+
+    def __init__(self, result, index_key, marker):
+        self._result = result
+        self._index_key = index_key
+        self._output_template = marker.to_format_string(str(result))
+        used_values = dict(result.used_values)
+        used_value_template = None
+        used_value = used_values.get(index_key)
+        if isinstance(used_value, six.string_types):
+            used_value_template = marker.to_format_string(used_value)
+        self._used_values = used_values
+        self._used_value_template = used_value_template
+
+    def __repr__(self):
+        return "<{}> {}".format(self.__class__.__name__, self.template)
+
+    @property
+    def template(self):
+        return self._result.template
+
+    @property
+    def index_key(self):
+        return self._index_key
+
+    @property
+    def solved(self):
+        return self._result.solved
+
+    def validate(self):
+        self._result.validate()
+
+    def format(self, index):
+        """Fill template with index.
+
+        Args:
+            index (int): Value of index key, e.g. frame or udim.
+
+        Returns:
+            TemplateResult: Filled template, same as result of
+                'StringTemplate.format' with index in data.
+        """
+        used_values = dict(self._used_values)
+        if self._used_value_template is not None:
+            used_values[self._index_key] = (
+                self._used_value_template.format(index)
+            )
+        return self._create_result(
+            self._output_template.format(index), used_values, index
+        )
+
+    def format_raw(self, value):
+        """Fill template with index value ignoring its format specification.
+
+        Args:
+            value (str): Already formatted index value, e.g. frame with
+                padding of source files.
+
+        Returns:
+            TemplateResult: Filled template.
+        """
+        return self.format(_RawIndexValue(value))
+
+    def _create_result(self, output, used_values, index):
+        result = self._result
+        return TemplateResult(
+            output,
+            result.template,
+            result.solved,
+            used_values,
+            result.missing_keys,
+            result.invalid_types
+        )
+
+
 class TemplatesDict(object):
     def __init__(self, templates=None):
         self._raw_templates = None
@@ -354,8 +472,68 @@ class TemplatesDict(object):
                 attribute set to True so accessing unfilled keys in templates
                 will raise exceptions with explaned error.
         """
-        # Create a copy of inserted data
-        data = copy.deepcopy(in_data)
+        data = self._prepare_format_data(in_data, only_keys)
+        # Templates are formatted when they're accessed
+        return LazyTemplatesResultDict(
+            self.objected_templates,
+            data,
+            self._format_value,
+            strict=strict
+        )
+
+    def format_key(self, category, key, in_data, only_keys=True, strict=True):
+        """Format only one template.
+
+        Faster alternative to 'format' when only one template is needed.
+
+        Args:
+            category (str): Templates category e.g. 'publish'.
+            key (str): Template key in category e.g. 'path'.
+            in_data (dict): Containing keys to be filled into template.
+            only_keys (bool, optional): Decides if environ will be used to
+                fill templates or only keys in data.
+            strict (bool, optional): Raise exception if template is not
+                solved.
+
+        Returns:
+            TemplateResult: Filled template.
+
+        Raises:
+            TemplateMissingKey: Template is not available.
+            TemplateUnsolved: Template is not solved and 'strict' is
+                enabled.
+        """
+        templates = self.objected_templates or {}
+        category_templates = templates.get(category)
+        if (
+            not isinstance(category_templates, dict)
+            or key not in category_templates
+        ):
+            raise TemplateMissingKey([category, key])
+
+        data = self._prepare_format_data(in_data, only_keys)
+        result = self._format_value(category_templates[key], data)
+        if isinstance(result, dict):
+            result = TemplatesResultDict(result, key, strict=strict)
+        elif strict and hasattr(result, "validate"):
+            result.validate()
+        return result
+
+    def _prepare_format_data(self, in_data, only_keys):
+        """Prepare data for formatting.
+
+        Input data are not deep copied, formatting does not change them.
+        Data must not be changed until results of 'format' are accessed.
+
+        Args:
+            in_data (dict): Containing keys to be filled into template.
+            only_keys (bool): Decides if environ will be used to fill
+                templates or only keys in data.
+
+        Returns:
+            dict: Data used for formatting.
+        """
+        data = dict(in_data)
 
         # Add environment variable to data
         if only_keys is False:
@@ -363,12 +541,7 @@ class TemplatesDict(object):
                 env_key = "$" + key
                 if env_key not in data:
                     data[env_key] = val
-
-        solved = self._solve_dict(self.objected_templates, data)
-
-        output = TemplatesResultDict(solved)
-        output.strict = strict
-        return output
+        return data
 
 
 class TemplateResult(str):
@@ -462,13 +635,13 @@ class TemplatesResultDict(dict):
             self.strict = True
 
     def __getitem__(self, key):
-        if key not in self.keys():
+        if key not in self:
             hier = self.hierarchy()
             hier.append(key)
             raise TemplateMissingKey(hier)
 
         value = super(TemplatesResultDict, self).__getitem__(key)
-        if isinstance(value, self.__class__):
+        if isinstance(value, TemplatesResultDict):
             return value
 
         # Raise exception when expected solved templates and it is not.
@@ -524,7 +697,7 @@ class TemplatesResultDict(dict):
         """Get only solved key from templates."""
         result = {}
         for key, value in self.items():
-            if isinstance(value, self.__class__):
+            if isinstance(value, TemplatesResultDict):
                 value = value.get_solved()
                 if not value:
                     continue
@@ -535,7 +708,129 @@ class TemplatesResultDict(dict):
                 value.solved
             ):
                 result[key] = value
-        return self.__class__(result, key=self.key, parent=self.parent)
+        return TemplatesResultDict(result, key=self.key, parent=self.parent)
+
+
+class _UnsolvedTemplate(object):
+    """Placeholder of template in 'LazyTemplatesResultDict' until formatted.
+    """
+
+    __slots__ = ()
+
+    def __repr__(self):
+        return "<Unsolved template>"
+
+
+_UNSOLVED_TEMPLATE = _UnsolvedTemplate()
+
+
+class LazyTemplatesResultDict(TemplatesResultDict):
+    """Templates result which formats templates when they're accessed.
+
+    Template is formatted on first access to its key. Iteration over items
+    or values formats all templates. All keys are filled with placeholder
+    on creation so the dictionary has the same keys and size as fully
+    formatted result, e.g. for 'json.dumps'.
+
+    Args:
+        templates (dict): Objected templates to format.
+        data (dict): Data used for formatting. Data are shared and must not
+            be changed until templates are formatted.
+        format_func (Callable[[Any, dict], Any]): Function which formats
+            template value with data.
+        key (Optional[str]): Key in parent result.
+        parent (Optional[TemplatesResultDict]): Parent result.
+        strict (Optional[bool]): Raise exception on unsolved templates.
+    """
+
+    def __init__(
+        self, templates, data, format_func, key=None, parent=None, strict=None
+    ):
+        super(LazyTemplatesResultDict, self).__init__(
+            {}, key, parent, strict
+        )
+        self._templates = templates
+        self._data = data
+        self._format_func = format_func
+        self._unsolved_keys = set(templates.keys())
+        for _key in templates.keys():
+            dict.__setitem__(self, _key, _UNSOLVED_TEMPLATE)
+
+    def _solve_key(self, key):
+        if key not in self._unsolved_keys:
+            return
+        self._unsolved_keys.discard(key)
+        value = self._templates[key]
+        if isinstance(value, dict):
+            value = LazyTemplatesResultDict(
+                value, self._data, self._format_func, key, self
+            )
+        else:
+            value = self._format_func(value, self._data)
+            if isinstance(value, dict):
+                value = TemplatesResultDict(value, key, self)
+        dict.__setitem__(self, key, value)
+
+    def _solve_all(self):
+        for key in tuple(self._unsolved_keys):
+            self._solve_key(key)
+
+    def __getitem__(self, key):
+        self._solve_key(key)
+        return super(LazyTemplatesResultDict, self).__getitem__(key)
+
+    def __iter__(self):
+        # Overriding '__iter__' disables fast copy of underlying dictionary
+        #   with placeholders in 'dict(...)' and 'dict.update(...)', which
+        #   then use '__getitem__'
+        return super(LazyTemplatesResultDict, self).__iter__()
+
+    def __setitem__(self, key, value):
+        self._unsolved_keys.discard(key)
+        super(LazyTemplatesResultDict, self).__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._unsolved_keys.discard(key)
+        super(LazyTemplatesResultDict, self).__delitem__(key)
+
+    def __eq__(self, other):
+        self._solve_all()
+        if isinstance(other, LazyTemplatesResultDict):
+            other._solve_all()
+        return super(LazyTemplatesResultDict, self).__eq__(other)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __repr__(self):
+        self._solve_all()
+        return super(LazyTemplatesResultDict, self).__repr__()
+
+    def get(self, key, *args, **kwargs):
+        self._solve_key(key)
+        return super(LazyTemplatesResultDict, self).get(key, *args, **kwargs)
+
+    def pop(self, key, *args, **kwargs):
+        self._solve_key(key)
+        return super(LazyTemplatesResultDict, self).pop(key, *args, **kwargs)
+
+    def setdefault(self, key, *args, **kwargs):
+        self._solve_key(key)
+        return super(LazyTemplatesResultDict, self).setdefault(
+            key, *args, **kwargs
+        )
+
+    def values(self):
+        self._solve_all()
+        return super(LazyTemplatesResultDict, self).values()
+
+    def items(self):
+        self._solve_all()
+        return super(LazyTemplatesResultDict, self).items()
+
+    def copy(self):
+        self._solve_all()
+        return super(LazyTemplatesResultDict, self).copy()
 
 
 class TemplatePartResult:
@@ -693,6 +988,62 @@ class FormatObject(object):
         return self.__str__()
 
 
+class _IndexMarker(FormatObject):
+    """Value of index key used to compile template.
+
+    Formatting of marker returns token with index of used format spec, so
+    the same spec can be applied to real index later.
+    """
+
+    def __init__(self):
+        super(_IndexMarker, self).__init__()
+        self._format_specs = []
+
+    def __copy__(self):
+        # Marker must stay the same object to collect used format specs
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __format__(self, format_spec):
+        if format_spec not in self._format_specs:
+            self._format_specs.append(format_spec)
+        return "\x00{}\x00".format(self._format_specs.index(format_spec))
+
+    def to_format_string(self, text):
+        """Convert text with marker tokens to format string.
+
+        Args:
+            text (str): Text containing marker tokens.
+
+        Returns:
+            str: Format string with index as positional argument.
+        """
+        parts = []
+        for idx, part in enumerate(INDEX_MARKER_PATTERN.split(text)):
+            if idx % 2 == 0:
+                parts.append(part.replace("{", "{{").replace("}", "}}"))
+            else:
+                parts.append(
+                    "{0:" + self._format_specs[int(part)] + "}"
+                )
+        return "".join(parts)
+
+
+class _RawIndexValue(object):
+    """Index value which ignores format specification of template."""
+
+    def __init__(self, value):
+        self._value = str(value)
+
+    def __str__(self):
+        return self._value
+
+    def __format__(self, format_spec):
+        return self._value
+
+
 class FormattingPart:
     """String with formatting template.
 
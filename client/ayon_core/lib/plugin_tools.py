@@ -65,8 +65,27 @@ def source_hash(filepath, *args):
     You can specify additional arguments in the function
     to allow for specific 'processing' values to be included.
     """
+    return source_hash_from_stat(
+        filepath,
+        os.path.getmtime(filepath),
+        os.path.getsize(filepath),
+        *args
+    )
+
+
+def source_hash_from_stat(filepath, mtime, size, *args):
+    """Generate 'source_hash' identifier from known file stats.
+
+    Same output as 'source_hash' without accessing the file, useful when
+    modification time and size of the file are already known.
+
+    Args:
+        filepath (str): The source file path.
+        mtime (float): Modification time of the file.
+        size (int): Size of the file in bytes.
+    """
     # We replace dots with comma because . cannot be a key in a pymongo dict.
     file_name = os.path.basename(filepath)
-    time = str(os.path.getmtime(filepath))
-    size = str(os.path.getsize(filepath))
-    return "|".join([file_name, time, size] + list(args)).replace(".", ",")
+    return "|".join(
+        [file_name, str(mtime), str(size)] + list(args)
+    ).replace(".", ",")
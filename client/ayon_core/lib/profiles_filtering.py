@@ -1,8 +1,12 @@
 import re
 import logging
+import collections
 
 log = logging.getLogger(__name__)
 
+# Characters which mark profile value as regex instead of literal value
+_REGEX_CHARS = set(".^$*+?{}[]\\|()")
+
 
 def compile_list_of_regexes(in_list):
     """Convert strings in entered list to compiled regex objects."""
@@ -152,24 +156,14 @@ def filter_profiles(profiles_data, key_values, keys_order=None, logger=None):
     if not logger:
         logger = log
 
-    if not keys_order:
-        keys_order = tuple(key_values.keys())
-    else:
-        _keys_order = list(keys_order)
-        # Make all keys from `key_values` are passed
-        for key in key_values.keys():
-            if key not in _keys_order:
-                _keys_order.append(key)
-        keys_order = tuple(_keys_order)
-
-    log_parts = " | ".join([
-        "{}: \"{}\"".format(*item)
-        for item in key_values.items()
-    ])
+    keys_order = _prepare_keys_order(key_values, keys_order)
 
-    logger.debug(
-        "Looking for matching profile for: {}".format(log_parts)
-    )
+    log_parts = None
+    if logger.isEnabledFor(logging.DEBUG):
+        log_parts = _get_log_parts(key_values)
+        logger.debug(
+            "Looking for matching profile for: {}".format(log_parts)
+        )
 
     matching_profiles = None
     highest_profile_points = -1
@@ -225,3 +219,245 @@ def filter_profiles(profiles_data, key_values, keys_order=None, logger=None):
             "Profile selected: {}".format(profile)
         )
     return profile
+
+
+def _get_log_parts(key_values):
+    return " | ".join([
+        "{}: \"{}\"".format(*item)
+        for item in key_values.items()
+    ])
+
+
+def _prepare_keys_order(key_values, keys_order):
+    if not keys_order:
+        return tuple(key_values.keys())
+
+    _keys_order = list(keys_order)
+    # Make all keys from `key_values` are passed
+    for key in key_values.keys():
+        if key not in _keys_order:
+            _keys_order.append(key)
+    return tuple(_keys_order)
+
+
+class _ProfileKeyIndex(object):
+    """Precompiled values of one key of all profiles.
+
+    Profiles are split into profiles with wildcard value (key is not set,
+    value is empty or contains "*"), literal values which are indexed by the
+    value and values which are regexes.
+
+    Args:
+        profiles_data (list[dict]): Profile definitions as dictionaries.
+        key (str): Key of profile value.
+    """
+
+    def __init__(self, profiles_data, key):
+        wildcard_indexes = set()
+        indexes_by_literal = collections.defaultdict(set)
+        regexes_by_index = {}
+        for idx, profile in enumerate(profiles_data):
+            in_list = profile.get(key)
+            if not in_list:
+                wildcard_indexes.add(idx)
+                continue
+
+            if not isinstance(in_list, (list, tuple, set)):
+                in_list = [in_list]
+
+            if "*" in in_list:
+                wildcard_indexes.add(idx)
+                continue
+
+            regex_items = []
+            for item in in_list:
+                if not item:
+                    continue
+                if (
+                    isinstance(item, str)
+                    and not _REGEX_CHARS.intersection(item)
+                ):
+                    indexes_by_literal[item].add(idx)
+                else:
+                    regex_items.append(item)
+
+            regexes = compile_list_of_regexes(regex_items)
+            if regexes:
+                regexes_by_index[idx] = regexes
+
+        self.wildcard_indexes = wildcard_indexes
+        self.indexes_by_literal = dict(indexes_by_literal)
+        self.regexes_by_index = regexes_by_index
+
+    def get_matching_indexes(self, value, indexes):
+        """Get profiles that match the value.
+
+        Args:
+            value (str): Value which should match the profile value.
+            indexes (Iterable[int]): Indexes of profiles to check.
+
+        Returns:
+            dict[int, int]: Match points (0 or 1) by profile index.
+        """
+        output = {}
+        for idx in indexes:
+            if idx in self.wildcard_indexes:
+                output[idx] = 0
+
+        # If value is not set and profile has specific values then resolve
+        #   value as not matching.
+        if not value:
+            return output
+
+        for idx in self.indexes_by_literal.get(value, ()):
+            if idx in indexes:
+                output[idx] = 1
+
+        for idx, regexes in self.regexes_by_index.items():
+            if idx in output or idx not in indexes:
+                continue
+            for regex in regexes:
+                if regex.fullmatch(value):
+                    output[idx] = 1
+                    break
+        return output
+
+
+class ProfileMatcher(object):
+    """Precompiled profiles for repeated filtering.
+
+    Result of 'match' is the same as result of 'filter_profiles' with same
+    profiles. Regexes are compiled only once and literal (non-regex) values
+    are indexed so only profiles which may match are checked.
+
+    Profiles must not be modified after the matcher is created.
+
+    Example:
+        >>> matcher = ProfileMatcher(profiles)
+        >>> profile = matcher.match({"hosts": "maya", "families": "model"})
+
+    Args:
+        profiles_data (list[dict]): Profile definitions as dictionaries.
+    """
+
+    def __init__(self, profiles_data):
+        self._profiles_data = list(profiles_data or [])
+        self._indexes_by_key = {}
+
+    @property
+    def profiles(self):
+        return self._profiles_data
+
+    def _get_key_index(self, key):
+        key_index = self._indexes_by_key.get(key)
+        if key_index is None:
+            key_index = _ProfileKeyIndex(self._profiles_data, key)
+            self._indexes_by_key[key] = key_index
+        return key_index
+
+    def match(self, key_values, keys_order=None, logger=None):
+        """Find most matching profile by entered key -> values.
+
+        Args:
+            key_values (dict): Mapping of Key <-> Value. Key is checked if is
+                available in profile and if Value is matching it's values.
+            keys_order (list, tuple): Order of keys from `key_values` which
+                matters only when multiple profiles have same score.
+            logger (logging.Logger): Optionally can be passed different
+                logger.
+
+        Returns:
+            dict/None: Return most matching profile or None if none of
+                profiles match at least one criteria.
+        """
+        if not self._profiles_data:
+            return None
+
+        if not logger:
+            logger = log
+
+        keys_order = _prepare_keys_order(key_values, keys_order)
+        candidates = set(range(len(self._profiles_data)))
+        points_by_key = []
+        for key in keys_order:
+            points_by_idx = self._get_key_index(key).get_matching_indexes(
+                key_values[key], candidates
+            )
+            candidates = set(points_by_idx.keys())
+            points_by_key.append(points_by_idx)
+            if not candidates:
+                break
+
+        matching_profiles = None
+        highest_profile_points = -1
+        for idx in sorted(candidates):
+            profile_scores = [
+                bool(points_by_idx[idx])
+                for points_by_idx in points_by_key
+            ]
+            profile_points = sum(profile_scores)
+            if profile_points < highest_profile_points:
+                continue
+
+            if profile_points > highest_profile_points:
+                matching_profiles = []
+                highest_profile_points = profile_points
+
+            matching_profiles.append(
+                (self._profiles_data[idx], profile_scores)
+            )
+
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        if not matching_profiles:
+            if debug_enabled:
+                logger.debug("None of profiles match your setup. {}".format(
+                    _get_log_parts(key_values)
+                ))
+            return None
+
+        if len(matching_profiles) > 1 and debug_enabled:
+            logger.debug(
+                "More than one profile match your setup. {}".format(
+                    _get_log_parts(key_values)
+                )
+            )
+
+        profile = _profile_exclusion(matching_profiles, logger)
+        if profile and debug_enabled:
+            logger.debug(
+                "Profile selected: {}".format(profile)
+            )
+        return profile
+
+
+class _ProfileMatchersCache:
+    max_items = 64
+    matchers = collections.OrderedDict()
+
+
+def get_profile_matcher(profiles_data):
+    """Get cached 'ProfileMatcher' for profiles.
+
+    Matchers are cached by identity of passed profiles object, so it is
+    useful for profiles which are kept in memory e.g. attributes of
+    publish plugins set from settings.
+
+    Args:
+        profiles_data (list[dict]): Profile definitions as dictionaries.
+
+    Returns:
+        ProfileMatcher: Matcher for the profiles.
+    """
+    key = id(profiles_data)
+    cache = _ProfileMatchersCache.matchers
+    item = cache.get(key)
+    # Compare identity as 'id' can be reused by other object
+    if item is not None and item[0] is profiles_data:
+        cache.move_to_end(key)
+        return item[1]
+
+    matcher = ProfileMatcher(profiles_data)
+    cache[key] = (profiles_data, matcher)
+    while len(cache) > _ProfileMatchersCache.max_items:
+        cache.popitem(last=False)
+    return matcher
@@ -1,5 +1,6 @@
 import os
 import sys
+import copy
 import types
 import importlib
 import inspect
@@ -45,11 +46,20 @@ def import_filepath(filepath, module_name=None):
     return module
 
 
-def modules_from_path(folder_path):
+def modules_from_path(folder_path, modules_cache=None, force=False):
     """Get python scripts as modules from a path.
 
+    Modules of files that did not change since last import are reused when
+    'modules_cache' is passed. Files are compared using modification time
+    and size.
+
     Arguments:
         path (str): Path to folder containing python scripts.
+        modules_cache (Optional[dict]): Cache of imported modules by file
+            path. It is filled by the function, it's content should not be
+            changed by caller.
+        force (Optional[bool]): Import all files again even if they are
+            cached.
 
     Returns:
         tuple<list, list>: First list contains successfully imported modules
@@ -88,17 +98,34 @@ def modules_from_path(folder_path):
         if not os.path.isfile(full_path):
             continue
 
+        cache_key = None
+        if modules_cache is not None:
+            stat = os.stat(full_path)
+            cache_key = (stat.st_mtime, stat.st_size)
+            cached = modules_cache.get(full_path)
+            if not force and cached is not None and cached[0] == cache_key:
+                module, exc_info = cached[1:]
+                if exc_info is None:
+                    modules.append((full_path, module))
+                else:
+                    crashed.append((full_path, exc_info))
+                continue
+
+        module = exc_info = None
         try:
             module = import_filepath(full_path, mod_name)
             modules.append((full_path, module))
 
         except Exception:
-            crashed.append((full_path, sys.exc_info()))
+            exc_info = sys.exc_info()
+            crashed.append((full_path, exc_info))
             log.warning(
                 "Failed to load path: \"{0}\"".format(full_path),
                 exc_info=True
             )
-            continue
+
+        if modules_cache is not None:
+            modules_cache[full_path] = (cache_key, module, exc_info)
 
     return output
 
@@ -139,6 +166,59 @@ def classes_from_module(superclass, module):
     return classes
 
 
+def _copy_class_attribute_value(value):
+    """Copy data attribute value, keep reference to other values.
+
+    Methods, descriptors (classmethod, staticmethod, property) and other
+    callables can't be changed by settings and some of them can't be copied,
+    so only their reference is stored.
+    """
+    if callable(value) or hasattr(type(value), "__get__"):
+        return value
+    try:
+        return copy.copy(value)
+    except TypeError:
+        return value
+
+
+def get_class_attributes(klass):
+    """Snapshot of attributes defined on class.
+
+    Snapshot can be used to restore class to its state before its
+    attributes were changed, e.g. by applied settings.
+
+    Arguments:
+        klass (type): Class of which attributes are stored.
+
+    Returns:
+        dict[str, Any]: Copy of attributes defined on the class.
+    """
+    return {
+        key: _copy_class_attribute_value(value)
+        for key, value in klass.__dict__.items()
+        if not key.startswith("__")
+    }
+
+
+def restore_class_attributes(klass, attributes):
+    """Restore attributes of class from snapshot.
+
+    Attributes which were added to class after snapshot was created are
+    removed.
+
+    Arguments:
+        klass (type): Class to restore.
+        attributes (dict[str, Any]): Snapshot from 'get_class_attributes'.
+    """
+    for key in tuple(klass.__dict__.keys()):
+        if not key.startswith("__") and key not in attributes:
+            delattr(klass, key)
+
+    for key, value in attributes.items():
+        if klass.__dict__.get(key) is not value:
+            setattr(klass, key, _copy_class_attribute_value(value))
+
+
 def _import_module_from_dirpath_py2(dirpath, module_name, dst_module_name):
     """Import passed dirpath as python module using `imp`."""
     if dst_module_name:
@@ -1,14 +1,20 @@
 import os
 import re
+import copy
+import math
 import logging
 import json
 import collections
 import tempfile
 import subprocess
 import platform
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import xml.etree.ElementTree
 
+import clique
+
 from .execute import run_subprocess
 from .vendor_bin_utils import (
     get_ffmpeg_tool_args,
@@ -18,6 +24,8 @@ from .vendor_bin_utils import (
 
 # Max length of string that is supported by ffmpeg
 MAX_FFMPEG_STRING_LEN = 8196
+# Max number of files probed by one oiiotool process
+OIIO_INFO_BATCH_SIZE = 50
 # Not allowed symbols in attributes for ffmpeg
 NOT_ALLOWED_FFMPEG_CHARS = ("\"", )
 
@@ -78,22 +86,67 @@ def get_transcode_temp_directory():
     )
 
 
-def get_oiio_info_for_input(filepath, logger=None, subimages=False):
-    """Call oiiotool to get information about input and return stdout.
+class _ProbeCache:
+    """Cache of probed file information shared in the process.
 
-    Stdout should contain xml format string.
+    Results are stored by file path, modification time, size and probe
+    arguments, so a changed file is probed again. Cached values are
+    copied on output so callers can modify them.
     """
-    args = get_oiio_tool_args(
-        "oiiotool",
-        "--info",
-        "-v"
-    )
-    if subimages:
-        args.append("-a")
-
-    args.extend(["-i:infoformat=xml", filepath])
 
-    output = run_subprocess(args, logger=logger)
+    max_items = 2048
+    _items = collections.OrderedDict()
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_key(cls, probe_type, filepath, *args):
+        """Cache key of a file or None if file can't be cached."""
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return None
+        return (
+            probe_type,
+            os.path.normpath(filepath),
+            stat.st_mtime,
+            stat.st_size,
+        ) + args
+
+    @classmethod
+    def get(cls, key):
+        if key is None:
+            return None
+        with cls._lock:
+            value = cls._items.get(key)
+            if value is None:
+                return None
+            cls._items.move_to_end(key)
+        return copy.deepcopy(value)
+
+    @classmethod
+    def set(cls, key, value):
+        if key is None:
+            return
+        value = copy.deepcopy(value)
+        with cls._lock:
+            cls._items[key] = value
+            cls._items.move_to_end(key)
+            while len(cls._items) > cls.max_items:
+                cls._items.popitem(last=False)
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._items.clear()
+
+
+def clear_probe_cache():
+    """Clear cached results of oiiotool and ffprobe probes."""
+    _ProbeCache.clear()
+
+
+def _split_oiio_info_output(output):
+    """Split oiiotool info output to xml strings of subimages."""
     output = output.replace("\r\n", "\n")
 
     xml_started = False
@@ -108,11 +161,26 @@ def get_oiio_info_for_input(filepath, logger=None, subimages=False):
         if xml_started:
             lines.append(line)
             if line == "</ImageSpec>":
-                subimages_lines.append(lines)
+                subimages_lines.append("\n".join(lines))
                 lines = []
                 xml_started = False
+    return subimages_lines
 
-    if not subimages_lines:
+
+def _get_oiio_info_for_input(filepath, logger=None, subimages=False):
+    args = get_oiio_tool_args(
+        "oiiotool",
+        "--info",
+        "-v"
+    )
+    if subimages:
+        args.append("-a")
+
+    args.extend(["-i:infoformat=xml", filepath])
+
+    output = run_subprocess(args, logger=logger)
+    subimages_xml = _split_oiio_info_output(output)
+    if not subimages_xml:
         raise ValueError(
             "Failed to read input file \"{}\".\nOutput:\n{}".format(
                 filepath, output
@@ -120,8 +188,7 @@ def get_oiio_info_for_input(filepath, logger=None, subimages=False):
         )
 
     output = []
-    for subimage_lines in subimages_lines:
-        xml_text = "\n".join(subimage_lines)
+    for xml_text in subimages_xml:
         output.append(parse_oiio_xml_output(xml_text, logger=logger))
 
     if subimages:
@@ -129,6 +196,120 @@ def get_oiio_info_for_input(filepath, logger=None, subimages=False):
     return output[0]
 
 
+def get_oiio_info_for_input(filepath, logger=None, subimages=False):
+    """Call oiiotool to get information about input and return stdout.
+
+    Stdout should contain xml format string.
+
+    Results are cached in the process until the file is changed.
+    """
+    key = _ProbeCache.get_key("oiio", filepath, bool(subimages))
+    output = _ProbeCache.get(key)
+    if output is None:
+        output = _get_oiio_info_for_input(filepath, logger, subimages)
+        _ProbeCache.set(key, output)
+    return output
+
+
+def get_oiio_info_for_inputs(
+    filepaths, logger=None, subimages=False, max_workers=None
+):
+    """Get information about multiple inputs using oiiotool.
+
+    Files which are not cached are probed by one oiiotool process
+    per batch of files. When subimages are requested each file is probed
+    by its own process, running in parallel, as subimages of different
+    files can't be separated in the output.
+
+    Args:
+        filepaths (Iterable[str]): Paths to files.
+        logger (Optional[logging.Logger]): Logger used for logging.
+        subimages (Optional[bool]): Return information about all
+            subimages.
+        max_workers (Optional[int]): Max number of processes running
+            at the same time.
+
+    Returns:
+        dict[str, Union[dict, list[dict]]]: Information about inputs by
+            their path.
+    """
+    output = {}
+    missing_paths = []
+    for filepath in filepaths:
+        if filepath in output or filepath in missing_paths:
+            continue
+        key = _ProbeCache.get_key("oiio", filepath, bool(subimages))
+        info = _ProbeCache.get(key)
+        if info is None:
+            missing_paths.append(filepath)
+        else:
+            output[filepath] = info
+
+    if not missing_paths:
+        return output
+
+    def probe_batch(batch_paths):
+        if subimages or len(batch_paths) == 1:
+            return [
+                (
+                    filepath,
+                    get_oiio_info_for_input(filepath, logger, subimages)
+                )
+                for filepath in batch_paths
+            ]
+
+        args = get_oiio_tool_args(
+            "oiiotool",
+            "--info",
+            "-v"
+        )
+        for filepath in batch_paths:
+            args.extend(["-i:infoformat=xml", filepath])
+
+        subimages_xml = None
+        try:
+            subimages_xml = _split_oiio_info_output(
+                run_subprocess(args, logger=logger)
+            )
+        except RuntimeError:
+            pass
+
+        # Probe files one by one if output can't be matched to files
+        #   e.g. when one of files can't be read
+        if subimages_xml is None or len(subimages_xml) != len(batch_paths):
+            return [
+                (filepath, get_oiio_info_for_input(filepath, logger))
+                for filepath in batch_paths
+            ]
+
+        batch_output = []
+        for filepath, xml_text in zip(batch_paths, subimages_xml):
+            info = parse_oiio_xml_output(xml_text, logger=logger)
+            _ProbeCache.set(
+                _ProbeCache.get_key("oiio", filepath, False), info
+            )
+            batch_output.append((filepath, info))
+        return batch_output
+
+    batch_size = 1 if subimages else OIIO_INFO_BATCH_SIZE
+    batches = [
+        missing_paths[idx:idx + batch_size]
+        for idx in range(0, len(missing_paths), batch_size)
+    ]
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(batches)))
+    if max_workers == 1:
+        for batch_paths in batches:
+            output.update(probe_batch(batch_paths))
+        return output
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for batch_output in executor.map(probe_batch, batches):
+            output.update(batch_output)
+    return output
+
+
 class RationalToInt:
     """Rational value stored as division of 2 integers using string."""
 
@@ -656,10 +837,59 @@ def convert_for_ffmpeg(
     run_subprocess(oiio_cmd, logger=logger)
 
 
+def _get_oiio_conversion_batches(input_paths, max_workers):
+    """Split input paths to batches that can be converted by single oiiotool.
+
+    Contiguous frame ranges of a sequence are converted using '--frames'
+    argument. Ranges are split to smaller batches so they can be processed
+    in parallel by 'max_workers'. Files that are not part of a sequence
+    are converted one by one.
+
+    Args:
+        input_paths (list[str]): Paths of single file or image sequence.
+        max_workers (int): Number of conversions running at the same time.
+
+    Returns:
+        list[tuple[str, Union[str, None]]]: Input path or path template
+            with frame range for '--frames' argument if is sequence.
+    """
+    sequences, remainders = clique.assemble(
+        input_paths,
+        patterns=[clique.PATTERNS["frames"]],
+        assume_padded_when_ambiguous=True
+    )
+    ranges = []
+    for collection in sequences:
+        for sub_collection in collection.separate():
+            ranges.append((
+                sub_collection.format("{head}{padding}{tail}"),
+                sorted(sub_collection.indexes)
+            ))
+
+    batches = [(path, None) for path in remainders]
+    if not ranges:
+        return batches
+
+    frames_count = sum(len(indexes) for _, indexes in ranges)
+    batch_size = max(1, int(math.ceil(float(frames_count) / max_workers)))
+    for path_template, indexes in ranges:
+        for idx in range(0, len(indexes), batch_size):
+            batch_indexes = indexes[idx:idx + batch_size]
+            if len(batch_indexes) == 1:
+                frame_range = str(batch_indexes[0])
+            else:
+                frame_range = "{}-{}".format(
+                    batch_indexes[0], batch_indexes[-1]
+                )
+            batches.append((path_template, frame_range))
+    return batches
+
+
 def convert_input_paths_for_ffmpeg(
     input_paths,
     output_dir,
-    logger=None
+    logger=None,
+    max_workers=None
 ):
     """Convert source file to format supported in ffmpeg.
 
@@ -672,12 +902,18 @@ def convert_input_paths_for_ffmpeg(
     - This way it can handle gaps and can keep input filenames without handling
         frame template
 
+    Contiguous frame ranges of image sequence are converted in batches
+    by single 'oiiotool' process using '--frames' argument and the batches
+    are processed in parallel.
+
     Args:
         input_paths (str): Paths that should be converted. It is expected that
             contains single file or image sequence of same type.
         output_dir (str): Path to directory where output will be rendered.
             Must not be same as input's directory.
         logger (logging.Logger): Logger used for logging.
+        max_workers (Optional[int]): Number of 'oiiotool' processes running
+            at the same time. Number of CPU cores is used if not passed.
 
     Raises:
         ValueError: If input filepath has extension not supported by function.
@@ -686,6 +922,9 @@ def convert_input_paths_for_ffmpeg(
     if logger is None:
         logger = logging.getLogger(__name__)
 
+    if not max_workers:
+        max_workers = os.cpu_count() or 1
+
     first_input_path = input_paths[0]
     ext = os.path.splitext(first_input_path)[1].lower()
 
@@ -706,7 +945,41 @@ def convert_input_paths_for_ffmpeg(
     # Collect channels to export
     input_arg, channels_arg = get_oiio_input_and_channel_args(input_info)
 
-    for input_path in input_paths:
+    erase_args = []
+    for attr_name, attr_value in input_info["attribs"].items():
+        if not isinstance(attr_value, str):
+            continue
+
+        # Remove attributes that have string value longer than allowed
+        #   length for ffmpeg or when containing prohibited symbols
+        erase_reason = "Missing reason"
+        erase_attribute = False
+        if len(attr_value) > MAX_FFMPEG_STRING_LEN:
+            erase_reason = "has too long value ({} chars).".format(
+                len(attr_value)
+            )
+            erase_attribute = True
+
+        if not erase_attribute:
+            for char in NOT_ALLOWED_FFMPEG_CHARS:
+                if char in attr_value:
+                    erase_attribute = True
+                    erase_reason = (
+                        "contains unsupported character \"{}\"."
+                    ).format(char)
+                    break
+
+        if erase_attribute:
+            # Set attribute to empty string
+            logger.info((
+                "Removed attribute \"{}\" from metadata because {}."
+            ).format(attr_name, erase_reason))
+            erase_args.extend(["--eraseattrib", attr_name])
+
+    oiio_cmds = []
+    for input_path, frame_range in _get_oiio_conversion_batches(
+        input_paths, max_workers
+    ):
         # Prepare subprocess arguments
         oiio_cmd = get_oiio_tool_args(
             "oiiotool",
@@ -717,6 +990,10 @@ def convert_input_paths_for_ffmpeg(
         if compression:
             oiio_cmd.extend(["--compression", compression])
 
+        # Convert contiguous frame range using one process
+        if frame_range is not None:
+            oiio_cmd.extend(["--frames", frame_range])
+
         oiio_cmd.extend([
             input_arg, input_path,
             # Tell oiiotool which channels should be put to top stack
@@ -725,36 +1002,7 @@ def convert_input_paths_for_ffmpeg(
             # Use first subimage
             "--subimage", "0"
         ])
-
-        for attr_name, attr_value in input_info["attribs"].items():
-            if not isinstance(attr_value, str):
-                continue
-
-            # Remove attributes that have string value longer than allowed
-            #   length for ffmpeg or when containing prohibited symbols
-            erase_reason = "Missing reason"
-            erase_attribute = False
-            if len(attr_value) > MAX_FFMPEG_STRING_LEN:
-                erase_reason = "has too long value ({} chars).".format(
-                    len(attr_value)
-                )
-                erase_attribute = True
-
-            if not erase_attribute:
-                for char in NOT_ALLOWED_FFMPEG_CHARS:
-                    if char in attr_value:
-                        erase_attribute = True
-                        erase_reason = (
-                            "contains unsupported character \"{}\"."
-                        ).format(char)
-                        break
-
-            if erase_attribute:
-                # Set attribute to empty string
-                logger.info((
-                    "Removed attribute \"{}\" from metadata because {}."
-                ).format(attr_name, erase_reason))
-                oiio_cmd.extend(["--eraseattrib", attr_name])
+        oiio_cmd.extend(erase_args)
 
         # Add last argument - path to output
         base_filename = os.path.basename(input_path)
@@ -762,19 +1010,72 @@ def convert_input_paths_for_ffmpeg(
         oiio_cmd.extend([
             "-o", output_path
         ])
+        oiio_cmds.append(oiio_cmd)
 
+    def _run_conversion(oiio_cmd):
         logger.debug("Conversion command: {}".format(" ".join(oiio_cmd)))
         run_subprocess(oiio_cmd, logger=logger)
 
+    if max_workers < 2 or len(oiio_cmds) < 2:
+        for oiio_cmd in oiio_cmds:
+            _run_conversion(oiio_cmd)
+        return
+
+    # Each worker only waits for 'oiiotool' subprocess so threads are
+    #   enough to run the conversions in parallel
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Use 'list' to re-raise first error of conversions
+        list(executor.map(_run_conversion, oiio_cmds))
+
 
 # FFMPEG functions
 def get_ffprobe_data(path_to_file, logger=None):
     """Load data about entered filepath via ffprobe.
 
+    Results are cached in the process until the file is changed.
+
     Args:
         path_to_file (str): absolute path
         logger (logging.Logger): injected logger, if empty new is created
     """
+    key = _ProbeCache.get_key("ffprobe", path_to_file)
+    output = _ProbeCache.get(key)
+    if output is None:
+        output = _get_ffprobe_data(path_to_file, logger)
+        _ProbeCache.set(key, output)
+    return output
+
+
+def get_ffprobe_data_for_inputs(paths, logger=None, max_workers=None):
+    """Load data about multiple files via ffprobe running in parallel.
+
+    Args:
+        paths (Iterable[str]): Paths to files.
+        logger (Optional[logging.Logger]): Logger used for logging.
+        max_workers (Optional[int]): Max number of processes running
+            at the same time.
+
+    Returns:
+        dict[str, dict]: Ffprobe data by path.
+    """
+    paths = list(collections.OrderedDict.fromkeys(paths))
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(paths)))
+    if max_workers == 1:
+        return {
+            path: get_ffprobe_data(path, logger)
+            for path in paths
+        }
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(
+            paths,
+            executor.map(lambda path: get_ffprobe_data(path, logger), paths)
+        ))
+
+
+def _get_ffprobe_data(path_to_file, logger=None):
     if not logger:
         logger = logging.getLogger(__name__)
     logger.debug(
@@ -1131,10 +1432,61 @@ def convert_colorspace(
     Raises:
         ValueError: if misconfigured
     """
+    convert_colorspace_multiple_outputs(
+        input_path,
+        [{
+            "output_path": output_path,
+            "target_colorspace": target_colorspace,
+            "view": view,
+            "display": display,
+            "additional_command_args": additional_command_args,
+        }],
+        config_path,
+        source_colorspace,
+        logger=logger
+    )
+
+
+def convert_colorspace_multiple_outputs(
+    input_path,
+    output_definitions,
+    config_path,
+    source_colorspace,
+    logger=None,
+    input_info=None,
+):
+    """Convert source file to multiple outputs with single read of source.
+
+    Input is read only once and each output converts duplicate of the
+    source image in oiiotool stack ('--dup', '--pop').
+
+    Additional command arguments of oiiotool, like '-d', are usually applied
+    to all following outputs. Outputs with different additional arguments
+    should be converted with separated calls.
+
+    Args:
+        input_path (str): Path that should be converted. It is expected that
+            contains single file or image sequence of same type
+            (sequence in format 'file.FRAMESTART-FRAMEEND#.ext', see oiio docs,
+            eg `big.1-3#.tif`)
+        output_definitions (list[dict[str, Any]]): Output definitions with
+            keys 'output_path', 'target_colorspace', 'view', 'display' and
+            'additional_command_args'. Values have same meaning as arguments
+            of 'convert_colorspace'.
+        config_path (str): path to OCIO config file
+        source_colorspace (str): ocio valid color space of source files
+        logger (logging.Logger): Logger used for logging.
+        input_info (Optional[dict[str, Any]]): Information about input from
+            'get_oiio_info_for_input', input is probed if not passed.
+
+    Raises:
+        ValueError: if misconfigured
+    """
     if logger is None:
         logger = logging.getLogger(__name__)
 
-    input_info = get_oiio_info_for_input(input_path, logger=logger)
+    if input_info is None:
+        input_info = get_oiio_info_for_input(input_path, logger=logger)
 
     # Collect channels to export
     input_arg, channels_arg = get_oiio_input_and_channel_args(input_info)
@@ -1156,25 +1508,38 @@ def convert_colorspace(
         "--subimage", "0"
     ])
 
-    if all([target_colorspace, view, display]):
-        raise ValueError("Colorspace and both screen and display"
-                         " cannot be set together."
-                         "Choose colorspace or screen and display")
-    if not target_colorspace and not all([view, display]):
-        raise ValueError("Both screen and display must be set.")
-
-    if additional_command_args:
-        oiio_cmd.extend(additional_command_args)
-
-    if target_colorspace:
-        oiio_cmd.extend(["--colorconvert",
-                         source_colorspace,
-                         target_colorspace])
-    if view and display:
-        oiio_cmd.extend(["--iscolorspace", source_colorspace])
-        oiio_cmd.extend(["--ociodisplay", display, view])
-
-    oiio_cmd.extend(["-o", output_path])
+    last_idx = len(output_definitions) - 1
+    for idx, output_def in enumerate(output_definitions):
+        target_colorspace = output_def.get("target_colorspace")
+        view = output_def.get("view")
+        display = output_def.get("display")
+        if all([target_colorspace, view, display]):
+            raise ValueError("Colorspace and both screen and display"
+                             " cannot be set together."
+                             "Choose colorspace or screen and display")
+        if not target_colorspace and not all([view, display]):
+            raise ValueError("Both screen and display must be set.")
+
+        # Keep source image in stack for next outputs
+        if idx != last_idx:
+            oiio_cmd.append("--dup")
+
+        additional_command_args = output_def.get("additional_command_args")
+        if additional_command_args:
+            oiio_cmd.extend(additional_command_args)
+
+        if target_colorspace:
+            oiio_cmd.extend(["--colorconvert",
+                             source_colorspace,
+                             target_colorspace])
+        if view and display:
+            oiio_cmd.extend(["--iscolorspace", source_colorspace])
+            oiio_cmd.extend(["--ociodisplay", display, view])
+
+        oiio_cmd.extend(["-o", output_def["output_path"]])
+
+        if idx != last_idx:
+            oiio_cmd.append("--pop")
 
     logger.debug("Conversion command: {}".format(" ".join(oiio_cmd)))
     run_subprocess(oiio_cmd, logger=logger)
@@ -84,9 +84,9 @@ class CelactionSubmitDeadline(pyblish.api.InstancePlugin):
                 template_data["representation"] = rep
                 template_data["ext"] = rep
                 template_data["comment"] = None
-                anatomy_filled = instance.context.data["anatomy"].format(
-                    template_data)
-                template_filled = anatomy_filled["publish"]["path"]
+                anatomy = instance.context.data["anatomy"]
+                template_filled = anatomy.format_key(
+                    "publish", "path", template_data)
                 script_path = os.path.normpath(template_filled)
 
                 self.log.info(
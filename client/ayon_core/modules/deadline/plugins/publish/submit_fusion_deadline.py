@@ -133,8 +133,9 @@ class FusionSubmitDeadline(
                 template_data["representation"] = rep
                 template_data["ext"] = rep
                 template_data["comment"] = None
-                anatomy_filled = context.data["anatomy"].format(template_data)
-                template_filled = anatomy_filled["publish"]["path"]
+                anatomy = context.data["anatomy"]
+                template_filled = anatomy.format_key(
+                    "publish", "path", template_data)
                 script_path = os.path.normpath(template_filled)
 
                 self.log.info(
@@ -17,6 +17,7 @@ from ayon_core.lib.path_templates import (
     TemplateUnsolved,
     TemplateResult,
     StringTemplate,
+    CompiledStringTemplate,
     TemplatesDict,
     FormatObject,
 )
@@ -114,6 +115,10 @@ class BaseAnatomy(object):
         """Wrap `format_all` method of Anatomy's `templates_obj`."""
         return self._templates_obj.format_all(*args, **kwargs)
 
+    def format_key(self, *args, **kwargs):
+        """Wrap `format_key` method of Anatomy's `templates_obj`."""
+        return self._templates_obj.format_key(*args, **kwargs)
+
     @property
     def roots(self):
         """Wrap `roots` property of Anatomy's `roots_obj`."""
@@ -145,6 +150,14 @@ class BaseAnatomy(object):
         """Wrapper for Roots `path_remapper`."""
         return self.roots_obj.path_remapper(*args, **kwargs)
 
+    def rootless_paths(self, *args, **kwargs):
+        """Wrapper for Roots `rootless_paths`."""
+        return self.roots_obj.rootless_paths(*args, **kwargs)
+
+    def remap_paths(self, *args, **kwargs):
+        """Wrapper for Roots `remap_paths`."""
+        return self.roots_obj.remap_paths(*args, **kwargs)
+
     def all_root_paths(self):
         """Wrapper for Roots `all_root_paths`."""
         return self.roots_obj.all_root_paths()
@@ -602,12 +615,37 @@ class AnatomyStringTemplate(StringTemplate):
 
         anatomy_templates = self.anatomy_templates
         if not data.get("root"):
-            data = copy.deepcopy(data)
+            data = dict(data)
             data["root"] = anatomy_templates.anatomy.roots
         result = StringTemplate.format(self, data)
         rootless_path = anatomy_templates.rootless_path_from_result(result)
         return AnatomyTemplateResult(result, rootless_path)
 
+    def _create_compiled(self, result, index_key, marker):
+        return CompiledAnatomyStringTemplate(result, index_key, marker)
+
+
+class CompiledAnatomyStringTemplate(CompiledStringTemplate):
+    """Compiled anatomy template which does fill also rootless path."""
+
+    def __init__(self, result, index_key, marker):
+        super(CompiledAnatomyStringTemplate, self).__init__(
+            result, index_key, marker
+        )
+        rootless_template = None
+        if result.rootless is not None:
+            rootless_template = marker.to_format_string(result.rootless)
+        self._rootless_template = rootless_template
+
+    def _create_result(self, output, used_values, index):
+        result = super(CompiledAnatomyStringTemplate, self)._create_result(
+            output, used_values, index
+        )
+        rootless_path = None
+        if self._rootless_template is not None:
+            rootless_path = self._rootless_template.format(index)
+        return AnatomyTemplateResult(result, rootless_path)
+
 
 class AnatomyTemplates(TemplatesDict):
     inner_key_pattern = re.compile(r"(\{@.*?[^{}0]*\})")
@@ -953,14 +991,14 @@ class AnatomyTemplates(TemplatesDict):
 
         return output
 
-    def format(self, data, strict=True):
-        copy_data = copy.deepcopy(data)
+    def _prepare_format_data(self, in_data, only_keys):
+        data = super(AnatomyTemplates, self)._prepare_format_data(
+            in_data, only_keys
+        )
         roots = self.roots
         if roots:
-            copy_data["root"] = roots
-        result = super(AnatomyTemplates, self).format(copy_data)
-        result.strict = strict
-        return result
+            data["root"] = roots
+        return data
 
     def format_all(self, in_data, only_keys=True):
         """ Solves templates based on entered data.
@@ -1199,6 +1237,171 @@ class RootItem(FormatObject):
         return (result, output)
 
 
+class RootsPrefixIndex(object):
+    """Prebuilt table of root prefixes for bulk path resolution.
+
+    Root values of all platforms are cleaned once when the index is created,
+    so resolving of a path is only comparison of prefixes. Prefixes are kept
+    in order of roots and their platforms, so the first matching root is
+    the same as with 'Roots.find_root_template_from_path'.
+
+    Args:
+        roots (Union[RootItem, dict[str, Any]]): Roots of project.
+    """
+
+    def __init__(self, roots):
+        self.roots = roots
+        entries = []
+        for root_item in self._iter_root_items(roots):
+            prefixes = []
+            for root_os, root_path in root_item.cleaned_data.items():
+                # Skip empty paths
+                if not root_path:
+                    continue
+                # Windows paths are not case sensitive
+                if root_os == "windows":
+                    prefixes.append((root_path.lower(), True))
+                else:
+                    prefixes.append((root_path, False))
+            replacement = "{" + root_item.full_key() + "}"
+            entries.append((root_item, replacement, prefixes))
+        self._entries = entries
+
+    @classmethod
+    def _iter_root_items(cls, roots):
+        if isinstance(roots, RootItem):
+            yield roots
+            return
+
+        for value in roots.values():
+            for root_item in cls._iter_root_items(value):
+                yield root_item
+
+    @staticmethod
+    def _match_prefixes(prefixes, path, lower_path):
+        """Length of matching root prefix in path.
+
+        Returns:
+            Union[int, None]: Length of prefix or None if no prefix matches.
+        """
+        for prefix, is_lower in prefixes:
+            if is_lower:
+                if lower_path.startswith(prefix):
+                    return len(prefix)
+            elif path.startswith(prefix):
+                return len(prefix)
+        return None
+
+    def find_root(self, path):
+        """Find root of path and replace it with formatting key.
+
+        Args:
+            path (str): Path where root is searched.
+
+        Returns:
+            tuple[Union[RootItem, None], str]: Matching root item and path
+                with replaced root, or None and unchanged path.
+        """
+        mod_path = str(path).replace("\\", "/")
+        lower_path = mod_path.lower()
+        for root_item, replacement, prefixes in self._entries:
+            length = self._match_prefixes(prefixes, mod_path, lower_path)
+            if length is not None:
+                return root_item, replacement + mod_path[length:]
+        return None, str(path)
+
+    def rootless_paths(self, paths):
+        """Replace root values with formatting keys in paths.
+
+        Args:
+            paths (Iterable[str]): Paths with root values.
+
+        Returns:
+            list[Union[str, None]]: Rootless paths in order of input paths.
+                Item is None if path does not start with any root.
+        """
+        output = []
+        for path in paths:
+            root_item, rootless_path = self.find_root(path)
+            if root_item is None:
+                rootless_path = None
+            output.append(rootless_path)
+        return output
+
+    def remap_paths(self, paths, dst_platform=None, src_platform=None):
+        """Remap paths for specific platform.
+
+        Result of each path is the same as result of 'Roots.path_remapper'
+        for path which does not contain formatting keys.
+
+        Args:
+            paths (Iterable[str]): Source paths which need to be remapped.
+            dst_platform (Optional[str]): Destination platform for which
+                remapping should happen.
+            src_platform (Optional[str]): Source platform.
+
+        Returns:
+            list[Union[str, None]]: Remapped paths in order of input paths.
+                Item is None if path does not start with any root.
+        """
+        entries = []
+        for root_item, _, prefixes in self._entries:
+            dst_root = None
+            if dst_platform:
+                dst_root = root_item.cleaned_data.get(dst_platform)
+                if not dst_root:
+                    log.warning(
+                        "Root \"{}\" miss platform \"{}\" definition.".format(
+                            root_item.full_key(), dst_platform
+                        )
+                    )
+                    continue
+
+            src_root = None
+            if src_platform:
+                src_root = root_item.cleaned_data.get(src_platform)
+                if src_root is None:
+                    log.warning(
+                        "Root \"{}\" miss platform \"{}\" definition.".format(
+                            root_item.full_key(), src_platform
+                        )
+                    )
+                    continue
+
+            if dst_root:
+                target_root = dst_root
+            elif src_root is not None:
+                target_root = root_item.clean_value
+            else:
+                target_root = str(root_item.value)
+            entries.append((dst_root, src_root, target_root, prefixes))
+
+        output = []
+        for path in paths:
+            cleaned_path = str(path).replace("\\", "/")
+            lower_path = cleaned_path.lower()
+            result = None
+            for dst_root, src_root, target_root, prefixes in entries:
+                if dst_root and cleaned_path.startswith(dst_root):
+                    result = cleaned_path
+                    break
+
+                if src_root is not None:
+                    if cleaned_path.startswith(src_root):
+                        result = target_root + cleaned_path[len(src_root):]
+                        break
+                    continue
+
+                length = self._match_prefixes(
+                    prefixes, cleaned_path, lower_path
+                )
+                if length is not None:
+                    result = target_root + cleaned_path[length:]
+                    break
+            output.append(result)
+        return output
+
+
 class Roots:
     """Object which should be used for formatting "root" key in templates.
 
@@ -1213,6 +1416,7 @@ class Roots:
         self.anatomy = anatomy
         self.loaded_project = None
         self._roots = None
+        self._prefix_index = None
 
     def __format__(self, *args, **kwargs):
         return self.roots.__format__(*args, **kwargs)
@@ -1223,6 +1427,69 @@ class Roots:
     def reset(self):
         """Reset current roots value."""
         self._roots = None
+        self._prefix_index = None
+
+    @property
+    def prefix_index(self):
+        """Prefix index of current roots.
+
+        Returns:
+            RootsPrefixIndex: Index created from current roots.
+        """
+        roots = self.roots
+        if roots is None:
+            raise ValueError("Roots are not set. Can't find path.")
+
+        if self._prefix_index is None or self._prefix_index.roots is not roots:
+            self._prefix_index = RootsPrefixIndex(roots)
+        return self._prefix_index
+
+    def rootless_paths(self, paths):
+        """Replace root values with formatting keys in multiple paths.
+
+        Args:
+            paths (Iterable[str]): Paths with root values.
+
+        Returns:
+            list[Union[str, None]]: Rootless paths in order of input paths.
+                Item is None if path does not start with any root.
+        """
+        return self.prefix_index.rootless_paths(paths)
+
+    def remap_paths(self, paths, dst_platform=None, src_platform=None):
+        """Remap multiple paths for specific platform.
+
+        Args:
+            paths (Iterable[str]): Source paths which need to be remapped.
+            dst_platform (Optional[str]): Destination platform for which
+                remapping should happen.
+            src_platform (Optional[str]): Source platform.
+
+        Returns:
+            list[Union[str, None]]: Remapped paths in order of input paths.
+                Item is None if path does not contain known root.
+        """
+        roots = self.roots
+        output = []
+        paths_to_remap = []
+        indexes_to_remap = []
+        for path in paths:
+            if "{root" in path:
+                path = path.format(**{"root": roots})
+                if not dst_platform:
+                    output.append(path)
+                    continue
+            indexes_to_remap.append(len(output))
+            paths_to_remap.append(path)
+            output.append(None)
+
+        if paths_to_remap:
+            remapped_paths = self.prefix_index.remap_paths(
+                paths_to_remap, dst_platform, src_platform
+            )
+            for idx, path in zip(indexes_to_remap, remapped_paths):
+                output[idx] = path
+        return output
 
     def path_remapper(
         self, path, dst_platform=None, src_platform=None, roots=None
@@ -1246,10 +1513,7 @@ class Roots:
                 or "{root[<name>]}".
         """
         if roots is None:
-            roots = self.roots
-
-        if roots is None:
-            raise ValueError("Roots are not set. Can't find path.")
+            return self.remap_paths([path], dst_platform, src_platform)[0]
 
         if "{root" in path:
             path = path.format(**{"root": roots})
@@ -1287,10 +1551,16 @@ class Roots:
             log.debug(
                 "Looking for matching root in path \"{}\".".format(path)
             )
-            roots = self.roots
-
-        if roots is None:
-            raise ValueError("Roots are not set. Can't find path.")
+            root_item, result = self.prefix_index.find_root(path)
+            if root_item is None:
+                log.warning("No matching root was found in current setting.")
+                return (False, path)
+
+            if root_item.name:
+                log.info("Found match in root \"{}\".".format(
+                    root_item.parent_keys[0]
+                ))
+            return True, result
 
         if isinstance(roots, RootItem):
             return roots.find_root_template_from_path(path)
@@ -1,10 +1,13 @@
 import re
 import os
 import json
+import atexit
 import contextlib
 import functools
 import platform
 import tempfile
+import threading
+import subprocess
 import warnings
 from copy import deepcopy
 
@@ -13,8 +16,10 @@ from ayon_core.settings import get_project_settings
 from ayon_core.lib import (
     StringTemplate,
     run_ayon_launcher_process,
+    get_ayon_launcher_args,
     Logger
 )
+from ayon_core.lib.execute import clean_envs_for_ayon_process
 from ayon_core.pipeline import Anatomy
 from ayon_core.lib.transcoding import VIDEO_EXTENSIONS, IMAGE_EXTENSIONS
 
@@ -120,6 +125,169 @@ def get_ocio_config_script_path():
     )
 
 
+class OCIOWorkerConnectionError(RuntimeError):
+    """Communication with OCIO wrapper worker process failed."""
+    pass
+
+
+class OCIOWrapperWorker(object):
+    """Long running OCIO wrapper process used by hosts without OCIO.
+
+    Process is started lazily on first request and is used for all
+    following requests so it is not needed to start new AYON launcher
+    process for each query. Requests and responses are sent as json lines
+    using stdin and stdout of the process. The process caches loaded
+    configs by path and modification time.
+
+    Use 'get_worker' to get shared worker of current process. Worker is
+    marked as not available when connection to it failed, so it is not
+    started again for following requests.
+    """
+    _worker = None
+    # Prefix of response lines written by worker
+    #   - must match 'WORKER_RESPONSE_PREFIX' in 'ocio_wrapper.py'
+    response_prefix = "AYON_OCIO_WORKER_RESPONSE:"
+
+    def __init__(self):
+        self._process = None
+        self._lock = threading.Lock()
+        self._request_id = 0
+        self._available = True
+
+    @classmethod
+    def get_worker(cls):
+        """Shared worker of current process.
+
+        Returns:
+            OCIOWrapperWorker: Worker object.
+        """
+        if cls._worker is None:
+            cls._worker = cls()
+            atexit.register(cls._worker.stop)
+        return cls._worker
+
+    def is_running(self):
+        return self._process is not None and self._process.poll() is None
+
+    def is_available(self):
+        return self._available
+
+    def request(self, command_group, command, **kwargs):
+        """Send request to worker and wait for response.
+
+        Args:
+            command_group (str): command group name
+            command (str): command name
+            **kwargs: command arguments
+
+        Raises:
+            OCIOWorkerConnectionError: Worker process is not available.
+            RuntimeError: Command failed in worker.
+
+        Returns:
+            Any: Result of the command.
+        """
+        with self._lock:
+            if not self._available:
+                raise OCIOWorkerConnectionError(
+                    "OCIO worker is not available"
+                )
+
+            if not self.is_running():
+                self._start()
+
+            self._request_id += 1
+            request_id = self._request_id
+            request = {
+                "id": request_id,
+                "command_group": command_group,
+                "command": command,
+                "kwargs": kwargs,
+            }
+            try:
+                self._process.stdin.write(json.dumps(request) + "\n")
+                self._process.stdin.flush()
+                response = self._read_response(request_id)
+            except (IOError, OSError, ValueError) as exc:
+                self._kill()
+                self._available = False
+                raise OCIOWorkerConnectionError(
+                    "Communication with OCIO worker failed: {}".format(exc)
+                )
+
+        if "error" in response:
+            raise RuntimeError(
+                "OCIO worker command '{} {}' failed: {}".format(
+                    command_group, command, response["error"]
+                )
+            )
+        return response.get("result")
+
+    def stop(self):
+        """Stop worker process."""
+        with self._lock:
+            if not self.is_running():
+                self._process = None
+                return
+            try:
+                # Worker stops when stdin is closed
+                self._process.stdin.close()
+                self._process.wait(timeout=5)
+            except Exception:
+                self._kill()
+            self._process = None
+
+    def _start(self):
+        args = get_ayon_launcher_args(
+            "run", get_ocio_config_script_path(), "worker"
+        )
+        kwargs = {
+            "stdin": subprocess.PIPE,
+            "stdout": subprocess.PIPE,
+            "stderr": subprocess.DEVNULL,
+            "env": clean_envs_for_ayon_process(os.environ),
+            "universal_newlines": True,
+            "bufsize": 1,
+        }
+        if platform.system().lower() == "windows":
+            kwargs["creationflags"] = getattr(
+                subprocess, "CREATE_NO_WINDOW", 0
+            )
+
+        log.debug("Starting OCIO worker: {}".format(" ".join(args)))
+        try:
+            self._process = subprocess.Popen(args, **kwargs)
+        except (OSError, KeyError) as exc:
+            self._process = None
+            self._available = False
+            raise OCIOWorkerConnectionError(
+                "Failed to start OCIO worker: {}".format(exc)
+            )
+
+    def _read_response(self, request_id):
+        # Skip any other output of AYON launcher process
+        while True:
+            line = self._process.stdout.readline()
+            if not line:
+                raise IOError("OCIO worker process ended unexpectedly")
+
+            if not line.startswith(self.response_prefix):
+                continue
+
+            response = json.loads(line[len(self.response_prefix):])
+            if response.get("id") == request_id:
+                return response
+
+    def _kill(self):
+        if self._process is None:
+            return
+        try:
+            self._process.kill()
+        except OSError:
+            pass
+        self._process = None
+
+
 def get_colorspace_name_from_filepath(
     filepath, host_name, project_name,
     config_data=None, file_rules=None,
@@ -143,6 +311,44 @@ def get_colorspace_name_from_filepath(
     Returns:
         str: name of colorspace
     """
+    return get_colorspace_names_from_filepaths(
+        [filepath], host_name, project_name,
+        config_data=config_data,
+        file_rules=file_rules,
+        project_settings=project_settings,
+        validate=validate
+    )[0]
+
+
+def get_colorspace_names_from_filepaths(
+    filepaths, host_name, project_name,
+    config_data=None, file_rules=None,
+    project_settings=None,
+    validate=True
+):
+    """Get colorspace names of multiple filepaths.
+
+    Files which are not matched by ImageIO file rules are resolved by
+    OCIO v2 file rules of config with single request.
+
+    Args:
+        filepaths (list[str]): path strings, file rule pattern is tested
+            on them
+        host_name (str): host name
+        project_name (str): project name
+        config_data (Optional[dict]): config path and template in dict.
+                                      Defaults to None.
+        file_rules (Optional[dict]): file rule data from settings.
+                                     Defaults to None.
+        project_settings (Optional[dict]): project settings. Defaults to None.
+        validate (Optional[bool]): should resulting colorspace be validated
+                                with config file? Defaults to True.
+
+    Returns:
+        list[Union[str, None]]: names of colorspace in order of passed
+            filepaths
+    """
+    filepaths = list(filepaths)
     project_settings, config_data, file_rules = _get_context_settings(
         host_name, project_name,
         config_data=config_data, file_rules=file_rules,
@@ -151,40 +357,60 @@ def get_colorspace_name_from_filepath(
 
     if not config_data:
         # in case global or host color management is not enabled
-        return None
+        return [None] * len(filepaths)
 
     # use ImageIO file rules
-    colorspace_name = get_imageio_file_rules_colorspace_from_filepath(
-        filepath, host_name, project_name,
-        config_data=config_data, file_rules=file_rules,
-        project_settings=project_settings
-    )
+    colorspace_names = [
+        get_imageio_file_rules_colorspace_from_filepath(
+            filepath, host_name, project_name,
+            config_data=config_data, file_rules=file_rules,
+            project_settings=project_settings
+        )
+        for filepath in filepaths
+    ]
 
     # try to get colorspace from OCIO v2 file rules
+    missing_idxs = [
+        idx
+        for idx, colorspace_name in enumerate(colorspace_names)
+        if not colorspace_name
+    ]
     if (
-        not colorspace_name
+        missing_idxs
         and compatibility_check_config_version(config_data["path"], major=2)
     ):
-        colorspace_name = get_config_file_rules_colorspace_from_filepath(
-            config_data["path"], filepath)
-
-    # use parse colorspace from filepath as fallback
-    colorspace_name = colorspace_name or parse_colorspace_from_filepath(
-        filepath, config_path=config_data["path"]
-    )
+        config_colorspace_names = (
+            get_config_file_rules_colorspaces_from_filepaths(
+                config_data["path"],
+                [filepaths[idx] for idx in missing_idxs]
+            )
+        )
+        for idx, colorspace_name in zip(
+            missing_idxs, config_colorspace_names
+        ):
+            colorspace_names[idx] = colorspace_name
+
+    output = []
+    for filepath, colorspace_name in zip(filepaths, colorspace_names):
+        # use parse colorspace from filepath as fallback
+        colorspace_name = colorspace_name or parse_colorspace_from_filepath(
+            filepath, config_path=config_data["path"]
+        )
 
-    if not colorspace_name:
-        log.info("No imageio file rule matched input path: '{}'".format(
-            filepath
-        ))
-        return None
+        if not colorspace_name:
+            log.info("No imageio file rule matched input path: '{}'".format(
+                filepath
+            ))
+            output.append(None)
+            continue
 
-    # validate matching colorspace with config
-    if validate:
-        validate_imageio_colorspace_in_config(
-            config_data["path"], colorspace_name)
+        # validate matching colorspace with config
+        if validate:
+            validate_imageio_colorspace_in_config(
+                config_data["path"], colorspace_name)
 
-    return colorspace_name
+        output.append(colorspace_name)
+    return output
 
 
 # TODO: remove this in future - backward compatibility
@@ -283,25 +509,44 @@ def get_config_file_rules_colorspace_from_filepath(config_path, filepath):
     Returns:
         Union[str, None]: matching colorspace name
     """
+    return get_config_file_rules_colorspaces_from_filepaths(
+        config_path, [filepath]
+    )[0]
+
+
+def get_config_file_rules_colorspaces_from_filepaths(config_path, filepaths):
+    """Get colorspaces for multiple file paths using OCIO v2 file-rules.
+
+    All file paths are resolved with single request so it is preferred
+    over 'get_config_file_rules_colorspace_from_filepath' in hosts without
+    PyOpenColorIO when more files are processed.
+
+    Args:
+        config_path (str): path leading to config.ocio file
+        filepaths (list[str]): paths leading to files
+
+    Returns:
+        list[Union[str, None]]: matching colorspace names in order
+            of passed file paths
+    """
+    filepaths = list(filepaths)
+    if not filepaths:
+        return []
+
     if not compatibility_check():
         # python environment is not compatible with PyOpenColorIO
         # needs to be run in subprocess
-        result_data = _get_wrapped_with_subprocess(
-            "colorspace", "get_config_file_rules_colorspace_from_filepath",
+        return _get_wrapped_with_subprocess(
+            "colorspace", "get_config_file_rules_colorspaces_from_filepaths",
             config_path=config_path,
-            filepath=filepath
+            filepaths=filepaths
         )
-        if result_data:
-            return result_data[0]
 
     # TODO: refactor this so it is not imported but part of this file
-    from ayon_core.scripts.ocio_wrapper import _get_config_file_rules_colorspace_from_filepath  # noqa: E501
+    from ayon_core.scripts.ocio_wrapper import _get_config_file_rules_colorspaces_from_filepaths  # noqa: E501
 
-    result_data = _get_config_file_rules_colorspace_from_filepath(
-        config_path, filepath)
-
-    if result_data:
-        return result_data[0]
+    return _get_config_file_rules_colorspaces_from_filepaths(
+        config_path, filepaths)
 
 
 def parse_colorspace_from_filepath(
@@ -425,6 +670,46 @@ def _get_wrapped_with_subprocess(command_group, command, **kwargs):
 
     Wrapper for Python 2 hosts.
 
+    Request is processed by long running OCIO wrapper worker. Single
+    subprocess is used for the request if worker is not available.
+
+    Args:
+        command_group (str): command group name
+        command (str): command name
+        **kwargs: command arguments
+
+    Returns:
+        Any[dict, None]: data
+    """
+    worker = OCIOWrapperWorker.get_worker()
+    if worker.is_available():
+        try:
+            return worker.request(command_group, command, **kwargs)
+        except OCIOWorkerConnectionError:
+            log.warning(
+                "OCIO worker is not available, using single subprocess.",
+                exc_info=True
+            )
+
+    # Batched command is not available as console command
+    if command == "get_config_file_rules_colorspaces_from_filepaths":
+        config_path = kwargs["config_path"]
+        return [
+            _run_wrapped_subprocess(
+                command_group,
+                "get_config_file_rules_colorspace_from_filepath",
+                config_path=config_path,
+                filepath=filepath
+            )
+            for filepath in kwargs["filepaths"]
+        ]
+
+    return _run_wrapped_subprocess(command_group, command, **kwargs)
+
+
+def _run_wrapped_subprocess(command_group, command, **kwargs):
+    """Get data via single AYON launcher subprocess.
+
     Args:
         command_group (str): command group name
         command (str): command name
@@ -1176,20 +1461,9 @@ def get_display_view_colorspace_subprocess(config_path, display, view):
         view color space name (str) e.g. "Output - sRGB"
     """
 
-    with _make_temp_json_file() as tmp_json_path:
-        # Prepare subprocess arguments
-        args = [
-            "run", get_ocio_config_script_path(),
-            "config", "get_display_view_colorspace_name",
-            "--in_path", config_path,
-            "--out_path", tmp_json_path,
-            "--display", display,
-            "--view", view
-        ]
-        log.debug("Executing: {}".format(" ".join(args)))
-
-        run_ayon_launcher_process(*args, logger=log)
-
-        # return default view colorspace name
-        with open(tmp_json_path, "r") as f:
-            return json.load(f)
+    return _get_wrapped_with_subprocess(
+        "config", "get_display_view_colorspace_name",
+        in_path=config_path,
+        display=display,
+        view=view
+    )
@@ -4,6 +4,7 @@ import copy
 import logging
 import traceback
 import collections
+import collections.abc
 import inspect
 from uuid import uuid4
 from contextlib import contextmanager
@@ -191,6 +192,92 @@ def prepare_failed_creator_operation_info(
 _EMPTY_VALUE = object()
 
 
+def _is_same_value(origin_value, value):
+    if type(origin_value) is not type(value) or origin_value != value:
+        return False
+
+    # Equality does not compare types of nested items e.g. '[1]' and
+    #   '[True]' are equal, representation of the values is compared too
+    if isinstance(value, (list, tuple, dict)):
+        return repr(origin_value) == repr(value)
+    return True
+
+
+def _share_unchanged_values(origin_value, value):
+    """Copy value but reuse parts that did not change from origin value.
+
+    Origin values are considered frozen, they're never modified in place, so
+    unchanged parts can be shared between origin and the output instead of
+    creating deep copy of whole value.
+
+    Args:
+        origin_value (Any): Frozen origin value. Can be '_EMPTY_VALUE' if
+            there is no origin value.
+        value (Any): Current value.
+
+    Returns:
+        Any: Value which can be also considered as frozen.
+    """
+
+    if isinstance(origin_value, dict) and isinstance(value, dict):
+        if _is_same_value(origin_value, value):
+            return origin_value
+
+        if isinstance(value, collections.OrderedDict):
+            output = collections.OrderedDict()
+        else:
+            output = {}
+        unchanged = (
+            type(origin_value) is type(value)
+            and len(origin_value) == len(value)
+        )
+        for key, sub_value in value.items():
+            origin_sub_value = origin_value.get(key, _EMPTY_VALUE)
+            output[key] = _share_unchanged_values(origin_sub_value, sub_value)
+            if output[key] is not origin_sub_value:
+                unchanged = False
+
+        if unchanged:
+            return origin_value
+        return output
+
+    if _is_same_value(origin_value, value):
+        return origin_value
+    return copy.deepcopy(value)
+
+
+class _FrozenDataView(collections.abc.Mapping):
+    """Read-only view of frozen origin data.
+
+    Nested dictionaries are wrapped to views too and other mutable values
+    are copied on access, so origin data can't be changed in place and
+    don't have to be copied as a whole.
+
+    Args:
+        data (dict[str, Any]): Frozen data.
+    """
+
+    def __init__(self, data):
+        self._data = data
+
+    def __getitem__(self, key):
+        value = self._data[key]
+        if isinstance(value, dict):
+            return _FrozenDataView(value)
+        if isinstance(value, (list, set)):
+            return copy.deepcopy(value)
+        return value
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return "<{} {}>".format(self.__class__.__name__, repr(self._data))
+
+
 class TrackChangesItem(object):
     """Helper object to track changes in data.
 
@@ -268,8 +355,29 @@ class TrackChangesItem(object):
             old_value = None
         if new_value is _EMPTY_VALUE:
             new_value = None
-        self._old_value = copy.deepcopy(old_value)
-        self._new_value = copy.deepcopy(new_value)
+        self._set_values(copy.deepcopy(old_value), copy.deepcopy(new_value))
+
+    @classmethod
+    def _from_frozen_values(cls, old_value, new_value):
+        """Create item without copying the values.
+
+        Values must not be modified after they're passed in. That is true
+        for sub-items, which share values of their parent item, and for
+        frozen origin values of instances.
+        """
+
+        obj = cls.__new__(cls)
+        obj._changed = old_value != new_value
+        if old_value is _EMPTY_VALUE:
+            old_value = None
+        if new_value is _EMPTY_VALUE:
+            new_value = None
+        obj._set_values(old_value, new_value)
+        return obj
+
+    def _set_values(self, old_value, new_value):
+        self._old_value = old_value
+        self._new_value = new_value
 
         self._old_is_dict = isinstance(old_value, dict)
         self._new_is_dict = isinstance(new_value, dict)
@@ -358,15 +466,13 @@ class TrackChangesItem(object):
         if not self.is_dict:
             return output
 
-        old_value = self.old_value
-        new_value = self.new_value
         for key in self.changed_keys:
             _old = None
             _new = None
             if self._old_is_dict:
-                _old = old_value.get(key)
+                _old = copy.deepcopy(self._old_value.get(key))
             if self._new_is_dict:
-                _new = new_value.get(key)
+                _new = copy.deepcopy(self._new_value.get(key))
             output[key] = (_old, _new)
         return output
 
@@ -462,13 +568,14 @@ class TrackChangesItem(object):
         sub_items = {}
         changed_keys = set()
 
+        # Sub-items share values with this item, values are not copied
         old_keys = self.old_keys
         new_keys = self.new_keys
-        new_value = self.new_value
-        old_value = self.old_value
+        new_value = self._new_value
+        old_value = self._old_value
         if self._old_is_dict and self._new_is_dict:
             for key in self.available_keys:
-                item = TrackChangesItem(
+                item = TrackChangesItem._from_frozen_values(
                     old_value.get(key), new_value.get(key)
                 )
                 sub_items[key] = item
@@ -482,7 +589,7 @@ class TrackChangesItem(object):
             for key in available_keys:
                 # NOTE Use '_EMPTY_VALUE' because old value could be 'None'
                 #   which would result in "unchanged" item
-                sub_items[key] = TrackChangesItem(
+                sub_items[key] = TrackChangesItem._from_frozen_values(
                     old_value.get(key), _EMPTY_VALUE
                 )
 
@@ -493,7 +600,7 @@ class TrackChangesItem(object):
             for key in available_keys:
                 # NOTE Use '_EMPTY_VALUE' because new value could be 'None'
                 #   which would result in "unchanged" item
-                sub_items[key] = TrackChangesItem(
+                sub_items[key] = TrackChangesItem._from_frozen_values(
                     _EMPTY_VALUE, new_value.get(key)
                 )
 
@@ -613,7 +720,9 @@ class AttributeValues(object):
         self._data = {}
 
     def mark_as_stored(self):
-        self._origin_data = copy.deepcopy(self._data)
+        self._origin_data = _share_unchanged_values(
+            self._origin_data, self._data
+        )
 
     @property
     def attr_defs(self):
@@ -627,7 +736,7 @@ class AttributeValues(object):
 
     @property
     def origin_data(self):
-        return copy.deepcopy(self._origin_data)
+        return _FrozenDataView(self._origin_data)
 
     def data_to_store(self):
         """Create new dictionary with data to store.
@@ -762,7 +871,9 @@ class PublishAttributes:
             yield name
 
     def mark_as_stored(self):
-        self._origin_data = copy.deepcopy(self.data_to_store())
+        self._origin_data = _share_unchanged_values(
+            self._origin_data, self.data_to_store()
+        )
 
     def data_to_store(self):
         """Convert attribute values to "data to store"."""
@@ -774,7 +885,7 @@ class PublishAttributes:
 
     @property
     def origin_data(self):
-        return copy.deepcopy(self._origin_data)
+        return _FrozenDataView(self._origin_data)
 
     def set_publish_plugins(self, attr_plugins):
         """Set publish plugins attribute definitions."""
@@ -800,7 +911,8 @@ class PublishAttributes:
             self._plugin_names_order.append(key)
 
             value = data.get(key) or {}
-            orig_value = copy.deepcopy(origin_data.get(key) or {})
+            # Origin data are frozen so they don't have to be copied
+            orig_value = origin_data.get(key) or {}
             self._data[key] = PublishAttributeValues(
                 self, attr_defs, value, orig_value
             )
@@ -809,7 +921,7 @@ class PublishAttributes:
             if key not in added_keys:
                 self._missing_plugins.append(key)
                 self._data[key] = PublishAttributeValues(
-                    self, [], value, value
+                    self, [], value, copy.deepcopy(value)
                 )
 
     def serialize_attributes(self):
@@ -836,7 +948,7 @@ class PublishAttributes:
         for plugin_name, attr_defs_data in attr_defs.items():
             attr_defs = deserialize_attr_defs(attr_defs_data)
             value = data.get(plugin_name) or {}
-            orig_value = copy.deepcopy(origin_data.get(plugin_name) or {})
+            orig_value = origin_data.get(plugin_name) or {}
             self._data[plugin_name] = PublishAttributeValues(
                 self, attr_defs, value, orig_value
             )
@@ -845,7 +957,7 @@ class PublishAttributes:
             if key not in added_keys:
                 self._missing_plugins.append(key)
                 self._data[key] = PublishAttributeValues(
-                    self, [], value, value
+                    self, [], value, copy.deepcopy(value)
                 )
 
 
@@ -915,6 +1027,8 @@ class CreatedInstance:
         self._transient_data = {}
 
         # Create a copy of passed data to avoid changing them on the fly
+        # - the copy is frozen origin data, values are shared with current
+        #   data until they're accessed (see '_get_value')
         data = copy.deepcopy(data or {})
 
         # Pop dictionary values that will be converted to objects to be able
@@ -923,7 +1037,7 @@ class CreatedInstance:
         orig_publish_attributes = data.pop("publish_attributes", None) or {}
 
         # Store original value of passed data
-        self._orig_data = copy.deepcopy(data)
+        self._orig_data = dict(data)
 
         # Pop family and subset to prevent unexpected changes
         # TODO change to 'productType' and 'productName' in AYON
@@ -972,6 +1086,13 @@ class CreatedInstance:
         if data:
             self._data.update(data)
 
+        # Keys of mutable values shared with origin data
+        self._shared_origin_keys = {
+            key
+            for key, value in data.items()
+            if isinstance(value, (dict, list, set))
+        }
+
         if not self._data.get("instance_id"):
             self._data["instance_id"] = str(uuid4())
 
@@ -989,9 +1110,27 @@ class CreatedInstance:
             data=str(self._data)
         )
 
+    def _get_value(self, key):
+        """Get value of key which can be modified in place.
+
+        Mutable values are shared with frozen origin data after
+        initialization and are copied on first access.
+        """
+
+        value = self._data[key]
+        if key in self._shared_origin_keys:
+            self._shared_origin_keys.discard(key)
+            value = copy.deepcopy(value)
+            self._data[key] = value
+        return value
+
+    def _copy_shared_values(self):
+        for key in tuple(self._shared_origin_keys):
+            self._get_value(key)
+
     # --- Dictionary like methods ---
     def __getitem__(self, key):
-        return self._data[key]
+        return self._get_value(key)
 
     def __contains__(self, key):
         return key in self._data
@@ -999,6 +1138,7 @@ class CreatedInstance:
     def __setitem__(self, key, value):
         # Validate immutable keys
         if key not in self.__immutable_keys:
+            self._shared_origin_keys.discard(key)
             self._data[key] = value
 
         elif value != self._data.get(key):
@@ -1006,22 +1146,27 @@ class CreatedInstance:
             raise ImmutableKeyError(key)
 
     def get(self, key, default=None):
-        return self._data.get(key, default)
+        if key in self._data:
+            return self._get_value(key)
+        return default
 
     def pop(self, key, *args, **kwargs):
         # Raise exception if is trying to pop key which is immutable
         if key in self.__immutable_keys:
             raise ImmutableKeyError(key)
 
+        self._shared_origin_keys.discard(key)
         self._data.pop(key, *args, **kwargs)
 
     def keys(self):
         return self._data.keys()
 
     def values(self):
+        self._copy_shared_values()
         return self._data.values()
 
     def items(self):
+        self._copy_shared_values()
         return self._data.items()
     # ------
 
@@ -1049,9 +1194,24 @@ class CreatedInstance:
 
     @property
     def origin_data(self):
-        output = copy.deepcopy(self._orig_data)
-        output["creator_attributes"] = self.creator_attributes.origin_data
-        output["publish_attributes"] = self.publish_attributes.origin_data
+        """Data of instance when it was created or last stored.
+
+        Returns:
+            Mapping[str, Any]: Read-only view of origin data.
+        """
+
+        return _FrozenDataView(self._get_frozen_origin_data())
+
+    def _get_frozen_origin_data(self):
+        """Origin data without copying of values.
+
+        Values of origin data are never changed in place so they can be
+        shared, only the dictionary is new.
+        """
+
+        output = dict(self._orig_data)
+        output["creator_attributes"] = self.creator_attributes._origin_data
+        output["publish_attributes"] = self.publish_attributes._origin_data
         return output
 
     @property
@@ -1108,7 +1268,11 @@ class CreatedInstance:
     def changes(self):
         """Calculate and return changes."""
 
-        return TrackChangesItem(self.origin_data, self.data_to_store())
+        origin_data = self._get_frozen_origin_data()
+        return TrackChangesItem._from_frozen_values(
+            origin_data,
+            _share_unchanged_values(origin_data, self.data_to_store())
+        )
 
     def mark_as_stored(self):
         """Should be called when instance data are stored.
@@ -1121,7 +1285,9 @@ class CreatedInstance:
             orig_keys.discard(key)
             if key in ("creator_attributes", "publish_attributes"):
                 continue
-            self._orig_data[key] = copy.deepcopy(value)
+            self._orig_data[key] = _share_unchanged_values(
+                self._orig_data.get(key, _EMPTY_VALUE), value
+            )
 
         for key in orig_keys:
             self._orig_data.pop(key)
@@ -1182,8 +1348,6 @@ class CreatedInstance:
                 instance of for which the instance belong.
         """
 
-        instance_data = copy.deepcopy(instance_data)
-
         family = instance_data.get("family", None)
         if family is None:
             family = creator.family
@@ -1224,7 +1388,7 @@ class CreatedInstance:
         publish_attributes = self.publish_attributes.serialize_attributes()
         return {
             "data": self.data_to_store(),
-            "orig_data": self.origin_data,
+            "orig_data": self._get_frozen_origin_data(),
             "creator_attr_defs": creator_attr_defs,
             "publish_attributes": publish_attributes,
             "creator_label": self._creator_label,
@@ -1244,7 +1408,7 @@ class CreatedInstance:
                 recreating. Should contain 'data' and 'orig_data'.
         """
 
-        instance_data = copy.deepcopy(serialized_data["data"])
+        instance_data = serialized_data["data"]
         creator_identifier = instance_data["creator_identifier"]
 
         family = instance_data["family"]
@@ -1880,8 +2044,11 @@ class CreateContext:
     def context_data_changes(self):
         """Changes of attributes."""
 
-        return TrackChangesItem(
-            self._original_context_data, self.context_data_to_store()
+        return TrackChangesItem._from_frozen_values(
+            self._original_context_data,
+            _share_unchanged_values(
+                self._original_context_data, self.context_data_to_store()
+            )
         )
 
     def creator_adds_instance(self, instance):
@@ -1,12 +1,26 @@
 """Functions useful for delivery of published representations."""
 import os
 import copy
+import csv
+import json
+import time
 import shutil
 import glob
 import clique
 import collections
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from ayon_core.lib import create_hard_link
+from ayon_core.lib import (
+    Logger,
+    create_hard_link,
+    collect_frames,
+    format_file_size,
+    get_datetime_data,
+)
+from ayon_core.lib.file_transaction import (
+    TransferProgress,
+    get_file_checksum,
+)
 
 
 def _copy_file(src_path, dst_path):
@@ -77,8 +91,9 @@ def check_destination_path(
     """
 
     anatomy_data.update(datetime_data)
-    anatomy_filled = anatomy.format_all(anatomy_data)
-    dest_path = anatomy_filled["delivery"][template_name]
+    dest_path = anatomy.format_key(
+        "delivery", template_name, anatomy_data, strict=False
+    )
     report_items = collections.defaultdict(list)
 
     if not dest_path.solved:
@@ -323,3 +338,538 @@ def deliver_sequence(
         uploaded += 1
 
     return report_items, uploaded
+
+
+class RepresentationsDelivery(object):
+    """Deliver files of representations using delivery template.
+
+    Delivery is not related to any UI. Representations are added using
+    'add_representation' which only prepares source and destination paths,
+    the files are transferred in 'process' using a thread pool. Files are
+    hardlinked if possible and copied otherwise. Existing destination files
+    are never overwritten.
+
+    Delivery template is filled only once per representation, frame is
+    filled for each file afterwards. Representations without files
+    information are resolved by listing their source directory, each
+    directory is listed only once.
+
+    Result of each file is stored to manifest (json or csv based on
+    extension) with sizes and checksums. When delivery is run again with
+    the same manifest, files that were already delivered are skipped
+    without calculating the checksum again.
+
+    Args:
+        anatomy (Anatomy): Project anatomy.
+        template_name (str): Name of delivery template.
+        location_path (Optional[str]): Root path that replaces roots in
+            the delivery template.
+        renumber_frame (Optional[bool]): Renumber frames of sequences.
+        new_frame_start (Optional[int]): First frame used for renumbering.
+        max_workers (Optional[int]): Number of threads transferring files.
+        checksum_algorithm (Optional[str]): Name of 'hashlib' algorithm used
+            to calculate checksum of delivered files. Checksum is not
+            calculated if not set.
+        manifest_path (Optional[str]): Path to json or csv manifest file.
+        progress_callback (Optional[Callable[[TransferProgress], None]]):
+            Called from main thread after each processed file.
+        log (Optional[logging.Logger]): Logger used for output.
+    """
+
+    manifest_columns = (
+        "representation_id",
+        "source",
+        "destination",
+        "status",
+        "size",
+        "source_size",
+        "source_mtime",
+        "checksum_algorithm",
+        "checksum",
+    )
+    # Seconds between throughput reports in logs
+    report_interval = 5.0
+
+    def __init__(
+        self,
+        anatomy,
+        template_name,
+        location_path=None,
+        renumber_frame=False,
+        new_frame_start=0,
+        max_workers=None,
+        checksum_algorithm=None,
+        manifest_path=None,
+        progress_callback=None,
+        log=None
+    ):
+        if log is None:
+            log = Logger.get_logger(self.__class__.__name__)
+        self.log = log
+
+        self._anatomy = anatomy
+        self._template_name = template_name
+        self._format_dict = get_format_dict(anatomy, location_path)
+        self._renumber_frame = renumber_frame
+        self._new_frame_start = new_frame_start
+        self._max_workers = max_workers
+        self._checksum_algorithm = checksum_algorithm or None
+        self._manifest_path = manifest_path
+        self._progress_callback = progress_callback
+
+        self._datetime_data = get_datetime_data()
+        self._report_items = collections.defaultdict(list)
+        self._collections_by_dir = {}
+        # destination -> (source, destination, representation id, size)
+        self._transfers = collections.OrderedDict()
+        self._manifest_entries = []
+
+    @property
+    def report_items(self):
+        """Errors that happened during delivery.
+
+        Returns:
+            collections.defaultdict[str, list[str]]: Messages by title.
+        """
+
+        return self._report_items
+
+    @property
+    def manifest_entries(self):
+        """Results of processed files.
+
+        Returns:
+            list[dict[str, Any]]: Manifest entries.
+        """
+
+        return list(self._manifest_entries)
+
+    @property
+    def files_count(self):
+        return len(self._transfers)
+
+    def add_representations(self, repre_docs):
+        for repre_doc in repre_docs:
+            self.add_representation(repre_doc)
+
+    def add_representation(self, repre_doc):
+        """Prepare transfers of representation files.
+
+        Args:
+            repre_doc (dict[str, Any]): Representation document.
+
+        Returns:
+            int: Number of files prepared for transfer.
+        """
+
+        # Avoid circular imports
+        from ayon_core.pipeline.load import (
+            get_representation_path_with_anatomy
+        )
+
+        repre_id = str(repre_doc["_id"])
+        anatomy_data = copy.deepcopy(repre_doc["context"])
+        anatomy_data.update(self._datetime_data)
+        if self._format_dict:
+            anatomy_data["root"] = self._format_dict["root"]
+
+        template_obj = (
+            self._anatomy.templates_obj["delivery"][self._template_name]
+        )
+        result = template_obj.format(anatomy_data)
+        if not result.solved:
+            self._add_template_report(repre_id, result)
+            return 0
+
+        if repre_doc.get("files"):
+            return self._add_files_transfers(
+                repre_doc, anatomy_data, template_obj
+            )
+
+        # Fallback for representations without files
+        repre_path = get_representation_path_with_anatomy(
+            repre_doc, self._anatomy
+        )
+        if not repre_doc["context"].get("frame"):
+            return self._add_transfer(
+                repre_id,
+                repre_path,
+                self._get_delivery_path(template_obj, anatomy_data),
+                None
+            )
+        return self._add_sequence_transfers(
+            repre_doc, repre_path, anatomy_data, template_obj
+        )
+
+    def process(self):
+        """Transfer prepared files.
+
+        Returns:
+            collections.defaultdict[str, list[str]]: Report items with
+                errors.
+        """
+
+        manifest_by_dst = self._load_manifest()
+        transfers, self._transfers = (
+            list(self._transfers.values()), collections.OrderedDict()
+        )
+        if not transfers:
+            return self._report_items
+
+        total_bytes = 0
+        for src_path, _, _, size in transfers:
+            if size is None and os.path.exists(src_path):
+                size = os.path.getsize(src_path)
+            total_bytes += size or 0
+        progress = TransferProgress(total_bytes, len(transfers))
+
+        self.log.info("Delivering {} files ({}).".format(
+            progress.total_files, format_file_size(progress.total_bytes)
+        ))
+
+        start_time = last_report_time = time.time()
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            futures = {
+                executor.submit(
+                    self._deliver_file,
+                    src_path,
+                    dst_path,
+                    repre_id,
+                    manifest_by_dst.get(dst_path)
+                ): (src_path, dst_path, repre_id)
+                for src_path, dst_path, repre_id, _ in transfers
+            }
+            for future in as_completed(futures):
+                src_path, dst_path, repre_id = futures[future]
+                try:
+                    entry = future.result()
+                except Exception as exc:
+                    self.log.warning(
+                        "Failed to deliver {}".format(src_path),
+                        exc_info=True
+                    )
+                    self._report_items["Failed to deliver file"].append(
+                        "{} -> {}: {}".format(src_path, dst_path, exc)
+                    )
+                    entry = None
+
+                size = 0
+                if entry is None:
+                    pass
+                elif entry["status"] == "missing":
+                    self._report_items["Source file was not found"].append(
+                        "{} doesn't exist for {}".format(src_path, repre_id)
+                    )
+                else:
+                    size = entry["size"]
+                    manifest_by_dst[dst_path] = entry
+                    self._manifest_entries.append(entry)
+
+                progress.add_file(dst_path, size)
+                if self._progress_callback is not None:
+                    self._progress_callback(progress)
+
+                current_time = time.time()
+                if current_time - last_report_time >= self.report_interval:
+                    last_report_time = current_time
+                    self._log_throughput(progress, current_time - start_time)
+
+        self._log_throughput(progress, time.time() - start_time)
+        if self._manifest_path:
+            self._save_manifest(manifest_by_dst)
+        return self._report_items
+
+    def _log_throughput(self, progress, elapsed):
+        speed = 0
+        if elapsed > 0:
+            speed = int(progress.transferred_bytes / elapsed)
+        self.log.info(
+            "Delivered {}/{} files, {} of {} ({}/s)".format(
+                progress.transferred_files,
+                progress.total_files,
+                format_file_size(progress.transferred_bytes),
+                format_file_size(progress.total_bytes),
+                format_file_size(speed),
+            )
+        )
+
+    def _deliver_file(self, src_path, dst_path, repre_id, manifest_entry):
+        if not os.path.exists(src_path):
+            return {"status": "missing"}
+
+        src_stat = os.stat(src_path)
+        if os.path.exists(dst_path):
+            # Existing files are never overwritten, skip calculation of
+            #   checksum if the file was delivered from the same source
+            if (
+                manifest_entry
+                and manifest_entry.get("source") == src_path
+                and manifest_entry.get("source_size") == src_stat.st_size
+                and manifest_entry.get("source_mtime") == src_stat.st_mtime
+                and manifest_entry.get("size") == os.path.getsize(dst_path)
+            ):
+                entry = dict(manifest_entry)
+                entry["status"] = "skipped"
+                return entry
+            status = "existing"
+
+        else:
+            dst_dir = os.path.dirname(dst_path)
+            if not os.path.exists(dst_dir):
+                os.makedirs(dst_dir, exist_ok=True)
+            _copy_file(src_path, dst_path)
+            status = "delivered"
+
+        checksum = None
+        if self._checksum_algorithm:
+            checksum = get_file_checksum(dst_path, self._checksum_algorithm)
+
+        return {
+            "representation_id": repre_id,
+            "source": src_path,
+            "destination": dst_path,
+            "status": status,
+            "size": os.path.getsize(dst_path),
+            "source_size": src_stat.st_size,
+            "source_mtime": src_stat.st_mtime,
+            "checksum_algorithm": self._checksum_algorithm,
+            "checksum": checksum,
+        }
+
+    def _add_transfer(self, repre_id, src_path, dst_path, size):
+        src_path = os.path.normpath(str(src_path).replace("\\", "/"))
+        if dst_path in self._transfers:
+            return 0
+        self._transfers[dst_path] = (src_path, dst_path, repre_id, size)
+        return 1
+
+    def _add_files_transfers(self, repre_doc, anatomy_data, template_obj):
+        repre_id = str(repre_doc["_id"])
+        size_by_path = {}
+        for repre_file in repre_doc["files"]:
+            src_path = self._anatomy.fill_root(repre_file["path"])
+            size_by_path[src_path] = repre_file.get("size")
+
+        sources_and_frames = collect_frames(list(size_by_path.keys()))
+        frames = set(sources_and_frames.values())
+        frames.discard(None)
+        first_frame = None
+        if frames:
+            first_frame = min(frames)
+
+        compiled_template = template_obj.compile_strict(
+            anatomy_data, "frame"
+        )
+        default_frame = anatomy_data.get("frame")
+        no_frame_path = None
+        added = 0
+        for src_path, frame in sources_and_frames.items():
+            if self._renumber_frame and frame is not None:
+                # Calculate offset between first frame and current frame
+                # - '0' for first frame
+                offset = self._new_frame_start - int(first_frame)
+                # Add offset to new frame start
+                dst_frame = int(frame) + offset
+                if dst_frame < 0:
+                    msg = "Renumber frame has a smaller number than original frame"     # noqa
+                    self._report_items[msg].append(src_path)
+                    self.log.warning("{} <{}>".format(msg, dst_frame))
+                    continue
+                frame = dst_frame
+
+            if frame is None:
+                frame = default_frame
+
+            if frame is not None:
+                dst_path = self._normalize_delivery_path(
+                    compiled_template.format(frame)
+                )
+            else:
+                if no_frame_path is None:
+                    no_frame_path = self._get_delivery_path(
+                        template_obj, anatomy_data
+                    )
+                dst_path = no_frame_path
+
+            added += self._add_transfer(
+                repre_id, src_path, dst_path, size_by_path[src_path]
+            )
+        return added
+
+    def _add_sequence_transfers(
+        self, repre_doc, src_path, anatomy_data, template_obj
+    ):
+        repre_id = str(repre_doc["_id"])
+        src_path = os.path.normpath(str(src_path).replace("\\", "/"))
+        delivery_templates = self._anatomy.templates.get("delivery") or {}
+        delivery_template = delivery_templates.get(self._template_name)
+        # Check if 'frame' key is available in template which is required
+        #   for sequence delivery
+        if "{frame" not in (delivery_template or ""):
+            msg = (
+                "Delivery template \"{}\" in anatomy of project \"{}\""
+                "does not contain '{{frame}}' key to fill. Delivery of"
+                " sequence can't be processed."
+            ).format(self._template_name, self._anatomy.project_name)
+            self._report_items[""].append(msg)
+            return 0
+
+        context = repre_doc["context"]
+        ext = context.get("ext", context.get("representation"))
+        if not ext:
+            msg = "Source extension not found, cannot find collection"
+            self._report_items[msg].append(src_path)
+            self.log.warning("{} <{}>".format(msg, context))
+            return 0
+
+        ext = "." + ext
+        # context.representation could be .psd
+        ext = ext.replace("..", ".")
+
+        dir_path = os.path.dirname(src_path)
+        src_collection = None
+        for collection in self._get_dir_collections(dir_path):
+            if collection.tail == ext:
+                src_collection = collection
+                break
+
+        if src_collection is None:
+            msg = "Source collection of files was not found"
+            self._report_items[msg].append(src_path)
+            self.log.warning("{} <{}>".format(msg, src_path))
+            return 0
+
+        compiled_template = template_obj.compile_strict(
+            anatomy_data, "frame"
+        )
+        first_frame = min(src_collection.indexes)
+        transfers = []
+        file_template = src_collection.format("{head}{padding}{tail}")
+        for index in src_collection.indexes:
+            src_file_path = os.path.join(dir_path, file_template % index)
+            dst_index = index
+            if self._renumber_frame:
+                dst_index = index + self._new_frame_start - first_frame
+                if dst_index < 0:
+                    msg = "Renumber frame has a smaller number than original frame"     # noqa
+                    self._report_items[msg].append(
+                        os.path.basename(src_file_path)
+                    )
+                    self.log.warning("{} <{}>".format(msg, context))
+                    return 0
+            dst_path = self._normalize_delivery_path(
+                compiled_template.format_raw(
+                    "{:0>{}}".format(dst_index, src_collection.padding)
+                )
+            )
+            transfers.append((src_file_path, dst_path))
+
+        added = 0
+        for src_file_path, dst_path in transfers:
+            added += self._add_transfer(
+                repre_id, src_file_path, dst_path, None
+            )
+        return added
+
+    def _get_dir_collections(self, dir_path):
+        collections_ = self._collections_by_dir.get(dir_path)
+        if collections_ is None:
+            collections_ = []
+            if os.path.isdir(dir_path):
+                collections_, _ = clique.assemble(os.listdir(dir_path))
+            self._collections_by_dir[dir_path] = collections_
+        return collections_
+
+    def _get_delivery_path(self, template_obj, anatomy_data):
+        """Delivery path of file without frame."""
+
+        fill_data = copy.copy(anatomy_data)
+        fill_data.pop("frame", None)
+        return self._normalize_delivery_path(
+            template_obj.format_strict(fill_data)
+        )
+
+    @staticmethod
+    def _normalize_delivery_path(delivery_path):
+        # Backwards compatibility when extension contained `.`
+        delivery_path = str(delivery_path).replace("..", ".")
+        # Make sure path is valid for all platforms
+        delivery_path = os.path.normpath(delivery_path.replace("\\", "/"))
+        # Remove newlines from the end of the string to avoid OSError
+        return delivery_path.rstrip()
+
+    def _add_template_report(self, repre_id, result):
+        msg = (
+            "Missing keys in Representation's context"
+            " for anatomy template \"{}\"."
+        ).format(self._template_name)
+
+        sub_msg = "Representation: {}<br>".format(repre_id)
+        if result.missing_keys:
+            sub_msg += "- Missing keys: \"{}\"<br>".format(
+                ", ".join(result.missing_keys)
+            )
+
+        if result.invalid_types:
+            sub_msg += "- Invalid value DataType: \"{}\"<br>".format(
+                ", ".join(
+                    "\"{}\" {}".format(key, str(value))
+                    for key, value in result.invalid_types.items()
+                )
+            )
+        self._report_items[msg].append(sub_msg)
+
+    def _is_csv_manifest(self):
+        return self._manifest_path.lower().endswith(".csv")
+
+    def _load_manifest(self):
+        if not self._manifest_path or not os.path.exists(self._manifest_path):
+            return {}
+
+        if self._is_csv_manifest():
+            with open(self._manifest_path, "r", newline="") as stream:
+                entries = list(csv.DictReader(stream))
+            for entry in entries:
+                for key in ("size", "source_size"):
+                    if entry.get(key):
+                        entry[key] = int(entry[key])
+                if entry.get("source_mtime"):
+                    entry["source_mtime"] = float(entry["source_mtime"])
+        else:
+            with open(self._manifest_path, "r") as stream:
+                entries = json.load(stream).get("files") or []
+
+        return collections.OrderedDict(
+            (entry["destination"], entry)
+            for entry in entries
+        )
+
+    def _save_manifest(self, manifest_by_dst):
+        manifest_dir = os.path.dirname(os.path.abspath(self._manifest_path))
+        if not os.path.exists(manifest_dir):
+            os.makedirs(manifest_dir)
+
+        entries = list(manifest_by_dst.values())
+        tmp_path = self._manifest_path + ".tmp"
+        if self._is_csv_manifest():
+            with open(tmp_path, "w", newline="") as stream:
+                writer = csv.DictWriter(
+                    stream,
+                    fieldnames=self.manifest_columns,
+                    extrasaction="ignore"
+                )
+                writer.writeheader()
+                writer.writerows(entries)
+        else:
+            with open(tmp_path, "w") as stream:
+                json.dump(
+                    {
+                        "project_name": self._anatomy.project_name,
+                        "template_name": self._template_name,
+                        "files": entries,
+                    },
+                    stream,
+                    indent=4
+                )
+        os.replace(tmp_path, self._manifest_path)
+        self.log.info("Manifest saved to {}".format(self._manifest_path))
@@ -50,6 +50,12 @@ from .plugins import (
     deregister_loader_plugin,
 )
 
+from .version_index import (
+    VersionIndex,
+    get_version_index,
+    invalidate_version_index,
+)
+
 
 __all__ = (
     # utils.py
@@ -101,4 +107,9 @@ __all__ = (
     "deregister_loader_plugin_path",
     "register_loader_plugin_path",
     "deregister_loader_plugin",
+
+    # version_index.py
+    "VersionIndex",
+    "get_version_index",
+    "invalidate_version_index",
 )
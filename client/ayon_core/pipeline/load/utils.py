@@ -17,7 +17,6 @@ from ayon_core.client import (
     get_last_version_by_subset_id,
     get_hero_version_by_subset_id,
     get_version_by_name,
-    get_last_versions,
     get_representations,
     get_representation_by_id,
     get_representation_by_name,
@@ -31,6 +30,8 @@ from ayon_core.pipeline import (
     Anatomy,
 )
 
+from .version_index import get_version_index
+
 log = logging.getLogger(__name__)
 
 ContainersFilterResult = collections.namedtuple(
@@ -319,6 +320,10 @@ def load_with_repre_context(
     # Deprecated - to be removed in OpenPype 3.16.6 or 3.17.0.
     loader._fname = get_representation_path_from_context(repre_context)
 
+    # Loaded product may have newer versions than cached in version index
+    get_version_index().invalidate_last_versions(
+        repre_context["project"]["name"], [repre_context["subset"]["_id"]]
+    )
     return loader.load(repre_context, name, namespace, options)
 
 
@@ -471,6 +476,10 @@ def update_container(container, version=-1):
         new_version = get_last_version_by_subset_id(
             project_name, current_version["parent"], fields=["_id"]
         )
+        # Last version in version index may be outdated
+        get_version_index().invalidate_last_versions(
+            project_name, [current_version["parent"]]
+        )
 
     elif isinstance(version, HeroVersionType):
         new_version = get_hero_version_by_subset_id(
@@ -824,11 +833,10 @@ def filter_containers(containers, project_name):
             invalid_containers.extend(containers)
         return output
 
-    repre_docs = get_representations(
-        project_name,
-        representation_ids=repre_ids,
-        fields=["_id", "parent"]
-    )
+    version_index = get_version_index()
+    repre_docs = version_index.get_representations(
+        project_name, repre_ids
+    ).values()
     # Store representations by stringified representation id
     repre_docs_by_str_id = {}
     repre_docs_by_version_id = collections.defaultdict(list)
@@ -838,15 +846,12 @@ def filter_containers(containers, project_name):
         repre_docs_by_str_id[repre_id] = repre_doc
         repre_docs_by_version_id[version_id].append(repre_doc)
 
-    # Query version docs to get it's subset ids
-    # - also query hero version to be able identify if representation
+    # Get version docs to get it's subset ids
+    # - also get hero version to be able identify if representation
     #   belongs to existing version
-    version_docs = get_versions(
-        project_name,
-        version_ids=repre_docs_by_version_id.keys(),
-        hero=True,
-        fields=["_id", "parent", "type"]
-    )
+    version_docs = version_index.get_versions(
+        project_name, repre_docs_by_version_id.keys()
+    ).values()
     verisons_by_id = {}
     versions_by_subset_id = collections.defaultdict(list)
     hero_version_ids = set()
@@ -862,10 +867,8 @@ def filter_containers(containers, project_name):
         subset_id = version_doc["parent"]
         versions_by_subset_id[subset_id].append(version_doc)
 
-    last_versions = get_last_versions(
-        project_name,
-        subset_ids=versions_by_subset_id.keys(),
-        fields=["_id"]
+    last_versions = version_index.get_last_versions(
+        project_name, versions_by_subset_id.keys()
     )
     # Figure out which versions are outdated
     outdated_version_ids = set()
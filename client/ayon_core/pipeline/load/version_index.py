@@ -0,0 +1,271 @@
+"""Process-level cache of entities used to resolve loaded containers.
+
+Scene inventory and checks of outdated containers need representations,
+their versions, products and last versions of products. The entities are
+cached with a lifetime so thousands of containers can be resolved from
+memory and only missing entities are queried, all of them in one request.
+"""
+import time
+
+from ayon_core.client import (
+    get_assets,
+    get_subsets,
+    get_versions,
+    get_last_versions,
+    get_representations,
+)
+
+
+class _EntitiesCache(object):
+    """Entities by id with time when they become outdated.
+
+    Ids of entities that were not found are cached too, so they're not
+    queried again until they're outdated.
+
+    Args:
+        lifetime (float): Lifetime of cached entities in seconds.
+    """
+
+    def __init__(self, lifetime):
+        self._lifetime = lifetime
+        self._items = {}
+
+    def get_items(self, entity_ids):
+        """Get cached entities.
+
+        Args:
+            entity_ids (Iterable[str]): Entity ids.
+
+        Returns:
+            tuple[dict[str, dict[str, Any]], set[str]]: Cached entities by
+                id and ids which are not cached or are outdated.
+        """
+
+        current_time = time.time()
+        output = {}
+        missing_ids = set()
+        for entity_id in entity_ids:
+            item = self._items.get(entity_id)
+            if item is None or item[0] < current_time:
+                missing_ids.add(entity_id)
+            elif item[1] is not None:
+                output[entity_id] = item[1]
+        return output, missing_ids
+
+    def set_items(self, entity_ids, entities_by_id):
+        outdate_time = time.time() + self._lifetime
+        for entity_id in entity_ids:
+            self._items[entity_id] = (
+                outdate_time, entities_by_id.get(entity_id)
+            )
+
+    def clear(self, entity_ids=None):
+        if entity_ids is None:
+            self._items = {}
+            return
+
+        for entity_id in entity_ids:
+            self._items.pop(entity_id, None)
+
+
+class _ProjectVersionIndex(object):
+    def __init__(self, entities_lifetime, last_versions_lifetime):
+        self.representations = _EntitiesCache(entities_lifetime)
+        self.versions = _EntitiesCache(entities_lifetime)
+        self.subsets = _EntitiesCache(entities_lifetime)
+        self.assets = _EntitiesCache(entities_lifetime)
+        self.last_versions = _EntitiesCache(last_versions_lifetime)
+
+
+class VersionIndex(object):
+    """Cache of representation, version, product and last version entities.
+
+    Cached entities are shared between callers and must not be modified.
+
+    Last versions have shorter lifetime because they change with each
+    publish. Use 'invalidate' or 'invalidate_last_versions' when entities
+    are known to be changed, e.g. after publishing.
+    """
+
+    # Lifetime of cached entities in seconds
+    entities_lifetime = 300
+    last_versions_lifetime = 30
+
+    def __init__(self):
+        self._indexes_by_project = {}
+
+    def _get_project_index(self, project_name):
+        index = self._indexes_by_project.get(project_name)
+        if index is None:
+            index = _ProjectVersionIndex(
+                self.entities_lifetime, self.last_versions_lifetime
+            )
+            self._indexes_by_project[project_name] = index
+        return index
+
+    def invalidate(self, project_name=None):
+        """Remove all cached entities of project or of all projects.
+
+        Args:
+            project_name (Optional[str]): Project name.
+        """
+
+        if project_name is None:
+            self._indexes_by_project = {}
+        else:
+            self._indexes_by_project.pop(project_name, None)
+
+    def invalidate_last_versions(self, project_name, subset_ids=None):
+        """Remove cached last versions of products.
+
+        Args:
+            project_name (str): Project name.
+            subset_ids (Optional[Iterable[str]]): Product ids, last versions
+                of all products are removed if not passed.
+        """
+
+        index = self._indexes_by_project.get(project_name)
+        if index is not None:
+            index.last_versions.clear(subset_ids)
+
+    def get_representations(self, project_name, representation_ids):
+        """Representation documents by id.
+
+        Args:
+            project_name (str): Project name.
+            representation_ids (Iterable[str]): Representation ids.
+
+        Returns:
+            dict[str, dict[str, Any]]: Representation documents by id,
+                not existing representations are not in output.
+        """
+
+        cache = self._get_project_index(project_name).representations
+        output, missing_ids = cache.get_items(set(representation_ids))
+        if missing_ids:
+            repre_docs_by_id = {
+                repre_doc["_id"]: repre_doc
+                for repre_doc in get_representations(
+                    project_name, representation_ids=missing_ids
+                )
+            }
+            cache.set_items(missing_ids, repre_docs_by_id)
+            output.update(repre_docs_by_id)
+        return output
+
+    def get_versions(self, project_name, version_ids):
+        """Version documents, including hero versions, by id.
+
+        Args:
+            project_name (str): Project name.
+            version_ids (Iterable[str]): Version ids.
+
+        Returns:
+            dict[str, dict[str, Any]]: Version documents by id.
+        """
+
+        cache = self._get_project_index(project_name).versions
+        output, missing_ids = cache.get_items(set(version_ids))
+        if missing_ids:
+            version_docs_by_id = {
+                version_doc["_id"]: version_doc
+                for version_doc in get_versions(
+                    project_name, version_ids=missing_ids, hero=True
+                )
+            }
+            cache.set_items(missing_ids, version_docs_by_id)
+            output.update(version_docs_by_id)
+        return output
+
+    def get_subsets(self, project_name, subset_ids):
+        """Product documents by id.
+
+        Args:
+            project_name (str): Project name.
+            subset_ids (Iterable[str]): Product ids.
+
+        Returns:
+            dict[str, dict[str, Any]]: Product documents by id.
+        """
+
+        cache = self._get_project_index(project_name).subsets
+        output, missing_ids = cache.get_items(set(subset_ids))
+        if missing_ids:
+            subset_docs_by_id = {
+                subset_doc["_id"]: subset_doc
+                for subset_doc in get_subsets(
+                    project_name, subset_ids=missing_ids
+                )
+            }
+            cache.set_items(missing_ids, subset_docs_by_id)
+            output.update(subset_docs_by_id)
+        return output
+
+    def get_assets(self, project_name, asset_ids):
+        """Folder documents by id.
+
+        Args:
+            project_name (str): Project name.
+            asset_ids (Iterable[str]): Folder ids.
+
+        Returns:
+            dict[str, dict[str, Any]]: Folder documents by id.
+        """
+
+        cache = self._get_project_index(project_name).assets
+        output, missing_ids = cache.get_items(set(asset_ids))
+        if missing_ids:
+            asset_docs_by_id = {
+                asset_doc["_id"]: asset_doc
+                for asset_doc in get_assets(
+                    project_name, asset_ids=missing_ids
+                )
+            }
+            cache.set_items(missing_ids, asset_docs_by_id)
+            output.update(asset_docs_by_id)
+        return output
+
+    def get_last_versions(self, project_name, subset_ids):
+        """Last version documents, without hero versions, by product id.
+
+        Args:
+            project_name (str): Project name.
+            subset_ids (Iterable[str]): Product ids.
+
+        Returns:
+            dict[str, dict[str, Any]]: Last version documents by product id.
+        """
+
+        cache = self._get_project_index(project_name).last_versions
+        output, missing_ids = cache.get_items(set(subset_ids))
+        if missing_ids:
+            last_versions = get_last_versions(
+                project_name, subset_ids=missing_ids
+            )
+            cache.set_items(missing_ids, last_versions)
+            output.update(last_versions)
+        return output
+
+
+_version_index = VersionIndex()
+
+
+def get_version_index():
+    """Process-level version index.
+
+    Returns:
+        VersionIndex: Shared version index.
+    """
+
+    return _version_index
+
+
+def invalidate_version_index(project_name=None):
+    """Remove cached entities from process-level version index.
+
+    Args:
+        project_name (Optional[str]): Project name, all projects are
+            invalidated if not passed.
+    """
+
+    _version_index.invalidate(project_name)
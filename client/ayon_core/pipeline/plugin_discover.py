@@ -1,11 +1,14 @@
 import os
 import inspect
+import weakref
 import traceback
 
 from ayon_core.lib import Logger
 from ayon_core.lib.python_module_tools import (
     modules_from_path,
     classes_from_module,
+    get_class_attributes,
+    restore_class_attributes,
 )
 
 log = Logger.get_logger(__name__)
@@ -100,8 +103,15 @@ class PluginDiscoverContext(object):
     """Store and discover registered types nad registered paths to types.
 
     Keeps in memory all registered types and their paths. Paths are dynamically
-    loaded on discover so different discover calls won't return the same
-    class objects even if were loaded from same file.
+    loaded on discover. Loaded modules are cached by file path, modification
+    time and size of the file, so only new or modified files are imported
+    again on next discover. Use 'force' argument of 'discover' to import all
+    files again, in that case different discover calls won't return the
+    same class objects even if were loaded from same file.
+
+    Classes from cached modules are restored to the state they had after
+    import, so class attributes changed by applied settings of previous
+    discover (e.g. of different project) are not kept.
     """
 
     def __init__(self):
@@ -110,6 +120,10 @@ class PluginDiscoverContext(object):
         self._last_discovered_plugins = {}
         # Store the last result to memory
         self._last_discovered_results = {}
+        # Cached modules by file path
+        self._modules_cache = {}
+        # Class attributes after import of discovered classes
+        self._attributes_by_class = weakref.WeakKeyDictionary()
 
     def get_last_discovered_plugins(self, superclass):
         """Access last discovered plugin by a subperclass.
@@ -126,7 +140,8 @@ class PluginDiscoverContext(object):
         superclass,
         allow_duplicates=True,
         ignore_classes=None,
-        return_report=False
+        return_report=False,
+        force=False
     ):
         """Find and return subclasses of `superclass`
 
@@ -136,6 +151,8 @@ class PluginDiscoverContext(object):
             ignore_classes (list): List of classes that will be ignored
                 and not added to result.
             return_report (bool): Output will be full report if set to 'True'.
+            force (bool): Import all files from registered paths again
+                instead of using cached modules.
 
         Returns:
             Union[DiscoverResult, list[Any]]: Object holding successfully
@@ -168,7 +185,9 @@ class PluginDiscoverContext(object):
 
         # Include plug-ins from registered paths
         for path in registered_paths:
-            modules, crashed = modules_from_path(path)
+            modules, crashed = modules_from_path(
+                path, self._modules_cache, force
+            )
             for item in crashed:
                 filepath, exc_info = item
                 result.crashed_file_paths[filepath] = exc_info
@@ -177,6 +196,7 @@ class PluginDiscoverContext(object):
                 filepath, module = item
                 result.add_module(module)
                 for cls in classes_from_module(superclass, module):
+                    self._reset_class_attributes(cls)
                     if cls is superclass or cls in ignore_classes:
                         result.ignored_plugins.add(cls)
                         continue
@@ -204,6 +224,18 @@ class PluginDiscoverContext(object):
             return result
         return result.plugins
 
+    def _reset_class_attributes(self, cls):
+        attributes = self._attributes_by_class.get(cls)
+        if attributes is None:
+            self._attributes_by_class[cls] = get_class_attributes(cls)
+        else:
+            restore_class_attributes(cls, attributes)
+
+    def clear_modules_cache(self):
+        """Clear cached modules so all files are imported on next discover."""
+        self._modules_cache = {}
+        self._attributes_by_class = weakref.WeakKeyDictionary()
+
     def register_plugin(self, superclass, cls):
         """Register a directory containing plug-ins of type `superclass`
 
@@ -273,7 +305,8 @@ def discover(
     superclass,
     allow_duplicates=True,
     ignore_classes=None,
-    return_report=False
+    return_report=False,
+    force=False
 ):
     """Find and return subclasses of `superclass`
 
@@ -283,6 +316,8 @@ def discover(
         ignore_classes (list): List of classes that will be ignored
             and not added to result.
         return_report (bool): Output will be full report if set to 'True'.
+        force (bool): Import all files from registered paths again
+            instead of using cached modules.
 
     Returns:
         Union[DiscoverResult, list[Any]]: Object holding successfully
@@ -295,7 +330,8 @@ def discover(
         superclass,
         allow_duplicates,
         ignore_classes,
-        return_report
+        return_report,
+        force
     )
 
 
@@ -27,6 +27,7 @@ from .lib import (
     get_publish_template_name,
 
     publish_plugins_discover,
+    clear_publish_plugins_cache,
     load_help_content_from_plugin,
     load_help_content_from_filepath,
 
@@ -42,6 +43,10 @@ from .lib import (
     get_plugin_settings,
     get_publish_instance_label,
     get_publish_instance_families,
+
+    PublishEntitiesIndex,
+    PublishOperationsError,
+    PublishOperations,
 )
 
 from .abstract_expected_files import ExpectedFiles
@@ -76,6 +81,7 @@ __all__ = (
     "get_publish_template_name",
 
     "publish_plugins_discover",
+    "clear_publish_plugins_cache",
     "load_help_content_from_plugin",
     "load_help_content_from_filepath",
 
@@ -92,6 +98,10 @@ __all__ = (
     "get_publish_instance_label",
     "get_publish_instance_families",
 
+    "PublishEntitiesIndex",
+    "PublishOperationsError",
+    "PublishOperations",
+
     "ExpectedFiles",
 
     "RenderInstance",
@@ -1,7 +1,11 @@
 import os
 import sys
+import time
+import json
+import hashlib
 import inspect
 import copy
+import weakref
 import tempfile
 import xml.etree.ElementTree
 
@@ -9,9 +13,20 @@ import pyblish.util
 import pyblish.plugin
 import pyblish.api
 
+from ayon_core.client import (
+    get_subsets,
+    get_versions,
+    get_representations,
+)
+from ayon_core.client.operations import (
+    OperationsSession,
+    FailedOperations,
+)
 from ayon_core.lib import (
     Logger,
-    import_filepath,
+    modules_from_path,
+    get_class_attributes,
+    restore_class_attributes,
     filter_profiles,
     is_func_signature_supported,
 )
@@ -214,15 +229,58 @@ def load_help_content_from_plugin(plugin):
     return load_help_content_from_filepath(filepath)
 
 
-def publish_plugins_discover(paths=None):
+class _PublishPluginsCache:
+    """In-process cache used by publish plugins discovery and filtering.
+
+    Modules are cached by file path with modification time and size of the
+    file, so only new or changed files are imported again. Plugin classes
+    remember key of settings that were applied on them, and snapshot of
+    their attributes before settings were applied for the first time, so
+    settings are applied again only when they changed.
+    """
+
+    # Imported modules by file path used by 'modules_from_path'
+    modules_by_path = {}
+    # Settings key applied on plugin class
+    settings_key_by_plugin = weakref.WeakKeyDictionary()
+    # Class attributes of plugin before settings were applied
+    attributes_by_plugin = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def clear(cls):
+        cls.modules_by_path = {}
+        cls.settings_key_by_plugin = weakref.WeakKeyDictionary()
+        cls.attributes_by_plugin = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def is_settings_applied(cls, plugin, settings_key):
+        return cls.settings_key_by_plugin.get(plugin) == settings_key
+
+    @classmethod
+    def prepare_settings_apply(cls, plugin, settings_key):
+        """Restore plugin attributes before settings are applied again."""
+
+        attributes = cls.attributes_by_plugin.get(plugin)
+        if attributes is None:
+            cls.attributes_by_plugin[plugin] = get_class_attributes(plugin)
+        else:
+            restore_class_attributes(plugin, attributes)
+        cls.settings_key_by_plugin[plugin] = settings_key
+
+
+def publish_plugins_discover(paths=None, force=False):
     """Find and return available pyblish plug-ins
 
     Overridden function from `pyblish` module to be able to collect
         crashed files and reason of their crash.
 
+    Modules of files that did not change since last discovery are not
+    imported again.
+
     Arguments:
         paths (list, optional): Paths to discover plug-ins from.
             If no paths are provided, all paths are searched.
+        force (Optional[bool]): Import all files again.
     """
 
     # The only difference with `pyblish.api.discover`
@@ -243,33 +301,20 @@ def publish_plugins_discover(paths=None):
         if not os.path.isdir(path):
             continue
 
-        for fname in os.listdir(path):
-            if fname.startswith("_"):
-                continue
-
-            abspath = os.path.join(path, fname)
-
-            if not os.path.isfile(abspath):
-                continue
-
-            mod_name, mod_ext = os.path.splitext(fname)
-
-            if mod_ext != ".py":
-                continue
-
-            try:
-                module = import_filepath(abspath, mod_name)
-
-                # Store reference to original module, to avoid
-                # garbage collection from collecting it's global
-                # imports, such as `import os`.
-                sys.modules[abspath] = module
+        start_time = time.time()
+        modules, crashed = modules_from_path(
+            path, _PublishPluginsCache.modules_by_path, force
+        )
+        for abspath, exc_info in crashed:
+            result.crashed_file_paths[abspath] = exc_info
 
-            except Exception as err:
-                result.crashed_file_paths[abspath] = sys.exc_info()
+            log.debug("Skipped: \"%s\" (%s)", abspath, exc_info[1])
 
-                log.debug("Skipped: \"%s\" (%s)", mod_name, err)
-                continue
+        for abspath, module in modules:
+            # Store reference to original module, to avoid
+            # garbage collection from collecting it's global
+            # imports, such as `import os`.
+            sys.modules[abspath] = module
 
             for plugin in pyblish.plugin.plugins_from_module(module):
                 # Ignore base plugin classes
@@ -291,6 +336,11 @@ def publish_plugins_discover(paths=None):
                 key = "{0}.{1}".format(plugin.__module__, plugin.__name__)
                 plugins[key] = plugin
 
+        log.debug(
+            "Discovered plugins in \"%s\" in %.3fs",
+            path, time.time() - start_time
+        )
+
     # Include plug-ins from registration.
     # Directly registered plug-ins take precedence.
     for plugin in pyblish.plugin.registered_plugins():
@@ -315,6 +365,16 @@ def publish_plugins_discover(paths=None):
     return result
 
 
+def clear_publish_plugins_cache():
+    """Clear cached plugin modules and applied settings.
+
+    All plugin files are imported and settings applied again on next
+    discovery.
+    """
+
+    _PublishPluginsCache.clear()
+
+
 def get_plugin_settings(plugin, project_settings, log, category=None):
     """Get plugin settings based on host name and plugin name.
 
@@ -441,49 +501,79 @@ def filter_pyblish_plugins(plugins):
 
     project_settings = get_project_settings(project_name)
     system_settings = get_system_settings()
-
+    settings_key = hashlib.md5(
+        json.dumps(
+            [host_name, project_name, project_settings, system_settings],
+            sort_keys=True,
+            default=str
+        ).encode("utf-8")
+    ).hexdigest()
+
+    start_time = time.time()
+    applied_count = 0
     # iterate over plugins
     for plugin in plugins[:]:
-        # Apply settings to plugins
-
-        apply_settings_func = getattr(plugin, "apply_settings", None)
-        if apply_settings_func is not None:
-            # Use classmethod 'apply_settings'
-            # - can be used to target settings from custom settings place
-            # - skip default behavior when successful
-            try:
-                # Support to pass only project settings
-                # - make sure that both settings are passed, when can be
-                #   - that covers cases when *args are in method parameters
-                both_supported = is_func_signature_supported(
-                    apply_settings_func, project_settings, system_settings
-                )
-                project_supported = is_func_signature_supported(
-                    apply_settings_func, project_settings
-                )
-                if not both_supported and project_supported:
-                    plugin.apply_settings(project_settings)
-                else:
-                    plugin.apply_settings(project_settings, system_settings)
-
-            except Exception:
-                log.warning(
-                    (
-                        "Failed to apply settings on plugin {}"
-                    ).format(plugin.__name__),
-                    exc_info=True
-                )
-        else:
-            # Automated
-            plugin_settins = get_plugin_settings(
-                plugin, project_settings, log, host_name
+        # Apply settings to plugins only if were not applied with the
+        #   same settings already
+        if not _PublishPluginsCache.is_settings_applied(
+            plugin, settings_key
+        ):
+            _PublishPluginsCache.prepare_settings_apply(plugin, settings_key)
+            _apply_settings_on_plugin(
+                plugin, project_settings, system_settings, host_name, log
             )
-            apply_plugin_settings_automatically(plugin, plugin_settins, log)
+            applied_count += 1
 
         # Remove disabled plugins
         if getattr(plugin, "enabled", True) is False:
             plugins.remove(plugin)
 
+    log.debug(
+        "Settings applied on {} of {} plugins in {:.3f}s".format(
+            applied_count, len(plugins), time.time() - start_time
+        )
+    )
+
+
+def _apply_settings_on_plugin(
+    plugin, project_settings, system_settings, host_name, log
+):
+    """Apply settings on single plugin."""
+
+    apply_settings_func = getattr(plugin, "apply_settings", None)
+    if apply_settings_func is not None:
+        # Use classmethod 'apply_settings'
+        # - can be used to target settings from custom settings place
+        # - skip default behavior when successful
+        try:
+            # Support to pass only project settings
+            # - make sure that both settings are passed, when can be
+            #   - that covers cases when *args are in method parameters
+            both_supported = is_func_signature_supported(
+                apply_settings_func, project_settings, system_settings
+            )
+            project_supported = is_func_signature_supported(
+                apply_settings_func, project_settings
+            )
+            if not both_supported and project_supported:
+                plugin.apply_settings(project_settings)
+            else:
+                plugin.apply_settings(project_settings, system_settings)
+
+        except Exception:
+            log.warning(
+                (
+                    "Failed to apply settings on plugin {}"
+                ).format(plugin.__name__),
+                exc_info=True
+            )
+    else:
+        # Automated
+        plugin_settins = get_plugin_settings(
+            plugin, project_settings, log, host_name
+        )
+        apply_plugin_settings_automatically(plugin, plugin_settins, log)
+
 
 def remote_publish(log):
     """Loops through all plugins, logs to console. Used for tests.
@@ -495,7 +585,8 @@ def remote_publish(log):
     # Error exit as soon as any error occurs.
     error_format = "Failed {plugin.__name__}: {error}\n{error.traceback}"
 
-    for result in pyblish.util.publish_iter():
+    plugins = publish_plugins_discover().plugins
+    for result in pyblish.util.publish_iter(plugins=plugins):
         if not result["error"]:
             continue
 
@@ -846,8 +937,7 @@ def replace_with_published_scene_path(instance, replace_in_path=True):
     template_data["comment"] = None
 
     anatomy = instance.context.data['anatomy']
-    anatomy_filled = anatomy.format(template_data)
-    template_filled = anatomy_filled["publish"]["path"]
+    template_filled = anatomy.format_key("publish", "path", template_data)
     file_path = os.path.normpath(template_filled)
 
     log.info("Using published scene for render {}".format(file_path))
@@ -975,3 +1065,424 @@ def get_publish_instance_families(instance):
         families.discard(family)
     output.extend(families)
     return output
+
+
+class PublishEntitiesIndex(object):
+    """In-memory index of existing subsets, versions and representations.
+
+    Integration needs to know which subset, version and representations
+    already exist for each published instance. Querying them one by one
+    means several server round-trips per instance, so the index can be
+    filled for all instances at once with 'prefetch' which uses only three
+    bulk queries.
+
+    Lookups of keys that were not prefetched are queried on demand and
+    stored too. Keys that were prefetched but were not found are stored
+    with 'None' so they're not queried again.
+
+    Versions are stored only with '_id' and representations with '_id'
+    and 'name', the same fields integration was querying.
+
+    Args:
+        project_name (str): Project name.
+    """
+
+    def __init__(self, project_name):
+        self._project_name = project_name
+        # (asset_id, subset_name) -> subset document or None
+        self._subsets_by_key = {}
+        # (subset_id, version) -> version document or None
+        self._versions_by_key = {}
+        # version_id -> list of representation documents
+        self._repres_by_version_id = {}
+
+    @property
+    def project_name(self):
+        return self._project_name
+
+    def prefetch(self, keys):
+        """Query entities for passed keys in bulk.
+
+        Args:
+            keys (Iterable[tuple[str, str, Union[int, None]]]): Asset id,
+                subset name and version number. Version number can be
+                'None' if only subset should be prefetched.
+        """
+
+        keys = list(keys)
+
+        names_by_asset_ids = {}
+        for asset_id, subset_name, _ in keys:
+            subset_key = (asset_id, subset_name)
+            if subset_key not in self._subsets_by_key:
+                names_by_asset_ids.setdefault(asset_id, set()).add(
+                    subset_name)
+
+        if names_by_asset_ids:
+            for asset_id, subset_names in names_by_asset_ids.items():
+                for subset_name in subset_names:
+                    self._subsets_by_key[(asset_id, subset_name)] = None
+
+            for subset_doc in get_subsets(
+                self._project_name, names_by_asset_ids=names_by_asset_ids
+            ):
+                subset_key = (subset_doc["parent"], subset_doc["name"])
+                self._subsets_by_key[subset_key] = subset_doc
+
+        version_keys = set()
+        for asset_id, subset_name, version in keys:
+            subset_doc = self._subsets_by_key.get((asset_id, subset_name))
+            if subset_doc is None or version is None:
+                continue
+            version_key = (subset_doc["_id"], version)
+            if version_key not in self._versions_by_key:
+                version_keys.add(version_key)
+
+        if not version_keys:
+            return
+
+        for version_key in version_keys:
+            self._versions_by_key[version_key] = None
+
+        subset_ids = {subset_id for subset_id, _ in version_keys}
+        versions = {version for _, version in version_keys}
+        new_version_ids = set()
+        for version_doc in get_versions(
+            self._project_name,
+            subset_ids=subset_ids,
+            versions=versions,
+            fields=["_id", "parent", "name"]
+        ):
+            version_key = (version_doc["parent"], version_doc["name"])
+            # Query returns cross product of subsets and versions
+            if version_key not in version_keys:
+                continue
+            self._versions_by_key[version_key] = {"_id": version_doc["_id"]}
+            new_version_ids.add(version_doc["_id"])
+
+        if not new_version_ids:
+            return
+
+        for version_id in new_version_ids:
+            self._repres_by_version_id[version_id] = []
+
+        for repre_doc in get_representations(
+            self._project_name,
+            version_ids=new_version_ids,
+            fields=["_id", "name", "parent"]
+        ):
+            self._repres_by_version_id[repre_doc["parent"]].append({
+                "_id": repre_doc["_id"],
+                "name": repre_doc["name"],
+            })
+
+    def get_subset(self, asset_id, subset_name):
+        """Existing subset document.
+
+        Args:
+            asset_id (str): Asset id.
+            subset_name (str): Subset name.
+
+        Returns:
+            Union[dict[str, Any], None]: Subset document or None if subset
+                does not exist.
+        """
+
+        key = (asset_id, subset_name)
+        if key not in self._subsets_by_key:
+            self.prefetch([(asset_id, subset_name, None)])
+        return self._subsets_by_key[key]
+
+    def get_version(self, subset_id, version):
+        """Existing version document with '_id' field.
+
+        Args:
+            subset_id (str): Subset id.
+            version (int): Version number.
+
+        Returns:
+            Union[dict[str, Any], None]: Version document or None if version
+                does not exist.
+        """
+
+        key = (subset_id, version)
+        if key not in self._versions_by_key:
+            self._versions_by_key[key] = None
+            for version_doc in get_versions(
+                self._project_name,
+                subset_ids=[subset_id],
+                versions=[version],
+                fields=["_id"]
+            ):
+                self._versions_by_key[key] = {"_id": version_doc["_id"]}
+                break
+        return self._versions_by_key[key]
+
+    def get_representations(self, version_id):
+        """Existing representation documents with '_id' and 'name' fields.
+
+        Args:
+            version_id (str): Version id.
+
+        Returns:
+            list[dict[str, Any]]: Representation documents.
+        """
+
+        if version_id not in self._repres_by_version_id:
+            self._repres_by_version_id[version_id] = [
+                {"_id": repre_doc["_id"], "name": repre_doc["name"]}
+                for repre_doc in get_representations(
+                    self._project_name,
+                    version_ids=[version_id],
+                    fields=["_id", "name"]
+                )
+            ]
+        return list(self._repres_by_version_id[version_id])
+
+    def set_subset(self, asset_id, subset_name, subset_doc):
+        """Store subset document of integrated subset.
+
+        Integration should store new state of entities because they might
+        not be committed to server yet when other instance integrates
+        the same subset.
+
+        Args:
+            asset_id (str): Asset id.
+            subset_name (str): Subset name.
+            subset_doc (dict[str, Any]): Subset document.
+        """
+
+        self._subsets_by_key[(asset_id, subset_name)] = subset_doc
+
+    def set_version(self, subset_id, version, version_doc):
+        """Store version document of integrated version.
+
+        Args:
+            subset_id (str): Subset id.
+            version (int): Version number.
+            version_doc (dict[str, Any]): Version document.
+        """
+
+        self._versions_by_key[(subset_id, version)] = {
+            "_id": version_doc["_id"]
+        }
+
+    def set_representations(self, version_id, repre_docs):
+        """Store representation documents of integrated version.
+
+        Args:
+            version_id (str): Version id.
+            repre_docs (Iterable[dict[str, Any]]): Representation documents.
+        """
+
+        self._repres_by_version_id[version_id] = [
+            {"_id": repre_doc["_id"], "name": repre_doc["name"]}
+            for repre_doc in repre_docs
+        ]
+
+
+class PublishOperationsError(Exception):
+    """Commit of publish operations failed.
+
+    Args:
+        message (str): Error message.
+        instances (list[pyblish.api.Instance]): Instances of which
+            operations were not committed.
+        errors (Optional[list[tuple[pyblish.api.Instance, str]]]): Error
+            message of each instance which operations failed.
+    """
+
+    def __init__(self, message, instances, errors=None):
+        super(PublishOperationsError, self).__init__(message)
+        self.instances = instances
+        self.errors = list(errors or [])
+
+
+def _rollback_publish_operations_items(items):
+    """Rollback file transactions of operations that were not committed.
+
+    Called on garbage collection of 'PublishOperations' or on exit of
+    process, e.g. when publishing was stopped or crashed before the
+    operations were committed.
+    """
+
+    while items:
+        file_transactions = items.pop(0)["file_transactions"]
+        if file_transactions is not None:
+            file_transactions.rollback()
+
+
+class PublishOperations(object):
+    """Entity operations of integrated instances committed at once.
+
+    Integrators add operations session of each instance instead of
+    committing it. All sessions are committed together in requests with
+    limited number of operations which avoids a server request per instance.
+    Operations of one instance are never split between requests so they
+    are committed atomically.
+
+    File transactions of instances are finalized after their operations
+    are committed, or rolled back when commit of the operations failed.
+    File transactions of operations which were never committed are rolled
+    back when the object is garbage collected or when the process exits.
+
+    Args:
+        max_operations_per_request (Optional[int]): Maximum number of
+            operations sent in one request. Instance with more operations
+            is sent in a request on its own.
+        con (Optional[ServerAPI]): Connection to server.
+    """
+
+    def __init__(self, max_operations_per_request=None, con=None):
+        self._max_operations_per_request = max_operations_per_request
+        self._con = con
+        self._items = []
+        self._finalizer = weakref.finalize(
+            self, _rollback_publish_operations_items, self._items
+        )
+
+    def __len__(self):
+        return len(self._items)
+
+    def add(self, instance, op_session, file_transactions=None):
+        """Add operations of an instance.
+
+        Args:
+            instance (pyblish.api.Instance): Instance which created the
+                operations.
+            op_session (OperationsSession): Session with operations.
+            file_transactions (Optional[FileTransaction]): Transferred files
+                of the instance.
+        """
+
+        self._items.append({
+            "instance": instance,
+            "operations": op_session.operations,
+            "file_transactions": file_transactions,
+        })
+
+    def rollback(self):
+        """Rollback file transactions of all operations not committed."""
+
+        _rollback_publish_operations_items(self._items)
+
+    def commit(self, logger=None):
+        """Commit all added operations.
+
+        When a request with operations of multiple instances fails, the
+        operations are committed again per instance, so only instances
+        which operations are failing are not integrated.
+
+        Args:
+            logger (Optional[logging.Logger]): Logger used for output.
+
+        Raises:
+            PublishOperationsError: When operations of any instance failed.
+        """
+
+        if logger is None:
+            logger = Logger.get_logger(self.__class__.__name__)
+
+        errors = []
+        for chunk in self._split_to_chunks(list(self._items)):
+            logger.debug(
+                "Committing {} operations of {} instances.".format(
+                    sum(len(item["operations"]) for item in chunk),
+                    len(chunk)
+                )
+            )
+            try:
+                self._commit_items(chunk)
+
+            except FailedOperations as exc:
+                if len(chunk) == 1:
+                    self._rollback_item(chunk[0])
+                    errors.append((chunk[0]["instance"], str(exc)))
+                    continue
+
+                logger.debug(
+                    "Commit of multiple instances failed."
+                    " Committing operations per instance."
+                )
+                committed_ids = set(exc.committed_operation_ids)
+                for item in chunk:
+                    if committed_ids and all(
+                        operation.id in committed_ids
+                        for operation in item["operations"]
+                    ):
+                        self._finalize_item(item)
+                        continue
+
+                    try:
+                        self._commit_items([item])
+                    except FailedOperations as item_exc:
+                        self._rollback_item(item)
+                        errors.append((item["instance"], str(item_exc)))
+                        continue
+                    self._finalize_item(item)
+                continue
+
+            for item in chunk:
+                self._finalize_item(item)
+
+        if not errors:
+            return
+
+        instances = [instance for instance, _ in errors]
+        raise PublishOperationsError(
+            "Failed to integrate instances {}.\n{}".format(
+                ", ".join(
+                    get_publish_instance_label(instance)
+                    for instance in instances
+                ),
+                "\n".join(message for _, message in errors)
+            ),
+            instances,
+            errors
+        )
+
+    def _commit_items(self, items):
+        op_session = OperationsSession(con=self._con)
+        for item in items:
+            op_session.extend(item["operations"])
+        op_session.commit()
+
+    def _finalize_item(self, item):
+        self._remove_item(item)
+        file_transactions = item["file_transactions"]
+        if file_transactions is not None:
+            file_transactions.finalize()
+
+    def _rollback_item(self, item):
+        self._remove_item(item)
+        file_transactions = item["file_transactions"]
+        if file_transactions is not None:
+            file_transactions.rollback()
+
+    def _remove_item(self, item):
+        self._items[:] = [
+            _item
+            for _item in self._items
+            if _item is not item
+        ]
+
+    def _split_to_chunks(self, items):
+        max_operations = self._max_operations_per_request
+        if not max_operations or max_operations < 1:
+            return [items] if items else []
+
+        chunks = []
+        chunk = []
+        chunk_size = 0
+        for item in items:
+            item_size = len(item["operations"])
+            if chunk and chunk_size + item_size > max_operations:
+                chunks.append(chunk)
+                chunk = []
+                chunk_size = 0
+            chunk.append(item)
+            chunk_size += item_size
+
+        if chunk:
+            chunks.append(chunk)
+        return chunks
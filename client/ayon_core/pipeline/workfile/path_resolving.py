@@ -1,7 +1,11 @@
 import os
 import re
 import copy
+import time
 import platform
+import threading
+import collections
+from concurrent.futures import ThreadPoolExecutor
 
 from ayon_core.client import get_project, get_asset_by_name
 from ayon_core.settings import get_project_settings
@@ -188,6 +192,244 @@ def get_workdir(
     )
 
 
+class _WorkdirIndex(object):
+    """Filenames in work directory scanned with single 'os.scandir' pass.
+
+    Index is valid until modification time of the directory changes. Files
+    matching a template are cached per filled template regex.
+
+    Args:
+        workdir (str): Path to directory.
+    """
+
+    # Directory modification time may have low resolution on some
+    #   filesystems, index is not trusted if directory was modified shortly
+    #   before it was scanned
+    mtime_resolution = 2.0
+
+    def __init__(self, workdir):
+        self.workdir = workdir
+        self._dir_mtime = None
+        self._trusted = False
+        self._filenames_by_ext = {}
+        self._matches_by_pattern = {}
+
+    def is_valid(self, dir_mtime):
+        return self._trusted and self._dir_mtime == dir_mtime
+
+    def scan(self, dir_mtime):
+        filenames_by_ext = collections.defaultdict(list)
+        for entry in os.scandir(self.workdir):
+            filename = entry.name
+            ext = os.path.splitext(filename)[-1]
+            if ext:
+                filenames_by_ext[ext].append(filename)
+
+        for filenames in filenames_by_ext.values():
+            filenames.sort()
+
+        self._dir_mtime = dir_mtime
+        self._trusted = time.time() - dir_mtime > self.mtime_resolution
+        self._filenames_by_ext = dict(filenames_by_ext)
+        self._matches_by_pattern = {}
+
+    def get_last_version(self, regex, dotted_extensions):
+        """Get highest version and filenames matching it.
+
+        Args:
+            regex (re.Pattern): Compiled regex of filled template.
+            dotted_extensions (frozenset[str]): Allowed extensions.
+
+        Returns:
+            tuple[Union[int, None], list[str]]: Highest version and
+                filenames with the version.
+        """
+
+        key = (regex, dotted_extensions)
+        output = self._matches_by_pattern.get(key)
+        if output is not None:
+            return output
+
+        # Fast match on extension
+        filenames = []
+        for ext in dotted_extensions:
+            filenames.extend(self._filenames_by_ext.get(ext, []))
+
+        # Get highest version among existing matching files
+        version = None
+        output_filenames = []
+        for filename in sorted(filenames):
+            match = regex.match(filename)
+            if not match:
+                continue
+
+            if not match.groups():
+                output_filenames.append(filename)
+                continue
+
+            file_version = int(match.group(1))
+            if version is None or file_version > version:
+                output_filenames[:] = []
+                version = file_version
+
+            if file_version == version:
+                output_filenames.append(filename)
+
+        output = (version, output_filenames)
+        self._matches_by_pattern[key] = output
+        return output
+
+
+class _WorkfileTemplateMatchers:
+    """Cache of work directory indexes and compiled template regexes."""
+
+    max_indexes = 256
+    max_templates = 64
+    max_regexes = 1024
+    indexes_by_workdir = collections.OrderedDict()
+    lock = threading.Lock()
+    templates_by_key = collections.OrderedDict()
+    regexes_by_pattern = collections.OrderedDict()
+
+    @classmethod
+    def get_workdir_index(cls, workdir):
+        """Get valid index of work directory.
+
+        Returns:
+            Union[_WorkdirIndex, None]: Index or None if directory does
+                not exist.
+        """
+
+        try:
+            dir_mtime = os.stat(workdir).st_mtime
+        except OSError:
+            return None
+
+        with cls.lock:
+            index = cls.indexes_by_workdir.get(workdir)
+
+        if index is None or not index.is_valid(dir_mtime):
+            index = _WorkdirIndex(workdir)
+            try:
+                index.scan(dir_mtime)
+            except OSError:
+                return None
+
+        with cls.lock:
+            cls.indexes_by_workdir.pop(workdir, None)
+            cls.indexes_by_workdir[workdir] = index
+            while len(cls.indexes_by_workdir) > cls.max_indexes:
+                cls.indexes_by_workdir.popitem(last=False)
+        return index
+
+    @classmethod
+    def get_regex(cls, file_template, fill_data, dotted_extensions):
+        """Compiled regex of filled file template."""
+
+        key = (file_template, dotted_extensions)
+        template = cls._get_cached(cls.templates_by_key, key)
+        if template is None:
+            template = cls._prepare_template(file_template, dotted_extensions)
+            cls._set_cached(
+                cls.templates_by_key, key, template, cls.max_templates
+            )
+
+        pattern = StringTemplate.format_strict_template(template, fill_data)
+        regex = cls._get_cached(cls.regexes_by_pattern, pattern)
+        if regex is None:
+            # Match with ignore case on Windows due to the Windows
+            # OS not being case-sensitive. This avoids later running
+            # into the error that the file did exist if it existed
+            # with a different upper/lower-case.
+            flags = 0
+            if platform.system().lower() == "windows":
+                flags = re.IGNORECASE
+            regex = re.compile(pattern, flags)
+            cls._set_cached(
+                cls.regexes_by_pattern, pattern, regex, cls.max_regexes
+            )
+        return regex
+
+    @classmethod
+    def _get_cached(cls, cache, key):
+        with cls.lock:
+            value = cache.pop(key, None)
+            if value is not None:
+                # Move to the end as most recently used
+                cache[key] = value
+        return value
+
+    @classmethod
+    def _set_cached(cls, cache, key, value, max_items):
+        with cls.lock:
+            cache.pop(key, None)
+            cache[key] = value
+            while len(cache) > max_items:
+                cache.popitem(last=False)
+
+    @staticmethod
+    def _prepare_template(file_template, dotted_extensions):
+        # Build template without optionals, version to digits only regex
+        # and comment to any definable value.
+        # Escape extensions dot for regex
+        regex_exts = [
+            "\\" + ext
+            for ext in sorted(dotted_extensions)
+        ]
+        ext_expression = "(?:" + "|".join(regex_exts) + ")"
+
+        # Replace `.{ext}` with `{ext}` so we are sure there is not dot at
+        #   the end
+        file_template = re.sub(r"\.?{ext}", ext_expression, file_template)
+        # Replace optional keys with optional content regex
+        file_template = re.sub(r"<.*?>", r".*?", file_template)
+        # Replace `{version}` with group regex
+        file_template = re.sub(r"{version.*?}", r"([0-9]+)", file_template)
+        file_template = re.sub(r"{comment.*?}", r".+?", file_template)
+        return file_template
+
+
+def _get_dotted_extensions(extensions):
+    dotted_extensions = set()
+    for ext in extensions:
+        if not ext.startswith("."):
+            ext = ".{}".format(ext)
+        dotted_extensions.add(ext)
+    return frozenset(dotted_extensions)
+
+
+def _get_last_workfile_from_index(
+    index, file_template, fill_data, extensions
+):
+    if index is None:
+        return None, None
+
+    dotted_extensions = _get_dotted_extensions(extensions)
+    regex = _WorkfileTemplateMatchers.get_regex(
+        file_template, fill_data, dotted_extensions
+    )
+    version, output_filenames = index.get_last_version(
+        regex, dotted_extensions
+    )
+
+    output_filename = None
+    if output_filenames:
+        if len(output_filenames) == 1:
+            output_filename = output_filenames[0]
+        else:
+            # Modification time of files is not cached because modification
+            #   of a file does not change modification time of directory
+            last_time = None
+            for _output_filename in output_filenames:
+                full_path = os.path.join(index.workdir, _output_filename)
+                mod_time = os.path.getmtime(full_path)
+                if last_time is None or last_time < mod_time:
+                    output_filename = _output_filename
+                    last_time = mod_time
+
+    return output_filename, version
+
+
 def get_last_workfile_with_version(
     workdir, file_template, fill_data, extensions
 ):
@@ -202,6 +444,9 @@ def get_last_workfile_with_version(
     The last modified file is used if more files can be considered as
     last workfile.
 
+    Content of work directory is cached until modification time of the
+    directory changes.
+
     Args:
         workdir (str): Path to dir where workfiles are stored.
         file_template (str): Template of file name.
@@ -213,84 +458,44 @@ def get_last_workfile_with_version(
             if there is any workfile otherwise None for both.
     """
 
-    if not os.path.exists(workdir):
-        return None, None
-
-    dotted_extensions = set()
-    for ext in extensions:
-        if not ext.startswith("."):
-            ext = ".{}".format(ext)
-        dotted_extensions.add(ext)
-
-    # Fast match on extension
-    filenames = [
-        filename
-        for filename in os.listdir(workdir)
-        if os.path.splitext(filename)[-1] in dotted_extensions
-    ]
-
-    # Build template without optionals, version to digits only regex
-    # and comment to any definable value.
-    # Escape extensions dot for regex
-    regex_exts = [
-        "\\" + ext
-        for ext in dotted_extensions
-    ]
-    ext_expression = "(?:" + "|".join(regex_exts) + ")"
-
-    # Replace `.{ext}` with `{ext}` so we are sure there is not dot at the end
-    file_template = re.sub(r"\.?{ext}", ext_expression, file_template)
-    # Replace optional keys with optional content regex
-    file_template = re.sub(r"<.*?>", r".*?", file_template)
-    # Replace `{version}` with group regex
-    file_template = re.sub(r"{version.*?}", r"([0-9]+)", file_template)
-    file_template = re.sub(r"{comment.*?}", r".+?", file_template)
-    file_template = StringTemplate.format_strict_template(
-        file_template, fill_data
+    index = _WorkfileTemplateMatchers.get_workdir_index(workdir)
+    return _get_last_workfile_from_index(
+        index, file_template, fill_data, extensions
     )
 
-    # Match with ignore case on Windows due to the Windows
-    # OS not being case-sensitive. This avoids later running
-    # into the error that the file did exist if it existed
-    # with a different upper/lower-case.
-    kwargs = {}
-    if platform.system().lower() == "windows":
-        kwargs["flags"] = re.IGNORECASE
-
-    # Get highest version among existing matching files
-    version = None
-    output_filenames = []
-    for filename in sorted(filenames):
-        match = re.match(file_template, filename, **kwargs)
-        if not match:
-            continue
 
-        if not match.groups():
-            output_filenames.append(filename)
-            continue
+def get_last_workfiles_with_version(items, max_workers=None):
+    """Return last workfile versions for multiple contexts at once.
 
-        file_version = int(match.group(1))
-        if version is None or file_version > version:
-            output_filenames[:] = []
-            version = file_version
+    Each work directory is scanned only once, directories are scanned in
+    parallel.
 
-        if file_version == version:
-            output_filenames.append(filename)
+    Args:
+        items (Iterable[tuple[str, str, dict[str, Any], Iterable[str]]]):
+            Arguments of 'get_last_workfile_with_version' for each context
+            as tuple of workdir, file template, fill data and extensions.
+        max_workers (Optional[int]): Number of threads scanning
+            directories.
 
-    output_filename = None
-    if output_filenames:
-        if len(output_filenames) == 1:
-            output_filename = output_filenames[0]
-        else:
-            last_time = None
-            for _output_filename in output_filenames:
-                full_path = os.path.join(workdir, _output_filename)
-                mod_time = os.path.getmtime(full_path)
-                if last_time is None or last_time < mod_time:
-                    output_filename = _output_filename
-                    last_time = mod_time
+    Returns:
+        list[tuple[Union[str, None], Union[int, None]]]: Last workfile with
+            version for each item in the same order.
+    """
 
-    return output_filename, version
+    items = list(items)
+    workdirs = {item[0] for item in items}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        indexes_by_workdir = dict(zip(
+            workdirs,
+            executor.map(_WorkfileTemplateMatchers.get_workdir_index, workdirs)
+        ))
+
+    return [
+        _get_last_workfile_from_index(
+            indexes_by_workdir[workdir], file_template, fill_data, extensions
+        )
+        for workdir, file_template, fill_data, extensions in items
+    ]
 
 
 def get_last_workfile(
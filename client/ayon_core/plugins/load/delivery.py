@@ -1,6 +1,4 @@
-import copy
 import platform
-from collections import defaultdict
 
 from qtpy import QtWidgets, QtCore, QtGui
 
@@ -8,18 +6,8 @@ from ayon_core.client import get_representations
 from ayon_core.pipeline import load, Anatomy
 from ayon_core import resources, style
 
-from ayon_core.lib import (
-    format_file_size,
-    collect_frames,
-    get_datetime_data,
-)
-from ayon_core.pipeline.load import get_representation_path_with_anatomy
-from ayon_core.pipeline.delivery import (
-    get_format_dict,
-    check_destination_path,
-    deliver_single_file,
-    deliver_sequence,
-)
+from ayon_core.lib import format_file_size
+from ayon_core.pipeline.delivery import RepresentationsDelivery
 
 
 class Delivery(load.SubsetLoaderPlugin):
@@ -184,92 +172,23 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
         self.btn_delivery.setEnabled(False)
         QtWidgets.QApplication.processEvents()
 
-        report_items = defaultdict(list)
-
         selected_repres = self._get_selected_repres()
 
-        datetime_data = get_datetime_data()
-        template_name = self.dropdown.currentText()
-        format_dict = get_format_dict(self.anatomy, self.root_line_edit.text())
-        renumber_frame = self.renumber_frame.isChecked()
-        frame_offset = self.first_frame_start.value()
-        for repre in self._representations:
-            if repre["name"] not in selected_repres:
-                continue
-
-            repre_path = get_representation_path_with_anatomy(
-                repre, self.anatomy
-            )
-
-            anatomy_data = copy.deepcopy(repre["context"])
-            new_report_items = check_destination_path(str(repre["_id"]),
-                                                      self.anatomy,
-                                                      anatomy_data,
-                                                      datetime_data,
-                                                      template_name)
-
-            report_items.update(new_report_items)
-            if new_report_items:
-                continue
-
-            args = [
-                repre_path,
-                repre,
-                self.anatomy,
-                template_name,
-                anatomy_data,
-                format_dict,
-                report_items,
-                self.log
-            ]
-
-            if repre.get("files"):
-                src_paths = []
-                for repre_file in repre["files"]:
-                    src_path = self.anatomy.fill_root(repre_file["path"])
-                    src_paths.append(src_path)
-                sources_and_frames = collect_frames(src_paths)
-
-                frames = set(sources_and_frames.values())
-                frames.discard(None)
-                first_frame = None
-                if frames:
-                    first_frame = min(frames)
-
-                for src_path, frame in sources_and_frames.items():
-                    args[0] = src_path
-                    # Renumber frames
-                    if renumber_frame and frame is not None:
-                        # Calculate offset between
-                        # first frame and current frame
-                        # - '0' for first frame
-                        offset = frame_offset - int(first_frame)
-                        # Add offset to new frame start
-                        dst_frame = int(frame) + offset
-                        if dst_frame < 0:
-                            msg = "Renumber frame has a smaller number than original frame"     # noqa
-                            report_items[msg].append(src_path)
-                            self.log.warning("{} <{}>".format(
-                                msg, dst_frame))
-                            continue
-                        frame = dst_frame
-
-                    if frame is not None:
-                        anatomy_data["frame"] = frame
-                    new_report_items, uploaded = deliver_single_file(*args)
-                    report_items.update(new_report_items)
-                    self._update_progress(uploaded)
-            else:  # fallback for Pype2 and representations without files
-                frame = repre['context'].get('frame')
-                if frame:
-                    repre["context"]["frame"] = len(str(frame)) * "#"
-
-                if not frame:
-                    new_report_items, uploaded = deliver_single_file(*args)
-                else:
-                    new_report_items, uploaded = deliver_sequence(*args)
-                report_items.update(new_report_items)
-                self._update_progress(uploaded)
+        delivery = RepresentationsDelivery(
+            self.anatomy,
+            self.dropdown.currentText(),
+            location_path=self.root_line_edit.text(),
+            renumber_frame=self.renumber_frame.isChecked(),
+            new_frame_start=self.first_frame_start.value(),
+            progress_callback=self._update_progress,
+            log=self.log
+        )
+        delivery.add_representations(
+            repre
+            for repre in self._representations
+            if repre["name"] in selected_repres
+        )
+        report_items = delivery.process()
 
         self.text_area.setText(self._format_report(report_items))
         self.text_area.setVisible(True)
@@ -349,12 +268,13 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
             self.template_label.setText(template_value)
             self.btn_delivery.setEnabled(bool(self._get_selected_repres()))
 
-    def _update_progress(self, uploaded):
-        """Update progress bar after each repre copied."""
-        self.currently_uploaded += uploaded
+    def _update_progress(self, progress):
+        """Update progress bar after each file copied."""
+        self.currently_uploaded = progress.transferred_files
 
-        ratio = self.currently_uploaded / self.files_selected
-        self.progress_bar.setValue(ratio * self.progress_bar.maximum())
+        ratio = float(progress.transferred_files) / progress.total_files
+        self.progress_bar.setValue(int(ratio * self.progress_bar.maximum()))
+        QtWidgets.QApplication.processEvents()
 
     def _format_report(self, report_items):
         """Format final result and error details as html."""
@@ -1,10 +1,13 @@
 import os
 import json
 import copy
+import time
 import tempfile
 import platform
 import shutil
 
+from collections import OrderedDict
+
 import clique
 import six
 import pyblish.api
@@ -13,12 +16,13 @@ from ayon_core import resources, AYON_CORE_ROOT
 from ayon_core.pipeline import publish
 from ayon_core.lib import (
     run_ayon_launcher_process,
+    get_ffprobe_data,
 
     get_transcode_temp_directory,
     convert_input_paths_for_ffmpeg,
     should_convert_for_ffmpeg
 )
-from ayon_core.lib.profiles_filtering import filter_profiles
+from ayon_core.lib.profiles_filtering import get_profile_matcher
 from ayon_core.pipeline.publish.lib import add_repre_files_for_cleanup
 
 
@@ -75,6 +79,9 @@ class ExtractBurnin(publish.Extractor):
     # Configurable by Settings
     profiles = None
     options = None
+    # Render burnins in publish process if burnin script can be imported,
+    #   otherwise AYON launcher process is started for each burnin
+    in_process = True
 
     def process(self, instance):
         if not self.profiles:
@@ -159,8 +166,9 @@ class ExtractBurnin(publish.Extractor):
             "task_types": task_type,
             "subset": subset
         }
-        profile = filter_profiles(self.profiles, filtering_criteria,
-                                  logger=self.log)
+        profile = get_profile_matcher(self.profiles).match(
+            filtering_criteria, logger=self.log
+        )
 
         if not profile:
             self.log.debug((
@@ -186,10 +194,13 @@ class ExtractBurnin(publish.Extractor):
         _burnin_data, _temp_data = self.prepare_basic_data(instance)
 
         anatomy = instance.context.data["anatomy"]
-        scriptpath = self.burnin_script_path()
+        burnin_module = self._get_burnin_module()
+        executable_args = None
+        if burnin_module is None:
+            scriptpath = self.burnin_script_path()
+            # Args that will execute the script
+            executable_args = ["run", scriptpath]
 
-        # Args that will execute the script
-        executable_args = ["run", scriptpath]
         burnins_per_repres = self._get_burnins_per_representations(
             instance, burnin_defs
         )
@@ -275,6 +286,8 @@ class ExtractBurnin(publish.Extractor):
                 #  it in review?
                 # burnin_data["fps"] = fps
 
+            # Ffprobe data of input shared by all burnin definitions
+            ffprobe_data_by_path = {}
             for filename_suffix, burnin_def in repre_burnin_defs.items():
                 new_repre = copy.deepcopy(repre)
                 new_repre["stagingDir"] = src_repre_staging_dir
@@ -328,32 +341,28 @@ class ExtractBurnin(publish.Extractor):
                     "script_data: {}".format(json.dumps(script_data, indent=4))
                 )
 
-                # Dump data to string
-                dumped_script_data = json.dumps(script_data)
-
-                # Store dumped json to temporary file
-                temporary_json_file = tempfile.NamedTemporaryFile(
-                    mode="w", suffix=".json", delete=False
-                )
-                temporary_json_file.write(dumped_script_data)
-                temporary_json_file.close()
-                temporary_json_filepath = temporary_json_file.name.replace(
-                    "\\", "/"
-                )
-
-                # Prepare subprocess arguments
-                args = list(executable_args)
-                args.append(temporary_json_filepath)
-                self.log.debug("Executing: {}".format(" ".join(args)))
-
-                # Run burnin script
-                process_kwargs = {
-                    "logger": self.log
-                }
+                timings = OrderedDict()
+                if burnin_module is not None:
+                    self._render_burnin_in_process(
+                        burnin_module,
+                        script_data,
+                        ffprobe_data_by_path,
+                        timings
+                    )
+                else:
+                    start_time = time.time()
+                    self._render_burnin_in_subprocess(
+                        executable_args, script_data
+                    )
+                    timings["subprocess"] = time.time() - start_time
 
-                run_ayon_launcher_process(*args, **process_kwargs)
-                # Remove the temporary json
-                os.remove(temporary_json_filepath)
+                self.log.info("Burnin \"{}\" timings: {}".format(
+                    new_repre["name"],
+                    ", ".join(
+                        "{} {:.2f}s".format(stage, duration)
+                        for stage, duration in timings.items()
+                    )
+                ))
 
                 for filepath in temp_data["full_input_paths"]:
                     filepath = filepath.replace("\\", "/")
@@ -385,6 +394,109 @@ class ExtractBurnin(publish.Extractor):
                     os.remove(filepath)
                     self.log.debug("Removed: \"{}\"".format(filepath))
 
+    def _get_burnin_module(self):
+        """Burnin script module if can be used in publish process.
+
+        Returns:
+            Union[ModuleType, None]: Burnin module or None if burnins
+                have to be rendered in subprocess.
+        """
+
+        if not self.in_process:
+            return None
+
+        try:
+            from ayon_core.scripts import otio_burnin
+
+        except ImportError:
+            self.log.debug(
+                "Burnin script can't be imported in publish process,"
+                " using AYON launcher process.",
+                exc_info=True
+            )
+            return None
+        return otio_burnin
+
+    def _render_burnin_in_process(
+        self, burnin_module, script_data, ffprobe_data_by_path, timings
+    ):
+        """Render burnin using burnin script module in publish process.
+
+        Input is probed with ffprobe only once, the data are stored to
+        'ffprobe_data_by_path' so they're shared by all burnin definitions
+        of the same input.
+
+        Args:
+            burnin_module (ModuleType): Burnin script module.
+            script_data (dict[str, Any]): Data for burnin script.
+            ffprobe_data_by_path (dict[str, dict]): Ffprobe data by input
+                path.
+            timings (dict[str, float]): Durations of stages are stored here.
+        """
+
+        # Script data must not be changed as they're used for next burnins
+        script_data = copy.deepcopy(script_data)
+        full_input_path = script_data["full_input_path"]
+        ffprobe_data = ffprobe_data_by_path.get(full_input_path)
+        if ffprobe_data is None:
+            start_time = time.time()
+            ffprobe_data = get_ffprobe_data(full_input_path, self.log)
+            ffprobe_data_by_path[full_input_path] = ffprobe_data
+            timings["ffprobe"] = time.time() - start_time
+
+        start_time = time.time()
+        burnin_module.burnins_from_data(
+            script_data["input"],
+            script_data["output"],
+            script_data["burnin_data"],
+            codec_data=script_data.get("codec"),
+            options=script_data.get("options"),
+            burnin_values=script_data.get("values"),
+            full_input_path=full_input_path,
+            first_frame=script_data.get("first_frame"),
+            source_ffmpeg_cmd=script_data.get("ffmpeg_cmd"),
+            ffprobe_data=ffprobe_data,
+            logger=self.log
+        )
+        timings["render"] = time.time() - start_time
+
+    def _render_burnin_in_subprocess(self, executable_args, script_data):
+        """Render burnin by running burnin script in AYON launcher process.
+
+        Args:
+            executable_args (list[str]): Arguments to run burnin script.
+            script_data (dict[str, Any]): Data for burnin script.
+        """
+
+        # Dump data to string
+        dumped_script_data = json.dumps(script_data)
+
+        # Store dumped json to temporary file
+        temporary_json_file = tempfile.NamedTemporaryFile(
+            mode="w", suffix=".json", delete=False
+        )
+        temporary_json_file.write(dumped_script_data)
+        temporary_json_file.close()
+        temporary_json_filepath = temporary_json_file.name.replace(
+            "\\", "/"
+        )
+
+        # Prepare subprocess arguments
+        args = list(executable_args)
+        args.append(temporary_json_filepath)
+        self.log.debug("Executing: {}".format(" ".join(args)))
+
+        # Run burnin script
+        process_kwargs = {
+            "logger": self.log
+        }
+
+        try:
+            run_ayon_launcher_process(*args, **process_kwargs)
+        finally:
+            # Remove the temporary json
+            os.remove(temporary_json_filepath)
+
     def _get_burnin_options(self):
         # Prepare burnin options
         burnin_options = copy.deepcopy(self.default_options)
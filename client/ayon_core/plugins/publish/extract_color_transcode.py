@@ -1,5 +1,8 @@
 import os
 import copy
+import collections
+from concurrent.futures import ThreadPoolExecutor
+
 import clique
 import pyblish.api
 
@@ -10,11 +13,12 @@ from ayon_core.lib import (
 )
 
 from ayon_core.lib.transcoding import (
-    convert_colorspace,
+    convert_colorspace_multiple_outputs,
+    get_oiio_info_for_inputs,
     get_transcode_temp_directory,
 )
 
-from ayon_core.lib.profiles_filtering import filter_profiles
+from ayon_core.lib.profiles_filtering import get_profile_matcher
 
 
 class ExtractOIIOTranscode(publish.Extractor):
@@ -63,6 +67,11 @@ class ExtractOIIOTranscode(publish.Extractor):
     # Configurable by Settings
     profiles = None
     options = None
+    # Number of oiiotool processes running at the same time
+    #   - number of CPU cores is used if not set
+    max_workers = 0
+    # Maximum number of frames converted by one oiiotool process
+    frames_per_worker = 50
 
     def process(self, instance):
         if not self.profiles:
@@ -82,6 +91,7 @@ class ExtractOIIOTranscode(publish.Extractor):
             return
 
         new_representations = []
+        conversion_jobs = []
         repres = instance.data["representations"]
         for idx, repre in enumerate(list(repres)):
             self.log.debug("repre ({}): `{}`".format(idx + 1, repre["name"]))
@@ -98,10 +108,10 @@ class ExtractOIIOTranscode(publish.Extractor):
                 self.log.warning("Config file doesn't exist, skipping")
                 continue
 
+            conversion_outputs = []
             for output_name, output_def in profile.get("outputs", {}).items():
                 new_repre = copy.deepcopy(repre)
 
-                original_staging_dir = new_repre["stagingDir"]
                 new_staging_dir = get_transcode_temp_directory()
                 new_repre["stagingDir"] = new_staging_dir
 
@@ -141,25 +151,16 @@ class ExtractOIIOTranscode(publish.Extractor):
                 additional_command_args = (output_def["oiiotool_args"]
                                            ["additional_command_args"])
 
-                files_to_convert = self._translate_to_sequence(
-                    files_to_convert)
-                for file_name in files_to_convert:
-                    input_path = os.path.join(original_staging_dir,
-                                              file_name)
-                    output_path = self._get_output_file_path(input_path,
-                                                             new_staging_dir,
-                                                             output_extension)
-                    convert_colorspace(
-                        input_path,
-                        output_path,
-                        config_path,
-                        source_colorspace,
-                        target_colorspace,
-                        view,
-                        display,
-                        additional_command_args,
-                        self.log
-                    )
+                # Conversions are processed after all outputs are prepared
+                #   so outputs can share read of source files
+                conversion_outputs.append({
+                    "output_dir": new_staging_dir,
+                    "output_extension": output_extension,
+                    "target_colorspace": target_colorspace,
+                    "view": view,
+                    "display": display,
+                    "additional_command_args": additional_command_args,
+                })
 
                 # cleanup temporary transcoded files
                 for file_name in new_repre["files"]:
@@ -199,10 +200,24 @@ class ExtractOIIOTranscode(publish.Extractor):
                 new_representations.append(new_repre)
                 added_representations = True
 
+            if conversion_outputs:
+                files_to_convert = repre["files"]
+                if not isinstance(files_to_convert, list):
+                    files_to_convert = [files_to_convert]
+                conversion_jobs.extend(self._prepare_conversion_jobs(
+                    repre["stagingDir"],
+                    files_to_convert,
+                    conversion_outputs,
+                    config_path,
+                    source_colorspace
+                ))
+
             if added_representations:
                 self._mark_original_repre_for_deletion(repre, profile,
                                                        added_review)
 
+        self._process_conversion_jobs(conversion_jobs)
+
         for repre in tuple(instance.data["representations"]):
             tags = repre.get("tags") or []
             if "delete" in tags and "thumbnail" not in tags:
@@ -264,38 +279,150 @@ class ExtractOIIOTranscode(publish.Extractor):
             renamed_files.append(file_name)
         new_repre["files"] = renamed_files
 
-    def _translate_to_sequence(self, files_to_convert):
-        """Returns original list or list with filename formatted in single
-        sequence format.
+    def _prepare_conversion_jobs(
+        self,
+        staging_dir,
+        files_to_convert,
+        conversion_outputs,
+        config_path,
+        source_colorspace
+    ):
+        """Prepare arguments for 'convert_colorspace_multiple_outputs'.
 
-        Uses clique to find frame sequence, in this case it merges all frames
-        into sequence format (FRAMESTART-FRAMEEND#) and returns it.
-        If sequence not found, it returns original list
+        Outputs with same additional oiiotool arguments are converted with
+        single read of source. Sequences are split into smaller frame
+        ranges so they can be converted in parallel.
+
+        Args:
+            staging_dir (str): Directory with source files.
+            files_to_convert (list[str]): Source file names.
+            conversion_outputs (list[dict[str, Any]]): Output definitions.
+            config_path (str): Path to OCIO config file.
+            source_colorspace (str): Colorspace of source files.
+
+        Returns:
+            list[tuple[str, tuple]]: Path to file which is probed for
+                information about input and arguments for conversion
+                function.
+        """
+        outputs_by_args = collections.OrderedDict()
+        for conversion_output in conversion_outputs:
+            key = tuple(conversion_output["additional_command_args"] or [])
+            outputs_by_args.setdefault(key, []).append(conversion_output)
+
+        jobs = []
+        for file_name, first_file_name in self._translate_to_sequence_chunks(
+            files_to_convert
+        ):
+            input_path = os.path.join(staging_dir, file_name)
+            probe_path = os.path.join(staging_dir, first_file_name)
+            for outputs in outputs_by_args.values():
+                output_definitions = []
+                for conversion_output in outputs:
+                    output_path = self._get_output_file_path(
+                        input_path,
+                        conversion_output["output_dir"],
+                        conversion_output["output_extension"]
+                    )
+                    output_definition = copy.copy(conversion_output)
+                    output_definition["output_path"] = output_path
+                    output_definitions.append(output_definition)
+
+                jobs.append((
+                    probe_path,
+                    (
+                        input_path,
+                        output_definitions,
+                        config_path,
+                        source_colorspace,
+                        self.log
+                    )
+                ))
+        return jobs
+
+    def _process_conversion_jobs(self, jobs):
+        """Run conversions using pool of workers.
+
+        Inputs of all conversions are probed at once, by oiiotool processing
+        multiple files, before conversions start.
+
+        Args:
+            jobs (list[tuple[str, tuple]]): Path to probed file and
+                arguments for 'convert_colorspace_multiple_outputs'.
+        """
+        max_workers = self.max_workers or os.cpu_count() or 1
+        input_infos = get_oiio_info_for_inputs(
+            [probe_path for probe_path, _ in jobs],
+            logger=self.log,
+            max_workers=max_workers
+        )
+        conversion_jobs = [
+            job_args + (input_infos[probe_path], )
+            for probe_path, job_args in jobs
+        ]
+        if max_workers < 2 or len(conversion_jobs) < 2:
+            for job_args in conversion_jobs:
+                convert_colorspace_multiple_outputs(*job_args)
+            return
+
+        self.log.debug("Running {} conversions with {} workers".format(
+            len(conversion_jobs), max_workers))
+        # Workers are only waiting for oiiotool subprocesses
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(convert_colorspace_multiple_outputs, *args)
+                for args in conversion_jobs
+            ]
+        # Re-raise first error of conversions
+        for future in futures:
+            future.result()
+
+    def _translate_to_sequence_chunks(self, files_to_convert):
+        """Split files to convert into frame ranges for workers.
+
+        Uses clique to find frame sequence and merges its frames into
+        sequence format (FRAMESTART-FRAMEEND#). Contiguous frame ranges
+        are split into chunks of maximum of 'frames_per_worker' frames.
+        If sequence not found, it returns original list.
 
         Args:
             files_to_convert (list): list of file names
         Returns:
-            (list) of [file.1001-1010#.exr] or [fileA.exr, fileB.exr]
+            (list) of tuples with chunk and name of its first file
+                [(file.1001-1050#.exr, file.1001.exr),
+                (file.1051-1060#.exr, file.1051.exr)]
+                or [(fileA.exr, fileA.exr), (fileB.exr, fileB.exr)]
         """
         pattern = [clique.PATTERNS["frames"]]
-        collections, remainder = clique.assemble(
+        src_collections, _ = clique.assemble(
             files_to_convert, patterns=pattern,
             assume_padded_when_ambiguous=True)
 
-        if collections:
-            if len(collections) > 1:
-                raise ValueError(
-                    "Too many collections {}".format(collections))
-
-            collection = collections[0]
-            frames = list(collection.indexes)
-            frame_str = "{}-{}#".format(frames[0], frames[-1])
-            file_name = "{}{}{}".format(collection.head, frame_str,
-                                        collection.tail)
-
-            files_to_convert = [file_name]
-
-        return files_to_convert
+        if not src_collections:
+            return [
+                (file_name, file_name)
+                for file_name in files_to_convert
+            ]
+
+        if len(src_collections) > 1:
+            raise ValueError(
+                "Too many collections {}".format(src_collections))
+
+        chunk_size = max(1, self.frames_per_worker)
+        output = []
+        for collection in src_collections[0].separate():
+            frames = sorted(collection.indexes)
+            file_template = collection.format("{head}{padding}{tail}")
+            for idx in range(0, len(frames), chunk_size):
+                chunk = frames[idx:idx + chunk_size]
+                frame_str = "{}-{}#".format(chunk[0], chunk[-1])
+                output.append((
+                    "{}{}{}".format(
+                        collection.head, frame_str, collection.tail
+                    ),
+                    file_template % chunk[0]
+                ))
+        return output
 
     def _get_output_file_path(self, input_path, output_dir,
                               output_extension):
@@ -323,8 +450,9 @@ class ExtractOIIOTranscode(publish.Extractor):
             "task_types": task_type,
             "subsets": subset
         }
-        profile = filter_profiles(self.profiles, filtering_criteria,
-                                  logger=self.log)
+        profile = get_profile_matcher(self.profiles).match(
+            filtering_criteria, logger=self.log
+        )
 
         if not profile:
             self.log.debug((
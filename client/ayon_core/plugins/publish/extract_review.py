@@ -5,6 +5,7 @@ import json
 import shutil
 import subprocess
 from abc import ABCMeta, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 
 import six
 import clique
@@ -12,14 +13,18 @@ import speedcopy
 import pyblish.api
 
 from ayon_core.lib import (
+    create_hard_link,
     get_ffmpeg_tool_args,
-    filter_profiles,
+    get_profile_matcher,
+    is_oiio_supported,
     path_to_subprocess_arg,
     run_subprocess,
 )
 from ayon_core.lib.transcoding import (
     IMAGE_EXTENSIONS,
     get_ffprobe_streams,
+    get_ffprobe_data_for_inputs,
+    get_oiio_info_for_inputs,
     should_convert_for_ffmpeg,
     get_review_layer_name,
     convert_input_paths_for_ffmpeg,
@@ -75,6 +80,11 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
     # Preset attributes
     profiles = []
+    # Render all output definitions with the same input by one ffmpeg
+    #   process which decodes the input only once
+    merge_output_definitions = True
+    # Number of representations processed at once
+    max_workers = 2
 
     def process(self, instance):
         self.log.debug(str(instance.data["representations"]))
@@ -108,8 +118,7 @@ class ExtractReview(pyblish.api.InstancePlugin):
         self.log.debug("Host: \"{}\"".format(host_name))
         self.log.debug("Family: \"{}\"".format(family))
 
-        profile = filter_profiles(
-            self.profiles,
+        profile = get_profile_matcher(self.profiles).match(
             {
                 "hosts": host_name,
                 "product_types": family,
@@ -227,88 +236,165 @@ class ExtractReview(pyblish.api.InstancePlugin):
             instance, profile_outputs
         )
 
-        for repre, output_defs in outputs_per_repres:
-            # Check if input should be preconverted before processing
-            # Store original staging dir (it's value may change)
-            src_repre_staging_dir = repre["stagingDir"]
-            # Receive filepath to first file in representation
-            first_input_path = None
-            input_filepaths = []
-            if not self.input_is_sequence(repre):
-                first_input_path = os.path.join(
-                    src_repre_staging_dir, repre["files"]
+        def process_repre(repre_item):
+            repre, output_defs = repre_item
+            return self._process_representation(instance, repre, output_defs)
+
+        max_workers = max(1, self.max_workers)
+        self._probe_first_input_paths(outputs_per_repres, max_workers)
+        if max_workers == 1 or len(outputs_per_repres) < 2:
+            new_repres_by_repre = [
+                process_repre(repre_item)
+                for repre_item in outputs_per_repres
+            ]
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                new_repres_by_repre = list(
+                    executor.map(process_repre, outputs_per_repres)
                 )
-                input_filepaths.append(first_input_path)
+
+        # Add new representations in order of source representations
+        for new_repres in new_repres_by_repre:
+            for new_repre in new_repres:
+                self.log.debug(
+                    "Adding new representation: {}".format(new_repre)
+                )
+                instance.data["representations"].append(new_repre)
+                add_repre_files_for_cleanup(instance, new_repre)
+
+    def _probe_first_input_paths(self, outputs_per_repres, max_workers):
+        """Probe first files of all representations at once.
+
+        Exr files are probed by oiiotool in batches and other files by
+        ffprobe running in parallel. Probe results are cached, so
+        processing of representations does not run the probes again.
+
+        Args:
+            outputs_per_repres (list[tuple[dict, list]]): Representations
+                with their output definitions.
+            max_workers (int): Max number of probes running at once.
+        """
+        exr_paths = []
+        other_paths = []
+        for repre, _ in outputs_per_repres:
+            files = repre["files"]
+            if self.input_is_sequence(repre):
+                if not files:
+                    continue
+                files = files[0]
+            filepath = os.path.join(repre["stagingDir"], files)
+            if os.path.splitext(filepath)[-1].lower() == ".exr":
+                exr_paths.append(filepath)
             else:
-                for filename in repre["files"]:
-                    filepath = os.path.join(
-                        src_repre_staging_dir, filename
-                    )
-                    input_filepaths.append(filepath)
-                    if first_input_path is None:
-                        first_input_path = filepath
+                other_paths.append(filepath)
 
-            filtered_output_defs = self._single_frame_filter(
-                input_filepaths, output_defs
+        # Failed probes are ignored, the files are probed again during
+        #   processing where the error is handled
+        try:
+            if len(exr_paths) > 1 and is_oiio_supported():
+                get_oiio_info_for_inputs(
+                    exr_paths, logger=self.log, max_workers=max_workers
+                )
+            if len(other_paths) > 1:
+                get_ffprobe_data_for_inputs(
+                    other_paths, logger=self.log, max_workers=max_workers
+                )
+        except Exception:
+            self.log.debug("Probe of input files failed.", exc_info=True)
+
+    def _process_representation(self, instance, repre, output_defs):
+        """Create review representations from source representation.
+
+        Args:
+            instance (pyblish.api.Instance): Processed instance.
+            repre (dict[str, Any]): Source representation.
+            output_defs (list[dict[str, Any]]): Output definitions.
+
+        Returns:
+            list[dict[str, Any]]: New representations.
+        """
+
+        # Check if input should be preconverted before processing
+        # Store original staging dir (it's value may change)
+        src_repre_staging_dir = repre["stagingDir"]
+        # Receive filepath to first file in representation
+        first_input_path = None
+        input_filepaths = []
+        if not self.input_is_sequence(repre):
+            first_input_path = os.path.join(
+                src_repre_staging_dir, repre["files"]
             )
-            if not filtered_output_defs:
-                self.log.debug((
-                    "Repre: {} - All output definitions were filtered"
-                    " out by single frame filter. Skipping"
-                ).format(repre["name"]))
-                continue
+            input_filepaths.append(first_input_path)
+        else:
+            for filename in repre["files"]:
+                filepath = os.path.join(
+                    src_repre_staging_dir, filename
+                )
+                input_filepaths.append(filepath)
+                if first_input_path is None:
+                    first_input_path = filepath
 
-            # Skip if file is not set
-            if first_input_path is None:
-                self.log.warning((
-                    "Representation \"{}\" have empty files. Skipped."
-                ).format(repre["name"]))
-                continue
+        filtered_output_defs = self._single_frame_filter(
+            input_filepaths, output_defs
+        )
+        if not filtered_output_defs:
+            self.log.debug((
+                "Repre: {} - All output definitions were filtered"
+                " out by single frame filter. Skipping"
+            ).format(repre["name"]))
+            return []
 
-            # Determine if representation requires pre conversion for ffmpeg
-            do_convert = should_convert_for_ffmpeg(first_input_path)
-            # If result is None the requirement of conversion can't be
-            #   determined
-            if do_convert is None:
-                self.log.info((
-                    "Can't determine if representation requires conversion."
-                    " Skipped."
-                ))
-                continue
+        # Skip if file is not set
+        if first_input_path is None:
+            self.log.warning((
+                "Representation \"{}\" have empty files. Skipped."
+            ).format(repre["name"]))
+            return []
 
-            layer_name = get_review_layer_name(first_input_path)
+        # Determine if representation requires pre conversion for ffmpeg
+        do_convert = should_convert_for_ffmpeg(first_input_path)
+        # If result is None the requirement of conversion can't be
+        #   determined
+        if do_convert is None:
+            self.log.info((
+                "Can't determine if representation requires conversion."
+                " Skipped."
+            ))
+            return []
 
-            # Do conversion if needed
-            #   - change staging dir of source representation
-            #   - must be set back after output definitions processing
-            if do_convert:
-                new_staging_dir = get_transcode_temp_directory()
-                repre["stagingDir"] = new_staging_dir
+        layer_name = get_review_layer_name(first_input_path)
 
-                convert_input_paths_for_ffmpeg(
-                    input_filepaths,
-                    new_staging_dir,
-                    self.log
-                )
+        # Do conversion if needed
+        #   - change staging dir of source representation
+        #   - must be set back after output definitions processing
+        if do_convert:
+            new_staging_dir = get_transcode_temp_directory()
+            repre["stagingDir"] = new_staging_dir
 
-            try:
-                self._render_output_definitions(
-                    instance,
-                    repre,
-                    src_repre_staging_dir,
-                    filtered_output_defs,
-                    layer_name
-                )
+            convert_input_paths_for_ffmpeg(
+                input_filepaths,
+                new_staging_dir,
+                self.log
+            )
 
-            finally:
-                # Make sure temporary staging is cleaned up and representation
-                #   has set origin stagingDir
-                if do_convert:
-                    # Set staging dir of source representation back to previous
-                    #   value
-                    repre["stagingDir"] = src_repre_staging_dir
-                    if os.path.exists(new_staging_dir):
-                        shutil.rmtree(new_staging_dir)
+        try:
+            return self._render_output_definitions(
+                instance,
+                repre,
+                src_repre_staging_dir,
+                filtered_output_defs,
+                layer_name
+            )
+
+        finally:
+            # Make sure temporary staging is cleaned up and representation
+            #   has set origin stagingDir
+            if do_convert:
+                # Set staging dir of source representation back to previous
+                #   value
+                repre["stagingDir"] = src_repre_staging_dir
+                if os.path.exists(new_staging_dir):
+                    shutil.rmtree(new_staging_dir)
 
     def _render_output_definitions(
         self,
@@ -319,137 +405,201 @@ class ExtractReview(pyblish.api.InstancePlugin):
         layer_name
     ):
         fill_data = copy.deepcopy(instance.data["anatomyData"])
-        for _output_def in output_definitions:
-            output_def = copy.deepcopy(_output_def)
-            # Make sure output definition has "tags" key
-            if "tags" not in output_def:
-                output_def["tags"] = []
-
-            if "burnins" not in output_def:
-                output_def["burnins"] = []
-
-            # Create copy of representation
-            new_repre = copy.deepcopy(repre)
-            new_tags = new_repre.get("tags") or []
-            # Make sure new representation has origin staging dir
-            #   - this is because source representation may change
-            #       it's staging dir because of ffmpeg conversion
-            new_repre["stagingDir"] = src_repre_staging_dir
-
-            # Remove "delete" tag from new repre if there is
-            if "delete" in new_tags:
-                new_tags.remove("delete")
-
-            if "need_thumbnail" in new_tags:
-                new_tags.remove("need_thumbnail")
-
-            # Add additional tags from output definition to representation
-            for tag in output_def["tags"]:
-                if tag not in new_tags:
-                    new_tags.append(tag)
-
-            # Return tags to new representation
-            new_repre["tags"] = new_tags
-
-            # Add burnin link from output definition to representation
-            for burnin in output_def["burnins"]:
-                if burnin not in new_repre.get("burnins", []):
-                    if not new_repre.get("burnins"):
-                        new_repre["burnins"] = []
-                    new_repre["burnins"].append(str(burnin))
-
-            self.log.debug(
-                "Linked burnins: `{}`".format(new_repre.get("burnins"))
-            )
-
-            self.log.debug(
-                "New representation tags: `{}`".format(
-                    new_repre.get("tags"))
-            )
+        # Output definitions prepared for rendering
+        #   - each item contains new representation, input arguments and
+        #       output arguments (including filters) of ffmpeg
+        render_items = []
+        files_to_clean = None
+        try:
+            for _output_def in output_definitions:
+                output_def = copy.deepcopy(_output_def)
+                # Make sure output definition has "tags" key
+                if "tags" not in output_def:
+                    output_def["tags"] = []
+
+                if "burnins" not in output_def:
+                    output_def["burnins"] = []
+
+                # Create copy of representation
+                new_repre = copy.deepcopy(repre)
+                new_tags = new_repre.get("tags") or []
+                # Make sure new representation has origin staging dir
+                #   - this is because source representation may change
+                #       it's staging dir because of ffmpeg conversion
+                new_repre["stagingDir"] = src_repre_staging_dir
+
+                # Remove "delete" tag from new repre if there is
+                if "delete" in new_tags:
+                    new_tags.remove("delete")
+
+                if "need_thumbnail" in new_tags:
+                    new_tags.remove("need_thumbnail")
+
+                # Add additional tags from output definition to representation
+                for tag in output_def["tags"]:
+                    if tag not in new_tags:
+                        new_tags.append(tag)
+
+                # Return tags to new representation
+                new_repre["tags"] = new_tags
+
+                # Add burnin link from output definition to representation
+                for burnin in output_def["burnins"]:
+                    if burnin not in new_repre.get("burnins", []):
+                        if not new_repre.get("burnins"):
+                            new_repre["burnins"] = []
+                        new_repre["burnins"].append(str(burnin))
+
+                self.log.debug(
+                    "Linked burnins: `{}`".format(new_repre.get("burnins"))
+                )
 
-            temp_data = self.prepare_temp_data(instance, repre, output_def)
-            files_to_clean = []
-            if temp_data["input_is_sequence"]:
-                self.log.debug("Checking sequence to fill gaps in sequence..")
-                files_to_clean = self.fill_sequence_gaps(
-                    files=temp_data["origin_repre"]["files"],
-                    staging_dir=new_repre["stagingDir"],
-                    start_frame=temp_data["frame_start"],
-                    end_frame=temp_data["frame_end"]
+                self.log.debug(
+                    "New representation tags: `{}`".format(
+                        new_repre.get("tags"))
                 )
 
-            # create or update outputName
-            output_name = new_repre.get("outputName", "")
-            output_ext = new_repre["ext"]
-            if output_name:
-                output_name += "_"
-            output_name += output_def["filename_suffix"]
-            if temp_data["without_handles"]:
-                output_name += "_noHandles"
-
-            # add outputName to anatomy format fill_data
-            fill_data.update({
-                "output": output_name,
-                "ext": output_ext
-            })
-
-            try:  # temporary until oiiotool is supported cross platform
-                ffmpeg_args = self._ffmpeg_arguments(
-                    output_def,
-                    instance,
-                    new_repre,
-                    temp_data,
-                    fill_data,
-                    layer_name,
+                temp_data = self.prepare_temp_data(
+                    instance, repre, output_def
                 )
-            except ZeroDivisionError:
-                # TODO recalculate width and height using OIIO before
-                #   conversion
-                if 'exr' in temp_data["origin_repre"]["ext"]:
-                    self.log.warning(
-                        (
-                            "Unsupported compression on input files."
-                            " Skipping!!!"
-                        ),
-                        exc_info=True
+                # Gaps are filled only once for all output definitions
+                #   - frame range of gaps does not depend on output definition
+                if files_to_clean is None:
+                    files_to_clean = []
+                    if temp_data["input_is_sequence"]:
+                        self.log.debug(
+                            "Checking sequence to fill gaps in sequence.."
+                        )
+                        files_to_clean = self.fill_sequence_gaps(
+                            files=temp_data["origin_repre"]["files"],
+                            staging_dir=new_repre["stagingDir"],
+                            start_frame=temp_data["frame_start"],
+                            end_frame=temp_data["frame_end"]
+                        )
+
+                # create or update outputName
+                output_name = new_repre.get("outputName", "")
+                output_ext = new_repre["ext"]
+                if output_name:
+                    output_name += "_"
+                output_name += output_def["filename_suffix"]
+                if temp_data["without_handles"]:
+                    output_name += "_noHandles"
+
+                # add outputName to anatomy format fill_data
+                fill_data.update({
+                    "output": output_name,
+                    "ext": output_ext
+                })
+
+                try:  # temporary until oiiotool is supported cross platform
+                    ffmpeg_args_parts = self._ffmpeg_arguments_parts(
+                        output_def,
+                        instance,
+                        new_repre,
+                        temp_data,
+                        fill_data,
+                        layer_name,
                     )
-                    return
-                raise NotImplementedError
-
-            subprcs_cmd = " ".join(ffmpeg_args)
-
-            # run subprocess
-            self.log.debug("Executing: {}".format(subprcs_cmd))
-
-            run_subprocess(subprcs_cmd, shell=True, logger=self.log)
+                except ZeroDivisionError:
+                    # TODO recalculate width and height using OIIO before
+                    #   conversion
+                    if 'exr' in temp_data["origin_repre"]["ext"]:
+                        self.log.warning(
+                            (
+                                "Unsupported compression on input files."
+                                " Skipping!!!"
+                            ),
+                            exc_info=True
+                        )
+                        break
+                    raise NotImplementedError
 
+                input_args, output_args = ffmpeg_args_parts
+                subprcs_cmd = " ".join(
+                    self._ffmpeg_tool_args() + input_args + output_args
+                )
+                new_repre.update({
+                    "fps": temp_data["fps"],
+                    "name": "{}_{}".format(output_name, output_ext),
+                    "outputName": output_name,
+                    "outputDef": output_def,
+                    "frameStartFtrack": temp_data["output_frame_start"],
+                    "frameEndFtrack": temp_data["output_frame_end"],
+                    # Command creating only this output
+                    # - used by other plugins to define codec arguments
+                    "ffmpeg_cmd": subprcs_cmd
+                })
+
+                # Force to pop these key if are in new repre
+                new_repre.pop("thumbnail", None)
+                if "clean_name" in new_repre.get("tags", []):
+                    new_repre.pop("outputName")
+
+                render_items.append((new_repre, input_args, output_args))
+
+            for render_group in self._group_render_items(render_items):
+                input_args = render_group[0][1]
+                all_args = self._ffmpeg_tool_args() + input_args
+                for _, _, output_args in render_group:
+                    all_args.extend(output_args)
+
+                subprcs_cmd = " ".join(all_args)
+
+                # run subprocess
+                self.log.debug("Executing: {}".format(subprcs_cmd))
+
+                run_subprocess(subprcs_cmd, shell=True, logger=self.log)
+
+        finally:
             # delete files added to fill gaps
             if files_to_clean:
                 for f in files_to_clean:
                     os.unlink(f)
 
-            new_repre.update({
-                "fps": temp_data["fps"],
-                "name": "{}_{}".format(output_name, output_ext),
-                "outputName": output_name,
-                "outputDef": output_def,
-                "frameStartFtrack": temp_data["output_frame_start"],
-                "frameEndFtrack": temp_data["output_frame_end"],
-                "ffmpeg_cmd": subprcs_cmd
-            })
-
-            # Force to pop these key if are in new repre
-            new_repre.pop("thumbnail", None)
-            if "clean_name" in new_repre.get("tags", []):
-                new_repre.pop("outputName")
-
-            # adding representation
-            self.log.debug(
-                "Adding new representation: {}".format(new_repre)
-            )
-            instance.data["representations"].append(new_repre)
+        return [render_item[0] for render_item in render_items]
+
+    def _group_render_items(self, render_items):
+        """Group output definitions which can be rendered by one process.
+
+        Output definitions with the same input arguments are rendered by one
+        ffmpeg process with multiple outputs, each with its own filters
+        and output arguments. The input is decoded only once.
+
+        Outputs using '-filter_complex' can't be merged as the argument
+        is global for whole ffmpeg process.
+
+        Args:
+            render_items (list[tuple[dict, list[str], list[str]]]): New
+                representation with input and output arguments.
+
+        Returns:
+            list[list[tuple[dict, list[str], list[str]]]]: Render items
+                grouped by process.
+        """
 
-            add_repre_files_for_cleanup(instance, new_repre)
+        if not self.merge_output_definitions:
+            return [[render_item] for render_item in render_items]
+
+        groups = []
+        groups_by_input = {}
+        for render_item in render_items:
+            _, input_args, output_args = render_item
+            if any(
+                arg.startswith("-filter_complex")
+                for arg in input_args + output_args
+            ):
+                groups.append([render_item])
+                continue
+
+            key = tuple(input_args)
+            group = groups_by_input.get(key)
+            if group is None:
+                group = []
+                groups_by_input[key] = group
+                groups.append(group)
+            group.append(render_item)
+        return groups
 
     def input_is_sequence(self, repre):
         """Deduce from representation data if input is sequence."""
@@ -582,6 +732,35 @@ class ExtractReview(pyblish.api.InstancePlugin):
             temp_data (dict): Base data for successful process.
         """
 
+        input_args, output_args = self._ffmpeg_arguments_parts(
+            output_def,
+            instance,
+            new_repre,
+            temp_data,
+            fill_data,
+            layer_name
+        )
+        return self._ffmpeg_tool_args() + input_args + output_args
+
+    def _ffmpeg_arguments_parts(
+        self,
+        output_def,
+        instance,
+        new_repre,
+        temp_data,
+        fill_data,
+        layer_name
+    ):
+        """Prepares ffmpeg input and output arguments of output definition.
+
+        Output arguments contain filters of the output and output filepath,
+        so they can be combined with output arguments of other output
+        definitions using the same input arguments.
+
+        Returns:
+            tuple[list[str], list[str]]: Input and output arguments.
+        """
+
         # Get FFmpeg arguments from profile presets
         out_def_ffmpeg_args = output_def.get("ffmpeg_args") or {}
 
@@ -759,12 +938,12 @@ class ExtractReview(pyblish.api.InstancePlugin):
             path_to_subprocess_arg(temp_data["full_output_path"])
         )
 
-        return self.ffmpeg_full_args(
-            ffmpeg_input_args,
+        output_args = self._ffmpeg_output_args(
             ffmpeg_video_filters,
             ffmpeg_audio_filters,
             ffmpeg_output_args
         )
+        return ffmpeg_input_args, output_args
 
     def split_ffmpeg_args(self, in_args):
         """Makes sure all entered arguments are separated in individual items.
@@ -807,6 +986,29 @@ class ExtractReview(pyblish.api.InstancePlugin):
         Returns:
             list: Containing all arguments ready to run in subprocess.
         """
+
+        return (
+            self._ffmpeg_tool_args()
+            + input_args
+            + self._ffmpeg_output_args(
+                video_filters, audio_filters, output_args
+            )
+        )
+
+    def _ffmpeg_tool_args(self):
+        return [
+            subprocess.list2cmdline(get_ffmpeg_tool_args("ffmpeg"))
+        ]
+
+    def _ffmpeg_output_args(self, video_filters, audio_filters, output_args):
+        """Output arguments with video and audio filters of one output.
+
+        Filters found in output arguments are moved to list they belong to.
+
+        Returns:
+            list[str]: Filters and output arguments with output filepath.
+        """
+
         output_args = self.split_ffmpeg_args(output_args)
 
         video_args_dentifiers = ["-vf", "-filter:v"]
@@ -824,10 +1026,7 @@ class ExtractReview(pyblish.api.InstancePlugin):
                     arg = arg.replace(identifier, "").strip()
                     audio_filters.append(arg)
 
-        all_args = [
-            subprocess.list2cmdline(get_ffmpeg_tool_args("ffmpeg"))
-        ]
-        all_args.extend(input_args)
+        all_args = []
         if video_filters:
             all_args.append("-filter:v")
             all_args.append("\"{}\"".format(",".join(video_filters)))
@@ -844,9 +1043,9 @@ class ExtractReview(pyblish.api.InstancePlugin):
         # type: (list, str, int, int) -> list
         """Fill missing files in sequence by duplicating existing ones.
 
-        This will take nearest frame file and copy it with so as to fill
-        gaps in sequence. Last existing file there is is used to for the
-        hole ahead.
+        This will take nearest frame file and hardlink it (or copy it when
+        hardlink can't be created) so as to fill gaps in sequence. Last
+        existing file there is is used to for the hole ahead.
 
         Args:
             files (list): List of representation files.
@@ -890,7 +1089,10 @@ class ExtractReview(pyblish.api.InstancePlugin):
                 raise KnownPublishError(
                     "Missing previously detected file: {}".format(src_fpath))
 
-            speedcopy.copyfile(src_fpath, hole_fpath)
+            try:
+                create_hard_link(src_fpath, hole_fpath)
+            except OSError:
+                speedcopy.copyfile(src_fpath, hole_fpath)
             added_files.append(hole_fpath)
 
         return added_files
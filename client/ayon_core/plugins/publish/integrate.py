@@ -3,6 +3,7 @@ import logging
 import sys
 import copy
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 import clique
 import six
@@ -19,18 +20,15 @@ from ayon_core.client.operations import (
     prepare_representation_update_data,
 )
 
-from ayon_core.client import (
-    get_representations,
-    get_subset_by_name,
-    get_version_by_name,
-)
-from ayon_core.lib import source_hash
+from ayon_core.lib import source_hash_from_stat, format_file_size
 from ayon_core.lib.file_transaction import (
     FileTransaction,
     DuplicateDestinationError
 )
 from ayon_core.pipeline.publish import (
     KnownPublishError,
+    PublishEntitiesIndex,
+    PublishOperations,
     get_publish_template_name,
 )
 
@@ -153,6 +151,26 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         "family", "hierarchy", "username", "user", "output"
     ]
 
+    # File transfer options (can be modified using settings)
+    # - number of threads used to transfer files
+    transfer_max_workers = 1
+    # - skip files which already exist in destination with same size and
+    #   modification time (or checksum) e.g. to resume failed integration
+    skip_existing_files = False
+    # - 'hashlib' algorithm name used to compare existing files
+    transfer_checksum_algorithm = ""
+    # - 'hashlib' or 'xxhash' algorithm name used to calculate checksum of
+    #   published files content while they're copied, the checksum is stored
+    #   next to file hash which stays based on modification time and size
+    file_checksum_algorithm = ""
+    # Database operations of all instances are committed together by
+    #   'CommitPublishOperations' plugin instead of per instance
+    # - version number is not reserved in database before files are
+    #   transferred when enabled
+    publish_wide_commit = False
+    # - maximum number of operations sent to server in one request
+    max_operations_per_request = 500
+
     def process(self, instance):
 
         # Instance should be integrated on a farm
@@ -176,11 +194,24 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             ).format(instance.data["family"]))
             return
 
-        file_transactions = FileTransaction(log=self.log,
-                                            # Enforce unique transfers
-                                            allow_queue_replacements=False)
+        file_transactions = FileTransaction(
+            log=self.log,
+            # Enforce unique transfers
+            allow_queue_replacements=False,
+            max_workers=self.transfer_max_workers,
+            skip_existing=self.skip_existing_files,
+            checksum_algorithm=self.transfer_checksum_algorithm or None,
+            progress_callback=self._log_transfer_progress,
+            file_checksum_algorithm=self.file_checksum_algorithm or None
+        )
+        publish_operations = self.get_publish_operations(instance.context)
         try:
-            self.register(instance, file_transactions, filtered_repres)
+            self.register(
+                instance,
+                file_transactions,
+                filtered_repres,
+                publish_operations
+            )
         except DuplicateDestinationError as exc:
             # Raise DuplicateDestinationError as KnownPublishError
             # and rollback the transactions
@@ -195,10 +226,25 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             self.log.critical("Error when registering", exc_info=True)
             six.reraise(*sys.exc_info())
 
+        # Transactions are finalized after operations are committed
+        if publish_operations is not None:
+            return
+
         # Finalizing can't rollback safely so no use for moving it to
         # the try, except.
         file_transactions.finalize()
 
+    def _log_transfer_progress(self, progress):
+        self.log.debug(
+            "Transferred {}/{} files ({} / {}): {}".format(
+                progress.transferred_files,
+                progress.total_files,
+                format_file_size(progress.transferred_bytes),
+                format_file_size(progress.total_bytes),
+                progress.last_path
+            )
+        )
+
     def filter_representations(self, instance):
         # Prepare repsentations that should be integrated
         repres = instance.data.get("representations")
@@ -227,7 +273,35 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
 
         return filtered_repres
 
-    def register(self, instance, file_transactions, filtered_repres):
+    def get_publish_operations(self, context):
+        """Publish-wide operations where instance operations are added.
+
+        Args:
+            context (pyblish.api.Context): Publish context.
+
+        Returns:
+            Union[PublishOperations, None]: Publish operations or None if
+                operations should be committed per instance.
+        """
+
+        if not self.publish_wide_commit:
+            return None
+
+        publish_operations = context.data.get("publishOperations")
+        if publish_operations is None:
+            publish_operations = PublishOperations(
+                self.max_operations_per_request
+            )
+            context.data["publishOperations"] = publish_operations
+        return publish_operations
+
+    def register(
+        self,
+        instance,
+        file_transactions,
+        filtered_repres,
+        publish_operations=None
+    ):
         project_name = instance.context.data["projectName"]
 
         instance_stagingdir = instance.data.get("stagingDir")
@@ -245,12 +319,13 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
 
         template_name = self.get_template_name(instance)
 
+        entities_index = self.get_entities_index(instance.context)
         op_session = OperationsSession()
         subset = self.prepare_subset(
-            instance, op_session, project_name
+            instance, op_session, project_name, entities_index
         )
         version = self.prepare_version(
-            instance, op_session, subset, project_name
+            instance, op_session, subset, project_name, entities_index
         )
         instance.data["versionEntity"] = version
 
@@ -259,10 +334,8 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         # Get existing representations (if any)
         existing_repres_by_name = {
             repre_doc["name"].lower(): repre_doc
-            for repre_doc in get_representations(
-                project_name,
-                version_ids=[version["_id"]],
-                fields=["_id", "name"]
+            for repre_doc in entities_index.get_representations(
+                version["_id"]
             )
         }
 
@@ -306,11 +379,20 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         # Transaction to reduce the chances of another publish trying to
         # publish to the same version number since that chance can greatly
         # increase if the file transaction takes a long time.
-        op_session.commit()
-
-        self.log.info("Subset '{subset[name]}' version {version[name]} "
-                      "written to database..".format(subset=subset,
-                                                     version=version))
+        # - publish-wide operations are committed after all instances are
+        #   integrated
+        if publish_operations is None:
+            op_session.commit()
+
+            self.log.info("Subset '{subset[name]}' version {version[name]} "
+                          "written to database..".format(subset=subset,
+                                                         version=version))
+        else:
+            self.log.info((
+                "Subset '{subset[name]}' version {version[name]} will be"
+                " written to database after all instances are integrated."
+                " Version number is not reserved until then."
+            ).format(subset=subset, version=version))
 
         # Process all file transfers of all integrations now
         self.log.debug("Integrating source files to destination ...")
@@ -319,6 +401,10 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             "Backed up existing files: {}".format(file_transactions.backups))
         self.log.debug(
             "Transferred files: {}".format(file_transactions.transferred))
+        if file_transactions.skipped:
+            self.log.debug(
+                "Skipped already existing files: {}".format(
+                    file_transactions.skipped))
         self.log.debug("Retrieving Representation Site Sync information ...")
 
         # Get the accessible sites for Site Sync
@@ -338,9 +424,12 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         # Compute the resource file infos once (files belonging to the
         # version instance instead of an individual representation) so
         # we can re-use those file infos per representation
-        resource_file_infos = self.get_files_info(resource_destinations,
-                                                  sites=sites,
-                                                  anatomy=anatomy)
+        resource_file_infos = self.get_files_info(
+            resource_destinations,
+            sites=sites,
+            anatomy=anatomy,
+            file_transactions=file_transactions
+        )
 
         # Finalize the representations now the published files are integrated
         # Get 'files' info for representations and its attached resources
@@ -351,7 +440,10 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             transfers = prepared["transfers"]
             destinations = [dst for src, dst in transfers]
             repre_doc["files"] = self.get_files_info(
-                destinations, sites=sites, anatomy=anatomy
+                destinations,
+                sites=sites,
+                anatomy=anatomy,
+                file_transactions=file_transactions
             )
 
             # Add the version resource file infos to each representation
@@ -386,7 +478,32 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
                     )
 
         self.log.debug("{}".format(op_session.to_data()))
-        op_session.commit()
+        if publish_operations is None:
+            op_session.commit()
+        else:
+            publish_operations.add(instance, op_session, file_transactions)
+
+        # Store new state of entities for other instances integrating
+        #   the same subset
+        repre_docs = [
+            prepared["representation"]
+            for prepared in prepared_representations
+        ]
+        if instance.data.get("append", False):
+            repre_docs.extend(
+                repre_doc
+                for name, repre_doc in existing_repres_by_name.items()
+                if name not in new_repre_names_low
+            )
+        entities_index.set_subset(
+            instance.data["assetEntity"]["_id"],
+            instance.data["subset"],
+            subset
+        )
+        entities_index.set_version(
+            subset["_id"], instance.data["version"], version
+        )
+        entities_index.set_representations(version["_id"], repre_docs)
 
         # Backwards compatibility used in hero integration.
         # todo: can we avoid the need to store this?
@@ -402,15 +519,42 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             )
         )
 
-    def prepare_subset(self, instance, op_session, project_name):
+    def get_entities_index(self, context):
+        """Index of existing entities shared across instances.
+
+        Index is usually prefetched for all instances by
+        'PrefetchIntegrateEntities' plugin, it is created here if is not
+        available in context data.
+
+        Args:
+            context (pyblish.api.Context): Publish context.
+
+        Returns:
+            PublishEntitiesIndex: Index of existing entities.
+        """
+
+        entities_index = context.data.get("publishEntitiesIndex")
+        if entities_index is None:
+            entities_index = PublishEntitiesIndex(
+                context.data["projectName"]
+            )
+            context.data["publishEntitiesIndex"] = entities_index
+        return entities_index
+
+    def prepare_subset(
+        self, instance, op_session, project_name, entities_index=None
+    ):
         asset_doc = instance.data["assetEntity"]
         subset_name = instance.data["subset"]
         family = instance.data["family"]
         self.log.debug("Subset: {}".format(subset_name))
 
+        if entities_index is None:
+            entities_index = self.get_entities_index(instance.context)
+
         # Get existing subset if it exists
-        existing_subset_doc = get_subset_by_name(
-            project_name, subset_name, asset_doc["_id"]
+        existing_subset_doc = entities_index.get_subset(
+            asset_doc["_id"], subset_name
         )
 
         # Define subset data
@@ -459,14 +603,21 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         self.log.debug("Prepared subset: {}".format(subset_name))
         return subset_doc
 
-    def prepare_version(self, instance, op_session, subset_doc, project_name):
+    def prepare_version(
+        self,
+        instance,
+        op_session,
+        subset_doc,
+        project_name,
+        entities_index=None
+    ):
         version_number = instance.data["version"]
 
-        existing_version = get_version_by_name(
-            project_name,
-            version_number,
-            subset_doc["_id"],
-            fields=["_id"]
+        if entities_index is None:
+            entities_index = self.get_entities_index(instance.context)
+
+        existing_version = entities_index.get_version(
+            subset_doc["_id"], version_number
         )
         version_id = None
         if existing_version:
@@ -735,16 +886,16 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             )
 
             # Construct destination collection from template
+            # - template is compiled so only the index is filled per file
+            index_key = "udim" if is_udim else "frame"
+            compiled_template = path_template_obj.compile_strict(
+                template_data, index_key
+            )
+            template_data[index_key] = destination_indexes[-1]
             repre_context = None
             dst_filepaths = []
             for index in destination_indexes:
-                if is_udim:
-                    template_data["udim"] = index
-                else:
-                    template_data["frame"] = index
-                template_filled = path_template_obj.format_strict(
-                    template_data
-                )
+                template_filled = compiled_template.format(index)
                 dst_filepaths.append(template_filled)
                 if repre_context is None:
                     self.log.debug(
@@ -955,25 +1106,101 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             ).format(path))
         return path
 
-    def get_files_info(self, destinations, sites, anatomy):
+    def get_files_info(
+        self, destinations, sites, anatomy, file_transactions=None
+    ):
         """Prepare 'files' info portion for representations.
 
         Arguments:
             destinations (list): List of transferred file destinations
             sites (list): array of published locations
             anatomy: anatomy part from instance
+            file_transactions (Optional[FileTransaction]): Transaction which
+                transferred the files, used to get file stats captured
+                during transfer.
         Returns:
             output_resources: array of dictionaries to be added to 'files' key
             in representation
         """
 
+        destinations = list(destinations)
+        # Resolve rootless paths of all files at once
+        rootless_paths = anatomy.rootless_paths(destinations)
+        files_stats = self._get_files_stats(destinations, file_transactions)
         file_infos = []
-        for file_path in destinations:
-            file_info = self.prepare_file_info(file_path, anatomy, sites=sites)
+        for file_path, rootless_path, file_stats in zip(
+            destinations, rootless_paths, files_stats
+        ):
+            file_info = self.prepare_file_info(
+                file_path,
+                anatomy,
+                sites=sites,
+                rootless_path=rootless_path,
+                file_stats=file_stats
+            )
             file_infos.append(file_info)
         return file_infos
 
-    def prepare_file_info(self, path, anatomy, sites):
+    def _get_files_stats(self, paths, file_transactions=None):
+        """Size, modification time and checksum of files.
+
+        Stats captured by file transaction are used, remaining files are
+        checked in multiple threads.
+
+        Args:
+            paths (list[str]): File paths.
+            file_transactions (Optional[FileTransaction]): Transaction which
+                transferred the files.
+
+        Returns:
+            list[dict[str, Any]]: File stats in order of paths.
+        """
+
+        files_stats = [None] * len(paths)
+        if file_transactions is not None:
+            files_stats = [
+                file_transactions.get_file_info(path)
+                for path in paths
+            ]
+
+        missing_idxs = [
+            idx
+            for idx, file_stats in enumerate(files_stats)
+            if file_stats is None
+        ]
+        if not missing_idxs:
+            return files_stats
+
+        missing_paths = [paths[idx] for idx in missing_idxs]
+        if self.transfer_max_workers < 2 or len(missing_paths) < 2:
+            missing_stats = [
+                self._get_file_stats(path)
+                for path in missing_paths
+            ]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=self.transfer_max_workers
+            ) as executor:
+                missing_stats = list(
+                    executor.map(self._get_file_stats, missing_paths)
+                )
+
+        for idx, file_stats in zip(missing_idxs, missing_stats):
+            files_stats[idx] = file_stats
+        return files_stats
+
+    def _get_file_stats(self, path):
+        stat = os.stat(path)
+        return {
+            "size": stat.st_size,
+            "mtime": stat.st_mtime,
+            "checksum": None,
+            "checksum_algorithm": None,
+        }
+
+    def prepare_file_info(
+        self, path, anatomy, sites, rootless_path=None, file_stats=None
+    ):
         """ Prepare information for one file (asset or resource)
 
         Arguments:
@@ -982,18 +1209,37 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             sites: array of published locations,
                 [ {'name':'studio', 'created_dt':date} by default
                 keys expected ['studio', 'site1', 'gdrive1']
+            rootless_path (Optional[str]): Already resolved rootless path.
+            file_stats (Optional[dict[str, Any]]): Already known size,
+                modification time and checksum of the file.
 
         Returns:
             dict: file info dictionary
         """
 
-        return {
+        if rootless_path is None:
+            rootless_path = self.get_rootless_path(anatomy, path)
+
+        if file_stats is None:
+            file_stats = self._get_file_stats(path)
+
+        file_info = {
             "_id": ObjectId(),
-            "path": self.get_rootless_path(anatomy, path),
-            "size": os.path.getsize(path),
-            "hash": source_hash(path),
+            "path": rootless_path,
+            "size": file_stats["size"],
+            "hash": source_hash_from_stat(
+                path, file_stats["mtime"], file_stats["size"]
+            ),
             "sites": sites
         }
+        # Store checksum of content if it was calculated, the hash is kept
+        #   so files can be still found by hash
+        if file_stats.get("checksum"):
+            file_info["checksum"] = file_stats["checksum"]
+            file_info["checksum_algorithm"] = (
+                file_stats["checksum_algorithm"]
+            )
+        return file_info
 
     def _validate_path_in_project_roots(self, anatomy, file_path):
         """Checks if 'file_path' starts with any of the roots.
@@ -0,0 +1,49 @@
+import pyblish.api
+
+from ayon_core.pipeline.load import invalidate_version_index
+from ayon_core.pipeline.publish import (
+    KnownPublishError,
+    PublishOperationsError,
+)
+
+
+class CommitPublishOperations(pyblish.api.InstancePlugin):
+    """Commit database operations of all integrated instances.
+
+    'IntegrateAsset' adds operations of each instance to 'publishOperations'
+    in context data. They're committed at once when first instance is
+    processed so each instance does not require its own server requests.
+    Failed commit is reported on instances which operations failed.
+    """
+
+    label = "Commit Publish Operations"
+    order = pyblish.api.IntegratorOrder + 0.005
+
+    def process(self, instance):
+        context = instance.context
+        publish_operations = context.data.get("publishOperations")
+        try:
+            if publish_operations:
+                self._commit_operations(publish_operations)
+        finally:
+            # Published versions change last versions of products
+            invalidate_version_index(context.data["projectName"])
+
+        error = instance.data.get("publishOperationsError")
+        if error:
+            raise KnownPublishError(error)
+
+    def _commit_operations(self, publish_operations):
+        self.log.debug(
+            "Committing operations of {} instances.".format(
+                len(publish_operations)
+            )
+        )
+        try:
+            publish_operations.commit(self.log)
+
+        except PublishOperationsError as exc:
+            for instance, message in exc.errors:
+                instance.data.pop("versionEntity", None)
+                instance.data.pop("published_representations", None)
+                instance.data["publishOperationsError"] = message
@@ -19,9 +19,11 @@ from ayon_core.client.operations import (
     prepare_representation_update_data,
 )
 from ayon_core.lib import create_hard_link
+from ayon_core.lib.file_transaction import FileTransaction
 from ayon_core.pipeline import (
     schema
 )
+from ayon_core.pipeline.load import invalidate_version_index
 from ayon_core.pipeline.publish import get_publish_template_name
 
 
@@ -55,6 +57,10 @@ class IntegrateHeroVersion(pyblish.api.InstancePlugin):
 
     _default_template_name = "hero"
 
+    # Number of threads used to transfer files, files are transferred
+    #   using 'FileTransaction' if is higher than '1'
+    transfer_max_workers = 1
+
     def process(self, instance):
         self.log.debug(
             "--- Integration of Hero version for subset `{}` begins.".format(
@@ -367,21 +373,43 @@ class IntegrateHeroVersion(pyblish.api.InstancePlugin):
                             (src_file, dst_file)
                         )
 
+                # Resolve rootless paths of all files at once
+                rootless_paths = self._get_rootless_paths(
+                    anatomy,
+                    [
+                        file_path
+                        for item in src_to_dst_file_paths
+                        for file_path in item
+                    ]
+                )
+                paths_by_src_name = {}
+                for idx, (src_file, dst_file) in enumerate(
+                    src_to_dst_file_paths
+                ):
+                    src_file_name = os.path.basename(src_file)
+                    paths_by_src_name.setdefault(src_file_name, []).append((
+                        dst_file,
+                        rootless_paths[idx * 2],
+                        rootless_paths[(idx * 2) + 1]
+                    ))
+
                 # replace original file name with hero name in repre doc
                 for index in range(len(repre.get("files"))):
                     file = repre.get("files")[index]
                     file_name = os.path.basename(file.get('path'))
-                    for src_file, dst_file in src_to_dst_file_paths:
-                        src_file_name = os.path.basename(src_file)
-                        if src_file_name == file_name:
-                            repre["files"][index]["path"] = self._update_path(
-                                anatomy, repre["files"][index]["path"],
-                                src_file, dst_file)
-
-                            repre["files"][index]["hash"] = self._update_hash(
-                                repre["files"][index]["hash"],
-                                src_file_name, dst_file
+                    for dst_file, rtls_src, rootless in (
+                        paths_by_src_name.get(file_name, [])
+                    ):
+                        repre["files"][index]["path"] = (
+                            repre["files"][index]["path"].replace(
+                                rtls_src, rootless
                             )
+                        )
+
+                        repre["files"][index]["hash"] = self._update_hash(
+                            repre["files"][index]["hash"],
+                            file_name, dst_file
+                        )
 
                 schema.validate(repre)
 
@@ -450,11 +478,9 @@ class IntegrateHeroVersion(pyblish.api.InstancePlugin):
             # Copy(hardlink) paths of source and destination files
             # TODO should we *only* create hardlinks?
             # TODO should we keep files for deletion until this is successful?
-            for src_path, dst_path in src_to_dst_file_paths:
-                self.copy_file(src_path, dst_path)
-
-            for src_path, dst_path in other_file_paths_mapping:
-                self.copy_file(src_path, dst_path)
+            self.copy_files(
+                src_to_dst_file_paths + other_file_paths_mapping
+            )
 
             # Archive not replaced old representations
             for repre_name_low, repre in old_repres_to_delete.items():
@@ -480,6 +506,8 @@ class IntegrateHeroVersion(pyblish.api.InstancePlugin):
                                              repre)
 
             op_session.commit()
+            # Cached hero version is outdated
+            invalidate_version_index(project_name)
 
             # Remove backuped previous hero
             if (
@@ -580,6 +608,35 @@ class IntegrateHeroVersion(pyblish.api.InstancePlugin):
             family = instance.data["families"][0]
         return family
 
+    def copy_files(self, src_to_dst_file_paths):
+        """Copy(hardlink) files to hero destinations.
+
+        Args:
+            src_to_dst_file_paths (list[tuple[str, str]]): Source and
+                destination paths.
+        """
+
+        if self.transfer_max_workers < 2:
+            for src_path, dst_path in src_to_dst_file_paths:
+                self.copy_file(src_path, dst_path)
+            return
+
+        # Hero publish dir is moved to backup folder before files are
+        #   transferred so rollback is handled by the backup folder
+        file_transactions = FileTransaction(
+            log=self.log,
+            allow_queue_replacements=True,
+            max_workers=self.transfer_max_workers
+        )
+        for src_path, dst_path in src_to_dst_file_paths:
+            file_transactions.add(
+                src_path,
+                dst_path,
+                mode=FileTransaction.MODE_HARDLINK_OR_COPY
+            )
+        file_transactions.process()
+        file_transactions.finalize()
+
     def copy_file(self, src_path, dst_path):
         # TODO check drives if are the same to check if cas hardlink
         dirname = os.path.dirname(dst_path)
@@ -633,22 +690,20 @@ class IntegrateHeroVersion(pyblish.api.InstancePlugin):
         ))
         return (hero_version, hero_repres)
 
-    def _update_path(self, anatomy, path, src_file, dst_file):
-        """
-            Replaces source path with new hero path
+    def _get_rootless_paths(self, anatomy, paths):
+        """Rootless paths, path is kept unchanged if it's not in any root.
 
-            'path' contains original path with version, must be replaced with
-            'hero' path (with 'hero' label and without version)
+        Args:
+            anatomy (Anatomy) - to get rootless style of paths
+            paths (list[str]) - file paths
 
-            Args:
-                anatomy (Anatomy) - to get rootless style of path
-                path (string) - path from DB
-                src_file (string) - original file path
-                dst_file (string) - hero file path
+        Returns:
+            list[str]: Rootless paths in order of input paths.
         """
-        _, rootless = anatomy.find_root_template_from_path(dst_file)
-        _, rtls_src = anatomy.find_root_template_from_path(src_file)
-        return path.replace(rtls_src, rootless)
+        return [
+            path if rootless is None else rootless
+            for path, rootless in zip(paths, anatomy.rootless_paths(paths))
+        ]
 
     def _update_hash(self, hash, src_file_name, dst_file):
         """
@@ -0,0 +1,52 @@
+import pyblish.api
+
+from ayon_core.pipeline.publish import PublishEntitiesIndex
+
+
+class PrefetchIntegrateEntities(pyblish.api.ContextPlugin):
+    """Query existing entities of all integrated instances at once.
+
+    Integration of each instance needs to know existing subset, version and
+    representations. Entities of all instances are queried in bulk and
+    stored to 'publishEntitiesIndex' in context data, which is used by
+    'IntegrateAsset' plugin.
+    """
+
+    label = "Prefetch Integrate Entities"
+    order = pyblish.api.IntegratorOrder - 0.01
+
+    def process(self, context):
+        keys = set()
+        for instance in context:
+            # Skip inactive instances
+            if not instance.data.get("publish", True):
+                continue
+
+            if (
+                instance.data.get("farm")
+                or not instance.data.get("integrate", True)
+            ):
+                continue
+
+            asset_doc = instance.data.get("assetEntity")
+            subset_name = instance.data.get("subset")
+            if not asset_doc or not subset_name:
+                continue
+
+            keys.add((
+                asset_doc["_id"], subset_name, instance.data.get("version")
+            ))
+
+        if not keys:
+            self.log.debug("No instances to prefetch entities for.")
+            return
+
+        entities_index = context.data.get("publishEntitiesIndex")
+        if entities_index is None:
+            entities_index = PublishEntitiesIndex(context.data["projectName"])
+            context.data["publishEntitiesIndex"] = entities_index
+
+        entities_index.prefetch(keys)
+        self.log.debug(
+            "Prefetched entities for {} subsets.".format(len(keys))
+        )
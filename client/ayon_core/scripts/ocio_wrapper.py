@@ -17,13 +17,44 @@ Providing functionality:
 - _get_views_data - python 3 - module function
                  - returning all available viewers
                    found in input config path.
+- worker - console command - python 2
+         - long running process answering requests from stdin
+           so a new process is not started for each query.
 """
 
+import os
+import sys
 import click
 import json
 from pathlib import Path
 import PyOpenColorIO as ocio
 
+# Prefix of response lines written to stdout by worker
+WORKER_RESPONSE_PREFIX = "AYON_OCIO_WORKER_RESPONSE:"
+
+# Loaded configs by config path with modification time of the file
+_CONFIGS_CACHE = {}
+
+
+def _get_config(config_path):
+    """Load OCIO config from file with cache.
+
+    Config is loaded again if modification time of the file changed.
+
+    Args:
+        config_path (Path): Path to config file.
+
+    Returns:
+        ocio.Config: Loaded config.
+    """
+    config_path = str(config_path)
+    mtime = os.path.getmtime(config_path)
+    cached = _CONFIGS_CACHE.get(config_path)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, ocio.Config.CreateFromFile(config_path))
+        _CONFIGS_CACHE[config_path] = cached
+    return cached[1]
+
 
 @click.group()
 def main():
@@ -104,7 +135,7 @@ def _get_colorspace_data(config_path):
         raise IOError(
             f"Input path `{config_path}` should be `config.ocio` file")
 
-    config = ocio.Config().CreateFromFile(str(config_path))
+    config = _get_config(config_path)
 
     colorspace_data = {
         "roles": {},
@@ -201,7 +232,7 @@ def _get_views_data(config_path):
     if not config_path.is_file():
         raise IOError("Input path should be `config.ocio` file")
 
-    config = ocio.Config().CreateFromFile(str(config_path))
+    config = _get_config(config_path)
 
     data_ = {}
     for display in config.getDisplays():
@@ -274,7 +305,7 @@ def _get_version_data(config_path):
     if not config_path.is_file():
         raise IOError("Input path should be `config.ocio` file")
 
-    config = ocio.Config().CreateFromFile(str(config_path))
+    config = _get_config(config_path)
 
     return {
         "major": config.getMajorVersion(),
@@ -347,7 +378,7 @@ def _get_config_file_rules_colorspace_from_filepath(config_path, filepath):
         raise IOError(
             f"Input path `{config_path}` should be `config.ocio` file")
 
-    config = ocio.Config().CreateFromFile(str(config_path))
+    config = _get_config(config_path)
 
     # TODO: use `parseColorSpaceFromString` instead if ocio v1
     colorspace = config.getColorSpaceFromFilepath(str(filepath))
@@ -376,7 +407,7 @@ def _get_display_view_colorspace_name(config_path, display, view):
     if not config_path.is_file():
         raise IOError("Input path should be `config.ocio` file")
 
-    config = ocio.Config.CreateFromFile(str(config_path))
+    config = _get_config(config_path)
     colorspace = config.getDisplayViewColorSpaceName(display, view)
 
     return colorspace
@@ -429,5 +460,124 @@ def get_display_view_colorspace_name(in_path, out_path,
 
     print(f"Display view colorspace saved to '{out_path}'")
 
+
+def _get_config_file_rules_colorspaces_from_filepaths(config_path, filepaths):
+    """Return colorspaces found in v2 file rules for multiple files.
+
+    Args:
+        config_path (str): path string leading to config.ocio
+        filepaths (list[str]): file paths tested against v2 file rules
+
+    Raises:
+        IOError: Input config does not exist.
+
+    Returns:
+        list[str]: colorspace names in order of passed file paths
+    """
+    config_path = Path(config_path)
+
+    if not config_path.is_file():
+        raise IOError(
+            f"Input path `{config_path}` should be `config.ocio` file")
+
+    config = _get_config(config_path)
+
+    return [
+        config.getColorSpaceFromFilepath(str(filepath))
+        for filepath in filepaths
+    ]
+
+
+# Functions available in worker by command group and command name
+#   - arguments are same as arguments of console commands without 'out_path'
+_WORKER_COMMANDS = {
+    ("config", "get_colorspace"): (
+        lambda in_path: _get_colorspace_data(in_path)
+    ),
+    ("config", "get_views"): (
+        lambda in_path: _get_views_data(in_path)
+    ),
+    ("config", "get_version"): (
+        lambda config_path: _get_version_data(config_path)
+    ),
+    ("config", "get_display_view_colorspace_name"): (
+        lambda in_path, display, view: _get_display_view_colorspace_name(
+            in_path, display, view
+        )
+    ),
+    ("colorspace", "get_config_file_rules_colorspace_from_filepath"): (
+        lambda config_path, filepath: [
+            _get_config_file_rules_colorspace_from_filepath(
+                config_path, filepath
+            )
+        ]
+    ),
+    ("colorspace", "get_config_file_rules_colorspaces_from_filepaths"): (
+        lambda config_path, filepaths: (
+            _get_config_file_rules_colorspaces_from_filepaths(
+                config_path, filepaths
+            )
+        )
+    ),
+}
+
+
+def _process_worker_request(request):
+    """Process single request sent to worker.
+
+    Args:
+        request (dict[str, Any]): Request data with 'id', 'command_group',
+            'command' and 'kwargs' keys.
+
+    Returns:
+        dict[str, Any]: Response with 'id' and 'result' or 'error'.
+    """
+    response = {"id": request.get("id")}
+    key = (request.get("command_group"), request.get("command"))
+    func = _WORKER_COMMANDS.get(key)
+    if func is None:
+        response["error"] = f"Unknown command '{key[0]} {key[1]}'"
+        return response
+
+    try:
+        response["result"] = func(**(request.get("kwargs") or {}))
+    except Exception as exc:
+        response["error"] = f"{exc.__class__.__name__}: {exc}"
+    return response
+
+
+@main.command(
+    name="worker",
+    help=(
+        "run worker processing json requests from stdin "
+        "and writing responses to stdout"
+    )
+)
+def worker():
+    """Process requests from stdin until the stream is closed.
+
+    Each line on stdin is a json request and a response line prefixed
+    with 'WORKER_RESPONSE_PREFIX' is written to stdout for each of them.
+    Loaded configs are cached for whole life of the process.
+
+    Example of use:
+    > pyton.exe ./ocio_wrapper.py worker
+    """
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            request = json.loads(line)
+        except ValueError as exc:
+            response = {"id": None, "error": f"Invalid request: {exc}"}
+        else:
+            response = _process_worker_request(request)
+        sys.stdout.write(
+            WORKER_RESPONSE_PREFIX + json.dumps(response) + "\n"
+        )
+        sys.stdout.flush()
+
+
 if __name__ == '__main__':
     main()
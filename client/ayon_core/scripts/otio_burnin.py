@@ -35,6 +35,27 @@ TIMECODE_KEY = "{timecode}"
 SOURCE_TIMECODE_KEY = "{source_timecode}"
 
 
+def _get_subprocess_creationflags():
+    """Creation flags of subprocess which should not show console window."""
+    return (
+        subprocess.CREATE_NEW_PROCESS_GROUP
+        | getattr(subprocess, "DETACHED_PROCESS", 0)
+        | getattr(subprocess, "CREATE_NO_WINDOW", 0)
+    )
+
+
+def _print_message(message, logger=None):
+    """Print message or log it using logger if is passed.
+
+    Burnin script run as process prints messages to stdout, logger is
+    used when burnins are rendered in publish process.
+    """
+    if logger is None:
+        print(message)
+    else:
+        logger.debug(message)
+
+
 def _get_ffprobe_data(source):
     """Reimplemented from otio burnins to be able use full path to ffprobe
     :param str source: source media file
@@ -52,11 +73,7 @@ def _get_ffprobe_data(source):
         "stdout": subprocess.PIPE,
     }
     if platform.system().lower() == "windows":
-        kwargs["creationflags"] = (
-            subprocess.CREATE_NEW_PROCESS_GROUP
-            | getattr(subprocess, "DETACHED_PROCESS", 0)
-            | getattr(subprocess, "CREATE_NO_WINDOW", 0)
-        )
+        kwargs["creationflags"] = _get_subprocess_creationflags()
     proc = subprocess.Popen(command, **kwargs)
     out = proc.communicate()[0]
     if proc.returncode != 0:
@@ -116,7 +133,12 @@ class ModifiedBurnins(ffmpeg_burnins.Burnins):
     }
 
     def __init__(
-        self, source, ffprobe_data=None, options_init=None, first_frame=None
+        self,
+        source,
+        ffprobe_data=None,
+        options_init=None,
+        first_frame=None,
+        logger=None
     ):
         if not ffprobe_data:
             ffprobe_data = _get_ffprobe_data(source)
@@ -134,6 +156,7 @@ class ModifiedBurnins(ffmpeg_burnins.Burnins):
         self.first_frame = first_frame
         self.input_args = []
         self.cleanup_paths = []
+        self.logger = logger
 
         super().__init__(source, source_streams)
 
@@ -437,7 +460,9 @@ class ModifiedBurnins(ffmpeg_burnins.Burnins):
                 temp.write(filter_string)
                 filters_path = temp.name
             filters = '-filter_script:v "{}"'.format(filters_path)
-            print("Filters:", filter_string)
+            _print_message(
+                "Filters: {}".format(filter_string), self.logger
+            )
             self.cleanup_paths.append(filters_path)
 
         if self.first_frame is not None:
@@ -480,22 +505,32 @@ class ModifiedBurnins(ffmpeg_burnins.Burnins):
             args=args,
             overwrite=overwrite
         )
-        print("Launching command: {}".format(command))
+        _print_message(
+            "Launching command: {}".format(command), self.logger
+        )
 
         kwargs = {
             "stdout": subprocess.PIPE,
             "stderr": subprocess.PIPE,
             "shell": True,
         }
+        if platform.system().lower() == "windows":
+            kwargs["creationflags"] = _get_subprocess_creationflags()
         proc = subprocess.Popen(command, **kwargs)
 
         _stdout, _stderr = proc.communicate()
         if _stdout:
-            print(_stdout.decode("utf-8", errors="backslashreplace"))
+            _print_message(
+                _stdout.decode("utf-8", errors="backslashreplace"),
+                self.logger
+            )
 
         # This will probably never happen as ffmpeg use stdout
         if _stderr:
-            print(_stderr.decode("utf-8", errors="backslashreplace"))
+            _print_message(
+                _stderr.decode("utf-8", errors="backslashreplace"),
+                self.logger
+            )
 
         if proc.returncode != 0:
             raise RuntimeError(
@@ -581,7 +616,8 @@ def prepare_fill_values(burnin_template, data):
 def burnins_from_data(
     input_path, output_path, data,
     codec_data=None, options=None, burnin_values=None, overwrite=True,
-    full_input_path=None, first_frame=None, source_ffmpeg_cmd=None
+    full_input_path=None, first_frame=None, source_ffmpeg_cmd=None,
+    ffprobe_data=None, logger=None
 ):
     """This method adds burnins to video/image file based on presets setting.
 
@@ -597,6 +633,10 @@ def burnins_from_data(
         burnin_values (dict): Contain positioned values.
         overwrite (bool): Output will be overwritten if already exists,
             True by default.
+        ffprobe_data (dict): Ffprobe data of full input path. Ffprobe is
+            executed if not passed.
+        logger (logging.Logger): Logger used for output messages, messages
+            are printed to stdout if not passed.
 
     Presets must be set separately. Should be dict with 2 keys:
     - "options" - sets look of burnins - colors, opacity,...
@@ -640,11 +680,12 @@ def burnins_from_data(
         "shot": "sh0010"
     }
     """
-    ffprobe_data = None
-    if full_input_path:
+    if full_input_path and not ffprobe_data:
         ffprobe_data = _get_ffprobe_data(full_input_path)
 
-    burnin = ModifiedBurnins(input_path, ffprobe_data, options, first_frame)
+    burnin = ModifiedBurnins(
+        input_path, ffprobe_data, options, first_frame, logger
+    )
 
     frame_start = data.get("frame_start")
     frame_end = data.get("frame_end")
@@ -724,16 +765,19 @@ def burnins_from_data(
         # Replace with missing key value if frame_start_tc is not set
         if frame_start_tc is None and has_timecode:
             has_timecode = False
-            print(
+            _print_message(
                 "`frame_start` and `frame_start_tc`"
-                " are not set in entered data."
+                " are not set in entered data.",
+                logger
             )
             value = value.replace(TIMECODE_KEY, MISSING_KEY_VALUE)
 
         has_source_timecode = SOURCE_TIMECODE_KEY in value
         if source_timecode is None and has_source_timecode:
             has_source_timecode = False
-            print("Source does not have set timecode value.")
+            _print_message(
+                "Source does not have set timecode value.", logger
+            )
             value = value.replace(SOURCE_TIMECODE_KEY, MISSING_KEY_VALUE)
 
         # Failsafe for missing keys.
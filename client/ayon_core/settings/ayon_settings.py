@@ -18,6 +18,7 @@ import collections
 import json
 import copy
 import time
+import hashlib
 
 import six
 
@@ -796,11 +797,37 @@ def convert_project_settings(ayon_settings, default_settings):
     return output
 
 
+def _copy_settings_value(value):
+    """Copy settings value.
+
+    Faster alternative of 'copy.deepcopy' for json serializable data.
+
+    Args:
+        value (Any): Value to copy.
+
+    Returns:
+        Any: Copied value.
+    """
+    if isinstance(value, dict):
+        return {
+            key: _copy_settings_value(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_copy_settings_value(item) for item in value]
+    if value is None or isinstance(
+        value, (six.string_types, bool, int, float)
+    ):
+        return value
+    return copy.deepcopy(value)
+
+
 class CacheItem:
     lifetime = 10
 
     def __init__(self, value, outdate_time=None):
         self._value = value
+        self._value_hash = None
         if outdate_time is None:
             outdate_time = time.time() + self.lifetime
         self._outdate_time = outdate_time
@@ -812,10 +839,30 @@ class CacheItem:
     def get_value(self):
         return copy.deepcopy(self._value)
 
+    def get_value_without_copy(self):
+        """Cached value without copy, must not be modified."""
+        return self._value
+
     def update_value(self, value):
         self._value = value
+        self._value_hash = None
         self._outdate_time = time.time() + self.lifetime
 
+    @property
+    def value_hash(self):
+        """Hash of the value, it is recalculated only when value changes.
+
+        Returns:
+            str: Hash of json serialized value.
+        """
+        if self._value_hash is None:
+            self._value_hash = hashlib.md5(
+                json.dumps(
+                    self._value, sort_keys=True, default=str
+                ).encode("utf-8")
+            ).hexdigest()
+        return self._value_hash
+
     @property
     def is_outdated(self):
         return time.time() > self._outdate_time
@@ -828,6 +875,11 @@ class _AyonSettingsCache:
     studio_settings = CacheItem.create_outdated()
     cache_by_project_name = collections.defaultdict(
         CacheItem.create_outdated)
+    # Converted project settings by project name with key of raw settings
+    #   used for the conversion
+    converted_by_project_name = {}
+    converted_hits = 0
+    converted_misses = 0
 
     @classmethod
     def _use_bundles(cls):
@@ -865,6 +917,58 @@ class _AyonSettingsCache:
 
     @classmethod
     def get_value_by_project(cls, project_name):
+        cache_item = cls._get_cache_item_by_project(project_name)
+        return cache_item.get_value()
+
+    @classmethod
+    def get_converted_project_settings(cls, project_name, default_values):
+        """Converted project settings memoized by raw settings.
+
+        Conversion is done only if raw settings changed, otherwise copy of
+        previous conversion result is returned.
+
+        Args:
+            project_name (str): Project name.
+            default_values (dict[str, Any]): Default project settings.
+
+        Returns:
+            dict[str, Any]: Converted project settings.
+        """
+        cache_item = cls._get_cache_item_by_project(project_name)
+        bundle_name = None
+        if cls._use_bundles():
+            bundle_name = cls._get_bundle_name()
+        key = (
+            bundle_name,
+            cls._get_variant(),
+            project_name,
+            cache_item.value_hash
+        )
+        cached = cls.converted_by_project_name.get(project_name)
+        if cached is not None and cached[0] == key:
+            _AyonSettingsCache.converted_hits += 1
+            converted = cached[1]
+        else:
+            _AyonSettingsCache.converted_misses += 1
+            converted = convert_project_settings(
+                cache_item.get_value(), default_values
+            )
+            cls.converted_by_project_name[project_name] = (key, converted)
+        return _copy_settings_value(converted)
+
+    @classmethod
+    def get_cache_info(cls):
+        hits = cls.converted_hits
+        misses = cls.converted_misses
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": float(hits) / total if total else 0.0,
+        }
+
+    @classmethod
+    def _get_cache_item_by_project(cls, project_name):
         cache_item = _AyonSettingsCache.cache_by_project_name[project_name]
         if cache_item.is_outdated:
             con = get_ayon_server_api_connection()
@@ -877,7 +981,7 @@ class _AyonSettingsCache:
             else:
                 value = con.get_addons_settings(project_name)
             cache_item.update_value(value)
-        return cache_item.get_value()
+        return cache_item
 
     @classmethod
     def _get_addon_versions_from_bundle(cls):
@@ -915,8 +1019,19 @@ class _AyonSettingsCache:
 
 
 def get_ayon_project_settings(default_values, project_name):
-    ayon_settings = _AyonSettingsCache.get_value_by_project(project_name)
-    return convert_project_settings(ayon_settings, default_values)
+    return _AyonSettingsCache.get_converted_project_settings(
+        project_name, default_values
+    )
+
+
+def get_ayon_project_settings_cache_info():
+    """Statistics of converted project settings cache.
+
+    Returns:
+        dict[str, Union[int, float]]: Number of 'hits' and 'misses' and
+            'hit_rate' of the cache.
+    """
+    return _AyonSettingsCache.get_cache_info()
 
 
 def get_ayon_system_settings(default_values):
@@ -68,11 +68,10 @@ def _get_default_settings():
     return load_openpype_default_settings()
 
 
-def get_default_settings():
-    """Get default settings.
+def _get_cached_default_settings():
+    """Get cached default settings without copy.
 
-    Todo:
-        Cache loaded defaults.
+    Returned value must not be modified.
 
     Returns:
         dict: Loaded default settings.
@@ -80,7 +79,16 @@ def get_default_settings():
     global _DEFAULT_SETTINGS
     if _DEFAULT_SETTINGS is None:
         _DEFAULT_SETTINGS = _get_default_settings()
-    return copy.deepcopy(_DEFAULT_SETTINGS)
+    return _DEFAULT_SETTINGS
+
+
+def get_default_settings():
+    """Get default settings.
+
+    Returns:
+        dict: Loaded default settings.
+    """
+    return copy.deepcopy(_get_cached_default_settings())
 
 
 def load_json_file(fpath):
@@ -265,5 +273,6 @@ def get_system_settings(*args, **kwargs):
 
 
 def get_project_settings(project_name, *args, **kwargs):
-    default_settings = get_default_settings()[PROJECT_SETTINGS_KEY]
+    # Default settings are copied during conversion
+    default_settings = _get_cached_default_settings()[PROJECT_SETTINGS_KEY]
     return get_ayon_project_settings(default_settings, project_name)
@@ -96,7 +96,12 @@ class BaseLauncherController(
         return self._selection_model.get_selected_folder_id()
 
     def set_selected_folder(self, folder_id):
+        if folder_id == self.get_selected_folder_id():
+            return
         self._selection_model.set_selected_folder(folder_id)
+        self._actions_model.prefetch_last_workfiles(
+            self.get_selected_project_name(), folder_id
+        )
 
     def get_selected_task_id(self):
         return self._selection_model.get_selected_task_id()
@@ -1,11 +1,21 @@
 import os
+import threading
 
 from ayon_core import resources
-from ayon_core.lib import Logger, AYONSettingsRegistry
+from ayon_core.client import get_project, get_asset_by_id
+from ayon_core.settings import get_system_settings
+from ayon_core.lib import Logger, AYONSettingsRegistry, get_ayon_username
+from ayon_core.pipeline import Anatomy, HOST_WORKFILE_EXTENSIONS
 from ayon_core.pipeline.actions import (
     discover_launcher_actions,
     LauncherAction,
 )
+from ayon_core.pipeline.template_data import get_template_data
+from ayon_core.pipeline.workfile import (
+    get_workfile_template_key,
+    get_workdir_with_workdir_data,
+    get_last_workfiles_with_version,
+)
 
 
 # class Action:
@@ -325,6 +335,116 @@ class ActionsModel:
             output.append(action_item)
         return output
 
+    def prefetch_last_workfiles(self, project_name, folder_id):
+        """Resolve last workfiles of folder tasks in background.
+
+        Last workfiles of all tasks of the folder for all host applications
+        of the project are resolved at once. Scanned work directories stay
+        cached, so last workfile lookup is fast when an application is
+        launched from the folder.
+
+        Args:
+            project_name (Union[str, None]): Project name.
+            folder_id (Union[str, None]): Folder id.
+        """
+
+        if not project_name or not folder_id:
+            return
+
+        project_entity = self._controller.get_project_entity(project_name)
+        if not project_entity:
+            return
+
+        app_names = set(project_entity["attrib"].get("applications") or [])
+        host_names = {
+            action.application.host_name
+            for action in self._get_action_objects().values()
+            if (
+                isinstance(action, ApplicationAction)
+                and action.application.is_host
+                and action.application.full_name in app_names
+            )
+        }
+        if not host_names:
+            return
+
+        project_settings = self._controller.get_project_settings(
+            project_name)
+        thread = threading.Thread(
+            target=self._prefetch_last_workfiles,
+            args=(project_name, folder_id, host_names, project_settings)
+        )
+        thread.daemon = True
+        thread.start()
+
+    def _prefetch_last_workfiles(
+        self, project_name, folder_id, host_names, project_settings
+    ):
+        try:
+            items = self._get_last_workfile_items(
+                project_name, folder_id, host_names, project_settings
+            )
+            if items:
+                get_last_workfiles_with_version(items)
+        except Exception:
+            self.log.debug("Prefetch of last workfiles failed.", exc_info=True)
+
+    def _get_last_workfile_items(
+        self, project_name, folder_id, host_names, project_settings
+    ):
+        project_doc = get_project(project_name)
+        asset_doc = get_asset_by_id(project_name, folder_id)
+        if not project_doc or not asset_doc:
+            return []
+
+        anatomy = Anatomy(project_name)
+        system_settings = get_system_settings()
+        username = get_ayon_username()
+        items = []
+        for task_name in asset_doc["data"].get("tasks") or {}:
+            for host_name in host_names:
+                extensions = HOST_WORKFILE_EXTENSIONS.get(host_name)
+                if not extensions:
+                    continue
+                try:
+                    fill_data = get_template_data(
+                        project_doc,
+                        asset_doc,
+                        task_name,
+                        host_name,
+                        system_settings
+                    )
+                    template_key = get_workfile_template_key(
+                        fill_data["task"]["type"],
+                        host_name,
+                        project_name,
+                        project_settings=project_settings
+                    )
+                    workdir = get_workdir_with_workdir_data(
+                        fill_data, project_name, anatomy, template_key
+                    )
+                    file_template = str(
+                        anatomy.templates[template_key]["file"]
+                    )
+                except Exception:
+                    self.log.debug(
+                        "Failed to prepare workdir of task '{}'.".format(
+                            task_name
+                        ),
+                        exc_info=True
+                    )
+                    continue
+
+                fill_data.update({
+                    "version": 1,
+                    "user": username,
+                    "ext": extensions[0]
+                })
+                items.append(
+                    (str(workdir), file_template, fill_data, extensions)
+                )
+        return items
+
     def set_application_force_not_open_workfile(
         self, project_name, folder_id, task_id, action_ids, enabled
     ):
@@ -9,18 +9,12 @@ from collections import defaultdict
 from qtpy import QtCore, QtGui
 import qtawesome
 
-from ayon_core.client import (
-    get_assets,
-    get_subsets,
-    get_versions,
-    get_last_version_by_subset_id,
-    get_representations,
-)
 from ayon_core.pipeline import (
     get_current_project_name,
     schema,
     HeroVersionType,
 )
+from ayon_core.pipeline.load import get_version_index
 from ayon_core.style import get_default_entity_icon_color
 from ayon_core.tools.utils.models import TreeModel, Item
 from ayon_core.tools.ayon_utils.widgets import get_qt_icon
@@ -306,6 +300,13 @@ class InventoryModel(TreeModel):
         )
         sites_info = self._controller.get_sites_information()
 
+        last_versions_by_subset_id = get_version_index().get_last_versions(
+            project_name,
+            {
+                group_dict["version"]["parent"]
+                for group_dict in grouped.values()
+            }
+        )
         for repre_id, group_dict in sorted(grouped.items()):
             group_containers = group_dict["containers"]
             representation = group_dict["representation"]
@@ -328,8 +329,8 @@ class InventoryModel(TreeModel):
 
             # Store the highest available version so the model can know
             # whether current version is currently up-to-date.
-            highest_version = get_last_version_by_subset_id(
-                project_name, version["parent"]
+            highest_version = last_versions_by_subset_id.get(
+                version["parent"]
             )
 
             # create the group header
@@ -404,26 +405,29 @@ class InventoryModel(TreeModel):
         if not filtered_repre_ids:
             return output
 
-        repre_docs = get_representations(project_name, repre_ids)
-        repres_by_id.update({
-            repre_doc["_id"]: repre_doc
-            for repre_doc in repre_docs
-        })
+        version_index = get_version_index()
+        repres_by_id.update(
+            version_index.get_representations(
+                project_name, filtered_repre_ids
+            )
+        )
         version_ids = {
             repre_doc["parent"] for repre_doc in repres_by_id.values()
         }
         if not version_ids:
             return output
 
-        version_docs = get_versions(project_name, version_ids, hero=True)
-        versions_by_id.update({
-            version_doc["_id"]: version_doc
-            for version_doc in version_docs
-        })
+        versions_by_id.update(
+            version_index.get_versions(project_name, version_ids)
+        )
         hero_versions_by_subversion_id = collections.defaultdict(list)
-        for version_doc in versions_by_id.values():
+        for version_id, version_doc in tuple(versions_by_id.items()):
             if version_doc["type"] != "hero_version":
                 continue
+            # Copy hero version because cached documents must not be
+            #   modified
+            version_doc = copy.copy(version_doc)
+            versions_by_id[version_id] = version_doc
             subversion = version_doc["version_id"]
             hero_versions_by_subversion_id[subversion].append(version_doc)
 
@@ -431,7 +435,9 @@ class InventoryModel(TreeModel):
             subversion_ids = set(
                 hero_versions_by_subversion_id.keys()
             )
-            subversion_docs = get_versions(project_name, subversion_ids)
+            subversion_docs = version_index.get_versions(
+                project_name, subversion_ids
+            ).values()
             for subversion_doc in subversion_docs:
                 subversion_id = subversion_doc["_id"]
                 subversion_ids.discard(subversion_id)
@@ -455,11 +461,9 @@ class InventoryModel(TreeModel):
         }
         if not product_ids:
             return output
-        product_docs = get_subsets(project_name, product_ids)
-        products_by_id.update({
-            product_doc["_id"]: product_doc
-            for product_doc in product_docs
-        })
+        products_by_id.update(
+            version_index.get_subsets(project_name, product_ids)
+        )
         folder_ids = {
             product_doc["parent"]
             for product_doc in products_by_id.values()
@@ -467,11 +471,9 @@ class InventoryModel(TreeModel):
         if not folder_ids:
             return output
 
-        folder_docs = get_assets(project_name, folder_ids)
-        folders_by_id.update({
-            folder_doc["_id"]: folder_doc
-            for folder_doc in folder_docs
-        })
+        folders_by_id.update(
+            version_index.get_assets(project_name, folder_ids)
+        )
         return output
 
 
@@ -2,6 +2,7 @@ from qtpy import QtWidgets, QtCore, QtGui
 import qtawesome
 
 from ayon_core import style, resources
+from ayon_core.pipeline.load import get_version_index
 from ayon_core.tools.utils.lib import (
     preserve_expanded_rows,
     preserve_selection,
@@ -105,7 +106,7 @@ class SceneInventoryWindow(QtWidgets.QDialog):
             self._on_hierarchy_view_change
         )
         view.data_changed.connect(self._on_refresh_request)
-        refresh_button.clicked.connect(self._on_refresh_request)
+        refresh_button.clicked.connect(self._on_refresh_clicked)
         update_all_button.clicked.connect(self._on_update_all)
 
         self._show_timer = show_timer
@@ -145,6 +146,13 @@ class SceneInventoryWindow(QtWidgets.QDialog):
 
         self.refresh()
 
+    def _on_refresh_clicked(self):
+        # Explicit refresh should show versions published in meantime
+        get_version_index().invalidate_last_versions(
+            self._controller.get_current_project_name()
+        )
+        self.refresh()
+
     def refresh(self, containers=None):
         self._first_refresh = False
         self._controller.reset()
@@ -280,6 +280,15 @@ class ExtractOIIOTranscodeProfileModel(BaseSettingsModel):
 
 class ExtractOIIOTranscodeModel(BaseSettingsModel):
     enabled: bool = SettingsField(True)
+    max_workers: int = SettingsField(
+        0,
+        title="Max workers",
+        description="Number of CPU cores is used if set to 0",
+        ge=0
+    )
+    frames_per_worker: int = SettingsField(
+        50, title="Frames per worker", ge=1
+    )
     profiles: list[ExtractOIIOTranscodeProfileModel] = SettingsField(
         default_factory=list, title="Profiles"
     )
@@ -460,6 +469,20 @@ class ExtractReviewProfileModel(BaseSettingsModel):
 class ExtractReviewModel(BaseSettingsModel):
     _isGroup = True
     enabled: bool = SettingsField(True)
+    merge_output_definitions: bool = SettingsField(
+        True,
+        title="Render outputs with one ffmpeg process",
+        description=(
+            "Output definitions with the same input are rendered by one"
+            " ffmpeg process so the input is decoded only once."
+        )
+    )
+    max_workers: int = SettingsField(
+        2,
+        title="Max workers",
+        description="Number of representations processed at once",
+        ge=1
+    )
     profiles: list[ExtractReviewProfileModel] = SettingsField(
         default_factory=list,
         title="Profiles"
@@ -557,6 +580,15 @@ class ExtractBurninProfile(BaseSettingsModel):
 class ExtractBurninModel(BaseSettingsModel):
     _isGroup = True
     enabled: bool = SettingsField(True)
+    in_process: bool = SettingsField(
+        True,
+        title="Render in publish process",
+        description=(
+            "Render burnins in publish process when burnin script can be"
+            " imported. Otherwise AYON launcher process is started"
+            " for each burnin."
+        )
+    )
     options: ExtractBurninOptionsModel = SettingsField(
         default_factory=ExtractBurninOptionsModel,
         title="Burnin formatting options"
@@ -702,12 +734,55 @@ class IntegrateHeroTemplateNameProfileModel(BaseSettingsModel):
     template_name: str = SettingsField("", title="Template name")
 
 
+class IntegrateAssetModel(BaseSettingsModel):
+    """Options of files transfer during integration.
+
+    Existing files can be skipped if they match the source file by size
+    and modification time, or by checksum if algorithm is filled
+    (e.g. 'sha256'). That allows to resume interrupted integration.
+
+    Checksum of published files content is calculated while the files are
+    copied if file checksum algorithm is filled (e.g. 'sha256' or 'xxh3_64'
+    if 'xxhash' module is available). It is stored in representation data
+    next to file hash, which is still used to find published files.
+    """
+    _isGroup = True
+    transfer_max_workers: int = SettingsField(
+        1, title="Transfer threads", ge=1, le=64
+    )
+    skip_existing_files: bool = SettingsField(
+        False, title="Skip existing files"
+    )
+    transfer_checksum_algorithm: str = SettingsField(
+        "", title="Checksum algorithm"
+    )
+    file_checksum_algorithm: str = SettingsField(
+        "", title="File checksum algorithm"
+    )
+    publish_wide_commit: bool = SettingsField(
+        False,
+        title="Commit all instances at once",
+        description=(
+            "Database operations of all instances are sent together"
+            " after all instances are integrated. Version numbers are not"
+            " reserved in database before files are transferred, so"
+            " concurrent publishes of the same product may collide."
+        )
+    )
+    max_operations_per_request: int = SettingsField(
+        500, title="Max operations per request", ge=1
+    )
+
+
 class IntegrateHeroVersionModel(BaseSettingsModel):
     _isGroup = True
     enabled: bool = SettingsField(True)
     optional: bool = SettingsField(False, title="Optional")
     active: bool = SettingsField(True, title="Active")
     families: list[str] = SettingsField(default_factory=list, title="Families")
+    transfer_max_workers: int = SettingsField(
+        1, title="Transfer threads", ge=1, le=64
+    )
 
 
 class CleanUpModel(BaseSettingsModel):
@@ -785,6 +860,10 @@ class PublishPuginsModel(BaseSettingsModel):
         default_factory=IntegrateProductGroupModel,
         title="Integrate Product Group"
     )
+    IntegrateAsset: IntegrateAssetModel = SettingsField(
+        default_factory=IntegrateAssetModel,
+        title="Integrate Asset"
+    )
     IntegrateHeroVersion: IntegrateHeroVersionModel = SettingsField(
         default_factory=IntegrateHeroVersionModel,
         title="Integrate Hero Version"
@@ -867,10 +946,14 @@ DEFAULT_PUBLISH_VALUES = {
     },
     "ExtractOIIOTranscode": {
         "enabled": True,
+        "max_workers": 0,
+        "frames_per_worker": 50,
         "profiles": []
     },
     "ExtractReview": {
         "enabled": True,
+        "merge_output_definitions": True,
+        "max_workers": 2,
         "profiles": [
             {
                 "product_types": [],
@@ -965,6 +1048,7 @@ DEFAULT_PUBLISH_VALUES = {
     },
     "ExtractBurnin": {
         "enabled": True,
+        "in_process": True,
         "options": {
             "font_size": 42,
             "font_color": [255, 255, 255, 1.0],
@@ -1044,10 +1128,19 @@ DEFAULT_PUBLISH_VALUES = {
             }
         ]
     },
+    "IntegrateAsset": {
+        "transfer_max_workers": 1,
+        "skip_existing_files": False,
+        "transfer_checksum_algorithm": "",
+        "file_checksum_algorithm": "",
+        "publish_wide_commit": False,
+        "max_operations_per_request": 500
+    },
     "IntegrateHeroVersion": {
         "enabled": True,
         "optional": True,
         "active": True,
+        "transfer_max_workers": 1,
         "families": [
             "model",
             "rig",
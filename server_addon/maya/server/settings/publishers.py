@@ -355,11 +355,57 @@ class ExtractLookArgsModel(BaseSettingsModel):
     )
 
 
+class ExtractLookTextureCacheModel(BaseSettingsModel):
+    enabled: bool = SettingsField(False, title="Enabled")
+    max_size_gb: float = SettingsField(
+        50.0,
+        title="Max local cache size (GB)",
+        description=(
+            "Least recently used textures are removed from local cache"
+            " when size is exceeded. Size is not limited if set to 0."
+        ),
+        ge=0
+    )
+    local_root: MultiplatformPathModel = SettingsField(
+        default_factory=MultiplatformPathModel,
+        title="Local cache root",
+        description=(
+            "Local cache directory. AYON local data directory is used"
+            " if not filled."
+        )
+    )
+    shared_root: MultiplatformPathModel = SettingsField(
+        default_factory=MultiplatformPathModel,
+        title="Shared cache root",
+        description=(
+            "Optional cache directory shared between machines."
+        )
+    )
+
+
 class ExtractLookModel(BaseSettingsModel):
+    max_workers: int = SettingsField(
+        0,
+        title="Max workers",
+        description=(
+            "Number of textures processed at once. Number of CPU cores"
+            " is used if set to 0"
+        ),
+        ge=0
+    )
     maketx_arguments: list[ExtractLookArgsModel] = SettingsField(
         default_factory=list,
         title="Extra arguments for maketx command line"
     )
+    texture_cache: ExtractLookTextureCacheModel = SettingsField(
+        default_factory=ExtractLookTextureCacheModel,
+        title="Converted textures cache",
+        description=(
+            "Textures converted with maketx or Redshift texture processor"
+            " are cached and reused when unchanged texture is published"
+            " with the same conversion arguments."
+        )
+    )
 
 
 class ExtractGPUCacheModel(BaseSettingsModel):
@@ -1344,7 +1390,22 @@ DEFAULT_PUBLISH_SETTINGS = {
         "ogsfx_path": "/maya2glTF/PBR/shaders/glTF_PBR.ogsfx"
     },
     "ExtractLook": {
-        "maketx_arguments": []
+        "max_workers": 0,
+        "maketx_arguments": [],
+        "texture_cache": {
+            "enabled": False,
+            "max_size_gb": 50.0,
+            "local_root": {
+                "windows": "",
+                "darwin": "",
+                "linux": ""
+            },
+            "shared_root": {
+                "windows": "",
+                "darwin": "",
+                "linux": ""
+            }
+        }
     },
     "ExtractGPUCache": {
         "enabled": False,